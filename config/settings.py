@@ -4,7 +4,7 @@
 import os
 import yaml
 from pathlib import Path
-from typing import Literal, Any, Dict, Tuple, Type
+from typing import Literal, Any, Dict, List, Tuple, Type
 from pydantic_settings import (
     BaseSettings, 
     SettingsConfigDict, 
@@ -58,24 +58,147 @@ class Settings(BaseSettings):
     # --- API Keys (Secrets - Prefer .env) ---
     OPENAI_API_KEY: str | None = None
     GOOGLE_API_KEY: str | None = None
+    ADMIN_API_TOKEN: str | None = None    # X-Admin-Token for /admin/* (admin API disabled when unset)
 
     # --- Database & Storage Paths ---
     # These can be overridden in config.yml, but defaults are calculated here
     SQL_DB_NAME: str = "vendor_master.db"
     VECTOR_STORE_DIR_NAME: str = "chroma_db"
+    DATA_DIR: str | None = None           # root of the writable sql/ + vector_store/ dirs (default: data/)
+
+    # --- Prebuilt Artifacts (see scripts/build_artifacts.py) ---
+    # A verified bundle (manifest.json + sql/ + vector_store/) replaces startup ingestion:
+    # the FAISS index is served read-only from it and the DB is copied to SQL_DB_PATH.
+    ARTIFACT_DIR: str | None = None
+    ARTIFACT_VERIFY_CHECKSUMS: bool = True  # sha256 every file on boot (sizes are always checked)
+
+    # --- Startup / Readiness ---
+    BOOTSTRAP_IN_BACKGROUND: bool = True   # accept requests while SQL/vectors load (see GET /readyz)
+    READINESS_RETRY_AFTER_SECONDS: int = 5 # Retry-After on requests a loading subsystem can't serve yet
+
+    # --- Multi-worker Deployment (uvicorn --workers N) ---
+    WEB_WORKERS: int = 1                         # worker processes for `python src/web/server.py`
+    BOOTSTRAP_LEADER_ELECTION: bool = True       # one process bootstraps (file lock); the others wait and load its results
+    VECTOR_REFRESH_INTERVAL_SECONDS: float = 30.0  # reload index generations published by other workers (0 disables)
+    SQL_BUSY_TIMEOUT_SECONDS: float = 30.0       # wait this long for another connection's write lock
+    SQL_WAL_MODE: bool = True                    # WAL journal: readers never block on a writer process
+
+    # --- Chat Scheduling (per-process) ---
+    CHAT_COALESCE_REQUESTS: bool = True          # identical concurrent /chat requests share one graph run
+    CHAT_BATCH_MAX_ITEMS: int = 100              # messages per POST /chat/batch
+    CHAT_BATCH_MAX_CONCURRENCY: int = 8          # graph runs in flight per batch
+
+    # --- Admission Control (LLM / embedding calls, per process) ---
+    LLM_MAX_CONCURRENCY: int = 8               # in-flight chat-model calls (0 disables the limit)
+    LLM_MAX_QUEUE: int = 32                    # callers allowed to wait for a slot; beyond that /chat answers 429
+    EMBEDDING_ADMISSION_MAX_CONCURRENCY: int = 8  # in-flight embedding calls, query and ingest (0 disables)
+    EMBEDDING_MAX_QUEUE: int = 32
+    ADMISSION_MAX_WAIT_SECONDS: float = 10.0   # a queued call gives up (429) after waiting this long
+    ADMISSION_RETRY_AFTER_SECONDS: int = 2     # Retry-After on 429 responses
+
+    # --- Email Jobs (POST /jobs, drained in the background) ---
+    JOB_WORKERS: int = 4                       # worker threads per process (0: accept jobs, never run them)
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0     # also picks up jobs submitted to other worker processes
+    JOB_MAX_ATTEMPTS: int = 3                  # runs refused by admission control are retried
+    JOB_RETRY_BACKOFF_SECONDS: float = 5.0     # doubled on each retry
+    JOB_RECOVERY_INTERVAL_SECONDS: float = 30.0  # how often workers re-queue jobs of dead processes
+    JOB_WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+    JOB_WEBHOOK_ATTEMPTS: int = 3
+    JOB_WEBHOOK_ALLOWED_HOSTS: List[str] = []  # hosts webhook_url may point to (empty: webhooks refused)
+
+    # --- Vector Store Serving ---
+    # Read-only mode memory-maps the FAISS index and reads documents lazily
+    # from SQLite so multiple uvicorn workers share one copy of the index.
+    VECTOR_STORE_READ_ONLY: bool = False
+    # Load the vector indexes in a background thread at server startup
+    # (otherwise they load on the first POLICY retrieval or ingest)
+    VECTOR_WARMUP_ON_STARTUP: bool = True
+    # Candidates fetched before the vendor_id metadata filter is applied
+    VENDOR_ARCHIVE_FETCH_K: int = 50
+    VECTOR_STORE_KEEP_GENERATIONS: int = 2  # index generations kept on disk per namespace
+
+    # --- Vector Index Type ---
+    # faiss index_factory string: "Flat" (exact), "HNSW32", "IVF1024,PQ16", ...
+    # Applied when a namespace index is first built; re-ingest to switch types.
+    VECTOR_INDEX_FACTORY: str = "Flat"
+    VECTOR_INDEX_NPROBE: int = 8          # IVF: inverted lists probed per query
+    VECTOR_INDEX_EF_SEARCH: int = 64      # HNSW: candidate list size per query
+
+    # --- Embedding Ingestion Pipeline ---
+    EMBEDDING_BATCH_SIZE: int = 64
+    EMBEDDING_MAX_CONCURRENCY: int = 4          # in-flight batches
+    EMBEDDING_REQUESTS_PER_MINUTE: int = 3000   # 0 disables
+    EMBEDDING_TOKENS_PER_MINUTE: int = 1000000  # 0 disables
+    EMBEDDING_MAX_RETRIES: int = 5
+    EMBEDDING_BACKOFF_SECONDS: float = 1.0
+
+    # --- Ledger Import ---
+    LEDGER_IMPORT_CHUNK_SIZE: int = 50000  # CSV rows per executemany batch
+
+    # --- CSV Export (background, debounced sync of SQL -> ledger_data.csv) ---
+    CSV_EXPORT_DEBOUNCE_SECONDS: float = 2.0   # export once updates go quiet this long
+    CSV_EXPORT_MAX_PENDING: int = 100          # ...or once this many changes queued up
+    CSV_EXPORT_MAX_DELAY_SECONDS: float = 30.0 # ...or once the oldest change is this old
+    CSV_EXPORT_CHANGED_ONLY: bool = False      # patch only the changed vendors' rows
+
+    # --- Final Export (wide final_data.csv -> vendors/invoices/items/email_archive + archive vectors) ---
+    FINAL_EXPORT_INGEST_ENABLED: bool = False  # ingest_all loads final_data.csv instead of the ledger/library CSVs
+    FINAL_EXPORT_CHUNK_SIZE: int = 50000       # rows per DataFrame chunk
+    FINAL_EXPORT_PARQUET_CACHE: bool = True    # cache the parsed export as Parquet (requires pyarrow)
+
+    # --- Document Chunking (PDF ingestion) ---
+    CHUNK_SIZE: int = 1000
+    CHUNK_OVERLAP: int = 200
+    INGEST_BATCH_SIZE: int = 256          # chunks handed to the vector store at a time
+    PDF_PARSE_WORKERS: int = 4            # process pool size (<= 1 parses in-process)
+    PDF_PAGES_PER_TASK: int = 16
+    INGEST_MAX_WORKERS: int = 3           # sources ingested concurrently by ingest_all (1 = sequential)
+    INGEST_SKIP_UNCHANGED: bool = True    # ingest_all skips sources whose file + schema fingerprint is unchanged
+
+    # --- Hybrid Retrieval (BM25 + vector) ---
+    HYBRID_RETRIEVAL_ENABLED: bool = True
+    # BM25 confidence (0-1) above which the embedding call is skipped entirely
+    LEXICAL_FAST_PATH_THRESHOLD: float = 0.85
+    RRF_K: int = 60                       # reciprocal rank fusion constant
+
+    # --- Policy Retrieval ---
+    RETRIEVAL_SCORE_THRESHOLD_ENABLED: bool = True  # drop chunks below SIMILARITY_THRESHOLD
+    MMR_FETCH_K: int = 20                 # candidates MMR re-ranks for diversity
+    MMR_LAMBDA_MULT: float = 0.5          # 1.0 = pure relevance, 0.0 = max diversity
+
+    # --- Policy Context Compression (extractive, before drafting) ---
+    RAG_COMPRESSION_ENABLED: bool = True
+    RAG_CONTEXT_TOKEN_BUDGET: int = 400   # ~tokens of policy text per request in data_context
+
+    # --- RAG Caches ---
+    RAG_CONTEXT_CACHE_SIZE: int = 256     # formatted policy contexts (0 disables)
+    RAG_EMBEDDING_CACHE_SIZE: int = 1024  # query embeddings (0 disables)
     
     # --- Business Logic Thresholds ---
     MAX_RETRIES: int = 3
-    SIMILARITY_THRESHOLD: float = 0.60
+    SIMILARITY_THRESHOLD: float = 0.35   # cosine similarity cutoff for policy chunks (see config.yml)
 
     # --- Computed Properties (Not loadable from Config) ---
+    @property
+    def DATA_ROOT(self) -> Path:
+        return Path(self.DATA_DIR) if self.DATA_DIR else BASE_DIR / "data"
+
     @property
     def SQL_DB_PATH(self) -> str:
-        return str(BASE_DIR / "data" / "sql" / self.SQL_DB_NAME)
+        return str(self.DATA_ROOT / "sql" / self.SQL_DB_NAME)
 
     @property
     def VECTOR_STORE_PATH(self) -> str:
-        return str(BASE_DIR / "data" / "vector_store" / self.VECTOR_STORE_DIR_NAME)
+        root = Path(self.ARTIFACT_DIR) if self.ARTIFACT_DIR else self.DATA_ROOT
+        return str(root / "vector_store" / self.VECTOR_STORE_DIR_NAME)
+
+    @property
+    def EMBEDDING_CHECKPOINT_DIR(self) -> str:
+        return str(self.DATA_ROOT / "vector_store" / "checkpoints")
+
+    @property
+    def PARQUET_CACHE_DIR(self) -> str:
+        return str(BASE_DIR / "data" / "cache")
 
     @property
     def RAW_DATA_DIR(self) -> Path:
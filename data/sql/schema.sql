@@ -35,6 +35,44 @@ CREATE TABLE IF NOT EXISTS invoices (
     FOREIGN KEY (vendor_id) REFERENCES vendors(id) ON DELETE CASCADE
 );
 
+-- -----------------------------------------------------------------------------
+-- Table: items
+-- Purpose: Catalog items (loaded from final_data.csv)
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS items (
+    item_id TEXT PRIMARY KEY,            -- Matches 'item_id' (e.g., C103)
+    name TEXT NOT NULL,                  -- Matches 'item_name'
+    category TEXT,
+    description TEXT,
+    price DECIMAL(10, 2),
+    supplier TEXT,
+    stock INTEGER,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- -----------------------------------------------------------------------------
+-- Table: email_archive
+-- Purpose: Past vendor emails and replies (loaded from final_data.csv); the
+--          same rows are indexed in the email_archive vector namespace
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS email_archive (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    invoice_number TEXT,                 -- Matches 'invoice_id'
+    vendor_id_str TEXT,                  -- Matches 'vendor_id'
+    item_id TEXT,                        -- Matches 'related_item_id' (or 'item_id')
+    from_address TEXT,
+    to_address TEXT,
+    subject TEXT,
+    body TEXT,
+    email_type TEXT,
+    reply_text TEXT,                     -- 'reply_text', else 'generated_reply'
+    summary TEXT,
+    previous_interactions TEXT,
+    response_date DATE,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (invoice_number, subject, body)
+);
+
 -- -----------------------------------------------------------------------------
 -- Table: conversation_history
 -- Purpose: Active session memory (not the RAG archive)
@@ -48,7 +86,76 @@ CREATE TABLE IF NOT EXISTS conversation_history (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- -----------------------------------------------------------------------------
+-- Table: vendor_change_log
+-- Purpose: Append-only outbox of vendor field changes (written in the same
+--          transaction as the UPDATE); read incrementally by change-feed consumers
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS vendor_change_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Monotonic change cursor
+    vendor_id INTEGER NOT NULL,            -- FK to vendors.id
+    vendor_id_str TEXT,                    -- CSV Vendor ID (e.g., V7755); NULL if the vendor has none
+    field TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- -----------------------------------------------------------------------------
+-- Table: change_feed_cursors
+-- Purpose: Last vendor_change_log.id applied by each consumer (ERP export, CSV, ...)
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS change_feed_cursors (
+    consumer TEXT PRIMARY KEY,
+    last_change_id INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- -----------------------------------------------------------------------------
+-- Table: ingest_state
+-- Purpose: Fingerprint of the raw file (and schema) each source was last ingested
+--          from; startup skips sources whose fingerprint is unchanged
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS ingest_state (
+    source TEXT PRIMARY KEY,               -- ledger | library | policy
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,                  -- Content hash (catches touched-but-identical files)
+    schema_sha256 TEXT NOT NULL,           -- Hash of schema.sql at ingest time
+    items INTEGER,                         -- Rows / chunks loaded
+    ingested_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- -----------------------------------------------------------------------------
+-- Table: email_jobs
+-- Purpose: Queue of emails submitted through POST /jobs, drained by worker
+--          threads (survives restarts; see EmailJobService)
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS email_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Submission order (FIFO per thread)
+    job_id TEXT UNIQUE NOT NULL,
+    thread_id TEXT NOT NULL,
+    payload TEXT NOT NULL,                 -- EmailInput JSON
+    status TEXT NOT NULL DEFAULT 'queued', -- queued | running | succeeded | failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL DEFAULT 0,  -- Epoch seconds; retry backoff
+    claimed_pid INTEGER,                   -- Process running the job
+    result TEXT,                           -- JSON: response, intent, action
+    error TEXT,
+    webhook_url TEXT,
+    webhook_status TEXT,                   -- delivered | failed
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    started_at DATETIME,
+    finished_at DATETIME
+);
+
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_vendors_email ON vendors(email);
+-- Sender lookups (AuthService) match LOWER(email), so addresses are unique ignoring case
+DROP INDEX IF EXISTS idx_vendors_email_lower;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vendors_email_nocase ON vendors(LOWER(email));
 CREATE INDEX IF NOT EXISTS idx_invoices_number ON invoices(invoice_number);
-CREATE INDEX IF NOT EXISTS idx_vendors_str_id ON vendors(vendor_id_str);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_vendors_str_id ON vendors(vendor_id_str);
+CREATE INDEX IF NOT EXISTS idx_email_archive_vendor ON email_archive(vendor_id_str);
+CREATE INDEX IF NOT EXISTS idx_email_jobs_status ON email_jobs(status, thread_id);
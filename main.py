@@ -5,45 +5,25 @@ import os
 import sys
 import logging
 from typing import Dict, Any
-from scripts.data_loader import data_loader
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from config.settings import settings
 from config.logging_config import GLOBAL_LOGGER as logger
 from src.graph.workflow import app
 from src.domain.email_schemas import EmailInput
-from src.core.db_manager import db_manager
-from src.services.data_loader import data_loader # Import new loader
+from src.services.bootstrap import bootstrap_service
+from src.services.readiness import readiness, SQL
 
 def bootstrap_system():
     """
     Initializes DB Schema and Ingests Data.
     """
     logger.info("system_startup_initiated")
-    
-    # 1. Initialize Database Schema
-    db_path = settings.SQL_DB_PATH
-    schema_path = settings.BASE_DIR / "data/sql/schema.sql"
-    
-    try:
-        if not os.path.exists(os.path.dirname(db_path)):
-            os.makedirs(os.path.dirname(db_path))
 
-        with open(schema_path, "r") as f:
-            schema_sql = f.read()
-        
-        with db_manager.get_connection() as conn:
-            conn.executescript(schema_sql)
-            
-        logger.info("schema_applied_successfully")
-        
-    except Exception as e:
-        logger.error("schema_init_failed", error=str(e))
+    # Schema + ingestion (Ledger -> SQL, Library/Policy -> Vector), reported per subsystem
+    bootstrap_service.run()
+    if not readiness.is_ready(SQL):
+        logger.error("schema_init_failed", detail=readiness.snapshot()[SQL]["detail"])
         sys.exit(1)
 
-    # 2. Ingest Data (CSV + PDF)
-    # This handles Ledger (SQL) and Library/Policy (Vector)
-    data_loader.ingest_all()
-
 def run_agent_simulation(mock_email: Dict[str, Any]):
     # ... (Same as before) ...
     logger.info(f"\n{'='*50}\nSimulating Incoming Email...\n{'='*50}")
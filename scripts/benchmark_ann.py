@@ -0,0 +1,143 @@
+# ==========================================
+# File: scripts/benchmark_ann.py
+# ==========================================
+"""
+Recall / latency benchmark for the FAISS index types supported by VectorManager.
+
+Generates synthetic, clustered, unit-normalised corpora (embeddings are unit
+length, like OpenAI's) and compares each index factory against the exact
+"Flat" baseline.
+
+Usage:
+    python scripts/benchmark_ann.py --sizes 10000,100000,1000000 \
+        --factories "HNSW32;IVF1024,PQ32" --dim 256
+
+For the 10M point pass use a lower --dim (e.g. 128) or a machine with enough
+RAM for two copies of the corpus (baseline + candidate index).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, List
+
+import faiss
+import numpy as np
+
+# Ensure root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.faiss_index import build_index, configure_search
+
+CHUNK_SIZE = 100_000
+TRAIN_SIZE = 100_000
+
+
+def iter_corpus(n: int, dim: int, seed: int, n_clusters: int = 256) -> Iterator[np.ndarray]:
+    """
+    Yields the corpus in chunks so 10M x dim never has to be materialised twice.
+    Chunks are seeded by position, so every index sees the exact same vectors.
+    """
+    centers = np.random.default_rng(seed).normal(size=(n_clusters, dim)).astype(np.float32)
+    for start in range(0, n, CHUNK_SIZE):
+        rng = np.random.default_rng(seed + 1 + start // CHUNK_SIZE)
+        size = min(CHUNK_SIZE, n - start)
+        chunk = centers[rng.integers(0, n_clusters, size)] + 0.5 * rng.normal(size=(size, dim)).astype(np.float32)
+        faiss.normalize_L2(chunk)
+        yield chunk
+
+
+def make_queries(n_queries: int, dim: int, seed: int) -> np.ndarray:
+    return next(iter_corpus(n_queries, dim, seed + 10_000))
+
+
+def rss_bytes() -> int:
+    """Current resident set size (Linux); 0 where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def run_factory(factory: str, n: int, dim: int, queries: np.ndarray, k: int, seed: int,
+                nprobe: int, ef_search: int) -> Dict:
+    rss_before = rss_bytes()
+    build_start = time.perf_counter()
+
+    train_sample = next(iter_corpus(min(n, TRAIN_SIZE), dim, seed))
+    index = build_index(train_sample, factory=factory)
+    for chunk in iter_corpus(n, dim, seed):
+        index.add(chunk)
+    configure_search(index, nprobe=nprobe, ef_search=ef_search)
+
+    build_seconds = time.perf_counter() - build_start
+    memory_mb = (rss_bytes() - rss_before) / 1e6
+
+    # Single-query latency, which is what /chat pays per POLICY request
+    latencies = []
+    neighbours = np.empty((len(queries), k), dtype=np.int64)
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        _, ids = index.search(query.reshape(1, -1), k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        neighbours[i] = ids[0]
+
+    return {
+        "factory": factory,
+        "n": n,
+        "build_s": round(build_seconds, 2),
+        "memory_mb": round(memory_mb, 1),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 3),
+        "neighbours": neighbours,
+    }
+
+
+def recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / truth.size
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated corpus sizes (up to 10000000).")
+    parser.add_argument("--factories", default="HNSW32;IVF1024,PQ32;IVF1024,Flat",
+                        help="Semicolon-separated faiss index_factory strings (Flat baseline is always run).")
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--ef-search", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Emit one JSON object per result line.")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    factories = [f.strip() for f in args.factories.split(";") if f.strip() and f.strip() != "Flat"]
+    queries = make_queries(args.queries, args.dim, args.seed)
+
+    if not args.json:
+        print(f"{'factory':<20}{'n':>10}{'build_s':>10}{'mem_mb':>10}{'p50_ms':>10}{'p95_ms':>10}{'recall@k':>10}")
+
+    for n in sizes:
+        baseline = run_factory("Flat", n, args.dim, queries, args.k, args.seed, args.nprobe, args.ef_search)
+        truth = baseline.pop("neighbours")
+        results = [dict(baseline, recall=1.0)]
+
+        for factory in factories:
+            result = run_factory(factory, n, args.dim, queries, args.k, args.seed, args.nprobe, args.ef_search)
+            result["recall"] = round(recall_at_k(result.pop("neighbours"), truth), 4)
+            results.append(result)
+
+        for r in results:
+            if args.json:
+                print(json.dumps(dict(r, k=args.k, dim=args.dim)))
+            else:
+                print(f"{r['factory']:<20}{r['n']:>10}{r['build_s']:>10}{r['memory_mb']:>10}"
+                      f"{r['p50_ms']:>10}{r['p95_ms']:>10}{r['recall']:>10}")
+
+
+if __name__ == "__main__":
+    main()
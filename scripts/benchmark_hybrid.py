@@ -0,0 +1,95 @@
+# ==========================================
+# File: scripts/benchmark_hybrid.py
+# ==========================================
+"""
+Replays policy queries through RAGService twice, vector-only and hybrid
+(BM25 fast path + RRF), and reports embedding calls saved and latency.
+
+Caches are disabled so every query pays its real cost.
+
+Usage:
+    python scripts/benchmark_hybrid.py --queries-file policy_queries.txt
+    python scripts/benchmark_hybrid.py            # user messages from conversation_history
+"""
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+# Ensure root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config.settings import settings
+from src.common.metrics import metrics
+from src.core.db_manager import db_manager
+
+
+def load_queries(path: str = None, limit: int = 500) -> List[str]:
+    """One query per line from a file, else the most recent vendor messages in SQL."""
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()][:limit]
+
+    with db_manager.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT content FROM conversation_history WHERE role = 'user' ORDER BY created_at DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+    return [row["content"] for row in rows]
+
+
+def run(queries: List[str], hybrid: bool) -> dict:
+    # Fresh service with caching disabled so both modes are measured cold
+    settings.HYBRID_RETRIEVAL_ENABLED = hybrid
+    settings.RAG_CONTEXT_CACHE_SIZE = 0
+    settings.RAG_EMBEDDING_CACHE_SIZE = 0
+    from src.services.rag_service import RAGService
+    service = RAGService()
+
+    before = metrics.snapshot()
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        service.retrieve_policy_context(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    after = metrics.snapshot()
+
+    def delta(name: str) -> int:
+        return int(after.get(name, 0) - before.get(name, 0))
+
+    return {
+        "mode": "hybrid" if hybrid else "vector",
+        "embedding_calls": delta("rag_embedding_calls"),
+        "fast_path": delta("rag_lexical_fast_path"),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 1),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 1),
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries-file", help="Text file with one policy query per line.")
+    parser.add_argument("--limit", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    queries = load_queries(args.queries_file, args.limit)
+    if not queries:
+        print("No queries found.")
+        return
+
+    baseline = run(queries, hybrid=False)
+    hybrid = run(queries, hybrid=True)
+
+    saved = baseline["embedding_calls"] - hybrid["embedding_calls"]
+    print(f"queries:                {len(queries)}")
+    for r in (baseline, hybrid):
+        print(f"{r['mode']:<8} embedding calls: {r['embedding_calls']:>6}   "
+              f"fast path: {r['fast_path']:>6}   p50: {r['p50_ms']} ms   p95: {r['p95_ms']} ms")
+    print(f"embedding calls saved:  {saved} ({saved / max(baseline['embedding_calls'], 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# ==========================================
+# File: scripts/benchmark_ledger_import.py
+# ==========================================
+"""
+Generates a synthetic ledger_data.csv and compares the bulk LedgerImporter
+with the previous row-by-row import (INSERT vendor / SELECT id / INSERT invoice
+per row). Everything runs against throwaway databases in a temp directory.
+
+Both paths run in a single transaction, so the gap shown is per-row overhead
+(extra SELECT, per-statement calls, DictReader). Use --legacy-rows to time the
+baseline on a sample only.
+
+Usage:
+    python scripts/benchmark_ledger_import.py --rows 1000000 --vendors 50000
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Ensure root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config.settings import settings
+from src.core.db_manager import DBManager
+from src.services.ledger_importer import LedgerImporter
+
+HEADER = ["vendor_id", "name", "email", "phone", "address", "company", "role",
+          "invoice_id", "amount", "status", "due_date", "invoice_date"]
+
+
+def generate_ledger(path: Path, rows: int, vendors: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    statuses = ["Pending", "Paid", "Overdue"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for i in range(rows):
+            v = rng.randrange(vendors)
+            writer.writerow([
+                f"V{v}", f"Contact {v}", f"vendor{v}@example.com", f"555{v:07d}", f"{v} Main Street",
+                f"Company {v}", "Procurement Manager", f"INV-{i}", f"{rng.uniform(10, 100000):.2f}",
+                rng.choice(statuses), "2025-09-07", "2025-08-08",
+            ])
+
+
+def fresh_db(folder: Path, name: str) -> DBManager:
+    db = DBManager(str(folder / name))
+    with open(settings.BASE_DIR / "data/sql/schema.sql", "r") as f, db.get_connection() as conn:
+        conn.executescript(f.read())
+    return db
+
+
+def legacy_import(db: DBManager, csv_path: Path, limit: int) -> float:
+    """The pre-bulk implementation, kept here for comparison. Returns rows/sec."""
+    start = time.perf_counter()
+    with open(csv_path, "r", encoding="utf-8") as f, db.get_connection() as conn:
+        cursor = conn.cursor()
+        for n, row in enumerate(csv.DictReader(f)):
+            if n >= limit:
+                break
+            cursor.execute("""
+                INSERT OR IGNORE INTO vendors
+                (vendor_id_str, name, contact_name, email, phone, address, category)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (row['vendor_id'], row['company'], row['name'], row['email'], row['phone'], row['address'], row['role']))
+            cursor.execute("SELECT id FROM vendors WHERE vendor_id_str = ?", (row['vendor_id'],))
+            vendor_row = cursor.fetchone()
+            if vendor_row:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO invoices
+                    (vendor_id, invoice_number, amount, status, issue_date, due_date)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (vendor_row[0], row['invoice_id'], row['amount'], row['status'], row['invoice_date'], row['due_date']))
+    return limit / (time.perf_counter() - start)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--vendors", type=int, default=50_000)
+    parser.add_argument("--legacy-rows", type=int, default=None,
+                        help="Rows for the row-by-row baseline (default: all, 0 skips it).")
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / "ledger_data.csv"
+        print(f"Generating {args.rows:,} rows ({args.vendors:,} vendors)...")
+        generate_ledger(csv_path, args.rows, args.vendors)
+
+        importer = LedgerImporter(db=fresh_db(tmp, "bulk.db"), chunk_size=args.chunk_size)
+        importer.import_csv(csv_path)
+        stats = importer.last_stats
+        print(f"bulk:       {stats['rows']:>10,} rows in {stats['seconds']:>8.2f}s  ->  {stats['rows_per_sec']:>12,.0f} rows/sec")
+
+        legacy_rows = args.rows if args.legacy_rows is None else min(args.legacy_rows, args.rows)
+        if legacy_rows:
+            legacy_rate = legacy_import(fresh_db(tmp, "legacy.db"), csv_path, legacy_rows)
+            print(f"row-by-row: {legacy_rows:>10,} rows                     ->  {legacy_rate:>12,.0f} rows/sec")
+            print(f"speed-up:   {stats['rows_per_sec'] / legacy_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# ==========================================
+# File: scripts/build_artifacts.py
+# ==========================================
+"""
+Builds a versioned, checksummed artifact bundle: a fully ingested SQLite DB and
+FAISS index plus manifest.json (file sizes + sha256, schema hash, embedding model).
+
+Run it once per data release (e.g. in CI, with the embedding API key), then
+start servers with ARTIFACT_DIR=<bundle>. They verify the bundle, copy the DB to
+their writable SQL_DB_PATH and serve the index read-only, without re-ingesting.
+
+Usage:
+    python scripts/build_artifacts.py --out artifacts
+    python scripts/build_artifacts.py --out artifacts --version 2025.09.1
+    python scripts/build_artifacts.py --verify artifacts/2025.09.1
+"""
+import argparse
+import os
+import sys
+from typing import List
+
+# Ensure root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.artifact_store import artifact_store
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--out", help="Directory the <version>/ bundle is created in.")
+    action.add_argument("--verify", metavar="BUNDLE", help="Verify an existing bundle and exit.")
+    parser.add_argument("--version", help="Bundle version (default: UTC timestamp).")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        manifest = artifact_store.verify(args.verify, checksums=True)
+        print(f"OK: {args.verify} (version {manifest.version}, {len(manifest.files)} files)")
+        return
+
+    manifest = artifact_store.build(args.out, version=args.version)
+    print(f"Built {os.path.join(args.out, manifest.version)}")
+    for name, result in manifest.sources.items():
+        print(f"  {name:<13} {result['status']:<8} {result.get('items', 0):>8} items")
+    print(f"  {len(manifest.files)} files, generations: {manifest.generations}")
+
+
+if __name__ == "__main__":
+    main()
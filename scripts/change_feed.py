@@ -0,0 +1,61 @@
+# ==========================================
+# File: scripts/change_feed.py
+# ==========================================
+"""
+Reads vendor changes from the vendor_change_log outbox and applies them to a sink.
+
+Each consumer name keeps its own cursor, so repeated runs only apply new changes.
+
+Usage:
+    python scripts/change_feed.py peek --since 0
+    python scripts/change_feed.py consume --consumer ledger_csv --sink csv
+    python scripts/change_feed.py consume --consumer erp --sink jsonl --out exports/vendor_changes.jsonl
+    python scripts/change_feed.py consume --consumer erp --sink jsonl --out changes.jsonl --follow 5
+"""
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+# Ensure root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.change_feed import change_feed, JSONLSink, LedgerCSVSink
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    peek = commands.add_parser("peek", help="Print changes after a cursor without advancing anything.")
+    peek.add_argument("--since", type=int, default=0)
+    peek.add_argument("--limit", type=int, default=100)
+
+    consume = commands.add_parser("consume", help="Apply new changes to a sink and advance the consumer cursor.")
+    consume.add_argument("--consumer", required=True)
+    consume.add_argument("--sink", choices=["csv", "jsonl"], required=True)
+    consume.add_argument("--out", help="Output path (jsonl: required; csv: defaults to data/raw/ledger_data.csv).")
+    consume.add_argument("--batch-size", type=int, default=1000)
+    consume.add_argument("--follow", type=float, default=0, help="Keep polling every N seconds.")
+    args = parser.parse_args(argv)
+
+    if args.command == "peek":
+        for change in change_feed.read(since=args.since, limit=args.limit):
+            print(change.model_dump_json())
+        return
+
+    if args.sink == "jsonl" and not args.out:
+        parser.error("--out is required for the jsonl sink")
+    sink = JSONLSink(args.out) if args.sink == "jsonl" else LedgerCSVSink(args.out)
+
+    while True:
+        applied = change_feed.consume(args.consumer, sink, batch_size=args.batch_size)
+        print(f"{args.consumer}: applied {applied} changes (cursor {change_feed.get_cursor(args.consumer)})")
+        if not args.follow:
+            break
+        time.sleep(args.follow)
+
+
+if __name__ == "__main__":
+    main()
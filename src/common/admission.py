@@ -0,0 +1,125 @@
+# ==========================================
+# File: src/common/admission.py
+# ==========================================
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.exceptions import ServiceOverloadedException
+from src.common.metrics import metrics
+
+# Lower value = admitted first
+PRIORITY_HIGH = 0    # finishes a request already in progress (extraction, drafting, query embedding)
+PRIORITY_NORMAL = 1  # starts new LLM work (classification)
+PRIORITY_LOW = 2     # background work (ingest embedding batches)
+
+
+class AdmissionController:
+    """
+    Bounds concurrent calls to one provider (LLM, embeddings) within the process.
+
+    Up to max_concurrency calls run at once; further callers wait in a priority
+    queue (FIFO within a priority) of at most max_queue entries. A caller that
+    finds the queue full, or waits longer than max_wait_seconds, gets
+    ServiceOverloadedException right away instead of piling onto the provider;
+    the web layer turns it into 429 + Retry-After. Calls with reject=False
+    (background ingestion) always wait for their turn.
+
+    Requests that never reach the provider (security rejections, RAG cache
+    hits, BM25 fast path) never take a slot, so they stay fast under load.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, max_wait_seconds: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting: List[Tuple[int, int]] = []  # heap of (priority, arrival)
+        self._arrivals = itertools.count()
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_observed = 0.0
+        metrics.register_gauge(f"{name}_admission", self.stats)
+
+    @contextmanager
+    def slot(self, priority: int = PRIORITY_NORMAL, reject: bool = True) -> Iterator[None]:
+        """
+        Holds one concurrency slot for the duration of the block.
+
+        Raises:
+            ServiceOverloadedException: The wait queue is full or the wait timed out.
+        """
+        if self.max_concurrency <= 0:
+            yield
+            return
+        self._acquire(priority, reject)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def _acquire(self, priority: int, reject: bool) -> None:
+        start = time.perf_counter()
+        with self._cond:
+            if self._active < self.max_concurrency and not self._waiting:
+                self._active += 1
+                self.admitted += 1
+                return
+            if reject and len(self._waiting) >= self.max_queue:
+                self._refuse(f"{self.name} queue is full ({self.max_queue} waiting)")
+
+            entry = (priority, next(self._arrivals))
+            heapq.heappush(self._waiting, entry)
+            deadline = start + self.max_wait_seconds if reject else None
+            while not (self._waiting[0] == entry and self._active < self.max_concurrency):
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                    self._cond.notify_all()  # the next waiter may now be at the head
+                    self._refuse(f"{self.name} slot not available within {self.max_wait_seconds}s")
+                self._cond.wait(remaining)
+
+            heapq.heappop(self._waiting)
+            self._active += 1
+            self.admitted += 1
+            waited = time.perf_counter() - start
+            self.wait_seconds += waited
+            self.max_wait_observed = max(self.max_wait_observed, waited)
+            self._cond.notify_all()
+
+    def _refuse(self, reason: str) -> None:
+        # Called with the condition held
+        self.rejected += 1
+        logger.warning("admission_refused", controller=self.name, reason=reason,
+                       active=self._active, queued=len(self._waiting))
+        raise ServiceOverloadedException(reason)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "active": self._active,
+                "queued": len(self._waiting),
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "avg_wait_seconds": round(self.wait_seconds / self.admitted, 4) if self.admitted else 0.0,
+                "max_wait_seconds": round(self.max_wait_observed, 4),
+            }
+
+# Singleton Instances
+llm_admission = AdmissionController("llm", settings.LLM_MAX_CONCURRENCY, settings.LLM_MAX_QUEUE,
+                                    settings.ADMISSION_MAX_WAIT_SECONDS)
+embedding_admission = AdmissionController("embedding", settings.EMBEDDING_ADMISSION_MAX_CONCURRENCY,
+                                          settings.EMBEDDING_MAX_QUEUE, settings.ADMISSION_MAX_WAIT_SECONDS)
@@ -75,6 +75,10 @@ class ConfigurationException(VendorAgentException):
     """Raised when critical settings or API keys are missing."""
     pass
 
+class ArtifactVerificationException(ConfigurationException):
+    """Raised when a prebuilt artifact bundle is missing, incomplete or fails its checksums."""
+    pass
+
 class ValidationException(VendorAgentException):
     """Raised when user input (email, phone, intent) fails validation rules."""
     pass
@@ -89,4 +93,12 @@ class DatabaseException(VendorAgentException):
 
 class ResourceNotFoundException(VendorAgentException):
     """Raised when a requested entity (Invoice, Vendor) is not found."""
-    pass
\ No newline at end of file
+    pass
+
+class ReindexInProgressException(VendorAgentException):
+    """Raised when a re-index is requested while another one is still running."""
+    pass
+
+class ServiceOverloadedException(VendorAgentException):
+    """Raised when a provider call is refused admission (wait queue full or wait too long)."""
+    pass
@@ -0,0 +1,63 @@
+# ==========================================
+# File: src/common/file_lock.py
+# ==========================================
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process development only
+    fcntl = None
+
+
+class FileLock:
+    """
+    Cross-process advisory lock (flock) on a file, used to elect one bootstrap
+    leader among uvicorn workers and to keep ingest writers exclusive.
+
+    flock locks belong to the open file, so two FileLock objects conflict even
+    inside one process. Use one instance per acquisition (not thread-safe).
+    On platforms without fcntl every acquire succeeds.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    def acquire(self, exclusive: bool = True, blocking: bool = True) -> bool:
+        """Returns False if blocking=False and another process holds a conflicting lock."""
+        if fcntl is None:
+            logger.warning("file_lock_unsupported", path=str(self.path))
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        flags = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | (0 if blocking else fcntl.LOCK_NB)
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def ingest_lock() -> FileLock:
+    """The lock held by whichever process writes SQL/vector data (bootstrap leader, re-index job)."""
+    return FileLock(settings.DATA_ROOT / "ingest.lock")
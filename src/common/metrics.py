@@ -0,0 +1,38 @@
+# ==========================================
+# File: src/common/metrics.py
+# ==========================================
+import threading
+from typing import Callable, Dict, Any
+
+
+class MetricsRegistry:
+    """
+    Process-local metrics registry exposed by the web server at GET /metrics.
+    Counters are incremented in place; gauges are callables sampled on read,
+    so services can publish their internal stats without extra bookkeeping.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def register_gauge(self, name: str, fn: Callable[[], Any]) -> None:
+        self._gauges[name] = fn
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            data: Dict[str, Any] = dict(self._counters)
+        for name, fn in self._gauges.items():
+            try:
+                data[name] = fn()
+            except Exception as e:
+                data[name] = f"error: {e}"
+        return data
+
+# Singleton Instance
+metrics = MetricsRegistry()
@@ -4,7 +4,7 @@
 import sqlite3
 import logging
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional
 from config.settings import settings
 from config.logging_config import GLOBAL_LOGGER as logger
 
@@ -16,15 +16,20 @@ class DBManager:
     Handles connection lifecycle and row mapping.
     """
     
-    def __init__(self):
-        # Ensure the directory exists
-        pass 
+    def __init__(self, db_path: Optional[str] = None):
+        # None follows settings.SQL_DB_PATH; an explicit path is used by tools and benchmarks
+        self._db_path = db_path
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path or settings.SQL_DB_PATH
 
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         conn = None
         try:
-            conn = sqlite3.connect(settings.SQL_DB_PATH)
+            # Several worker processes share the file: wait for their write locks instead of failing
+            conn = sqlite3.connect(self.db_path, timeout=settings.SQL_BUSY_TIMEOUT_SECONDS)
             conn.row_factory = sqlite3.Row 
             yield conn
             conn.commit()
@@ -0,0 +1,114 @@
+# ==========================================
+# File: src/core/docstore.py
+# ==========================================
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterator, Union
+
+from langchain_community.docstore.base import Docstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+
+# Written next to index.faiss / index.pkl by the read-write VectorManager
+DOCSTORE_FILE_NAME = "docstore.sqlite"
+
+_SCHEMA = """
+    CREATE TABLE documents (
+        faiss_id INTEGER PRIMARY KEY,
+        doc_id TEXT NOT NULL UNIQUE,
+        page_content TEXT NOT NULL,
+        metadata TEXT NOT NULL
+    )
+"""
+
+
+class _ReadOnlyConnection:
+    """
+    Lazily opens one read-only SQLite connection per thread.
+    FAISS searches run in the FastAPI thread pool, so connections are never shared.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+
+class SQLiteDocstore(Docstore):
+    """
+    Read-only docstore that fetches documents from SQLite on demand.
+    Replaces the pickled InMemoryDocstore in read-only serving mode so nothing
+    is deserialized at startup and all workers share pages via the OS cache.
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = _ReadOnlyConnection(db_path)
+
+    def search(self, search: str) -> Union[str, Document]:
+        row = self._conn.get().execute(
+            "SELECT page_content, metadata FROM documents WHERE doc_id = ?", (search,)
+        ).fetchone()
+        if row is None:
+            return f"ID {search} not found."
+        return Document(id=search, page_content=row[0], metadata=json.loads(row[1]))
+
+
+class SQLiteIndexMap(Mapping):
+    """
+    Lazy replacement for FAISS.index_to_docstore_id (FAISS row -> docstore id).
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = _ReadOnlyConnection(db_path)
+
+    def __getitem__(self, faiss_id: int) -> str:
+        row = self._conn.get().execute(
+            "SELECT doc_id FROM documents WHERE faiss_id = ?", (int(faiss_id),)
+        ).fetchone()
+        if row is None:
+            raise KeyError(faiss_id)
+        return row[0]
+
+    def __len__(self) -> int:
+        return self._conn.get().execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def __iter__(self) -> Iterator[int]:
+        cursor = self._conn.get().execute("SELECT faiss_id FROM documents ORDER BY faiss_id")
+        return (row[0] for row in cursor)
+
+
+def write_sqlite_docstore(vectorstore: FAISS, folder_path: str) -> None:
+    """
+    Exports the docstore and index mapping of a FAISS store to SQLite.
+    The file is built under a temporary name and renamed, so readers never
+    observe a half-written docstore.
+    """
+    target = Path(folder_path) / DOCSTORE_FILE_NAME
+    tmp_path = target.with_name(f"{DOCSTORE_FILE_NAME}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.execute(_SCHEMA)
+        rows = []
+        for faiss_id, doc_id in vectorstore.index_to_docstore_id.items():
+            doc = vectorstore.docstore.search(doc_id)
+            if isinstance(doc, Document):
+                rows.append((int(faiss_id), doc_id, doc.page_content, json.dumps(doc.metadata, default=str)))
+        conn.executemany("INSERT INTO documents VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, target)
@@ -0,0 +1,180 @@
+# ==========================================
+# File: src/core/embedding_pipeline.py
+# ==========================================
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.admission import embedding_admission, PRIORITY_LOW
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. `acquire(n)` blocks until n tokens are available.
+    A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: Optional[float] = None):
+        self.rate = rate_per_second
+        self.capacity = capacity if capacity is not None else max(rate_per_second, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+        # A single request larger than the bucket may still pass once the bucket is full
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class EmbeddingPipeline:
+    """
+    Ingestion-time embedding with fixed-size batches, bounded concurrency,
+    request/token rate limiting, retry with exponential backoff and on-disk
+    checkpoints, so an interrupted ingest resumes at the first unfinished batch.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_seconds: Optional[float] = None,
+        checkpoint_dir: Optional[str] = None,
+    ):
+        self.embeddings = embeddings
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self.max_concurrency = max_concurrency or settings.EMBEDDING_MAX_CONCURRENCY
+        self.max_retries = settings.EMBEDDING_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_seconds = settings.EMBEDDING_BACKOFF_SECONDS if backoff_seconds is None else backoff_seconds
+        self.checkpoint_dir = Path(checkpoint_dir or settings.EMBEDDING_CHECKPOINT_DIR)
+
+        rpm = settings.EMBEDDING_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        tpm = settings.EMBEDDING_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute
+        self._request_bucket = TokenBucket(rpm / 60.0)
+        self._token_bucket = TokenBucket(tpm / 60.0, capacity=tpm / 60.0 * 10 if tpm else None)
+        self._checkpoint_lock = threading.Lock()
+
+        # Stats of the most recent run (documents, seconds, docs_per_sec, resumed_batches)
+        self.last_stats: Dict[str, float] = {}
+
+    # --- Checkpoints ---
+
+    def checkpoint_id(self, texts: List[str]) -> str:
+        """Stable id for an ingest job: same model + batch size + texts => same checkpoint."""
+        digest = hashlib.sha256()
+        digest.update(f"{type(self.embeddings).__name__}:{getattr(self.embeddings, 'model', '')}:{self.batch_size}".encode())
+        for text in texts:
+            digest.update(hashlib.sha256(text.encode("utf-8")).digest())
+        return digest.hexdigest()[:32]
+
+    def _checkpoint_path(self, job_id: str) -> Path:
+        return self.checkpoint_dir / f"{job_id}.jsonl"
+
+    def _load_checkpoint(self, job_id: str) -> Dict[int, List[List[float]]]:
+        path = self._checkpoint_path(job_id)
+        completed: Dict[int, List[List[float]]] = {}
+        if not path.exists():
+            return completed
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn final line from a crash; that batch is simply redone
+                completed[record["batch"]] = record["vectors"]
+        return completed
+
+    def _append_checkpoint(self, job_id: str, batch_index: int, vectors: List[List[float]]) -> None:
+        with self._checkpoint_lock:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._checkpoint_path(job_id), "a", encoding="utf-8") as f:
+                f.write(json.dumps({"batch": batch_index, "vectors": vectors}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear_checkpoint(self, job_id: str) -> None:
+        """Call once the vectors are safely persisted in the index (job_id from checkpoint_id)."""
+        path = self._checkpoint_path(job_id)
+        if path.exists():
+            path.unlink()
+
+    # --- Embedding ---
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        self._request_bucket.acquire()
+        # Rough token estimate (~4 chars per token) for TPM limits
+        self._token_bucket.acquire(sum(len(text) for text in batch) / 4)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                # Shares the provider with query embeddings, which go first
+                with embedding_admission.slot(PRIORITY_LOW, reject=False):
+                    return self.embeddings.embed_documents(batch)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_seconds * (2 ** attempt) * (1 + random.random() * 0.25)
+                logger.warning("embedding_batch_retry", attempt=attempt + 1, delay=round(delay, 2), error=str(e))
+                time.sleep(delay)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embeds texts in order. Completed batches are checkpointed as they finish;
+        a rerun over the same texts only embeds the batches that are missing.
+        """
+        if not texts:
+            return []
+
+        start = time.perf_counter()
+        job_id = self.checkpoint_id(texts)
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        results = self._load_checkpoint(job_id)
+        resumed = len(results)
+        if resumed:
+            logger.info("embedding_checkpoint_resumed", job_id=job_id, batches_done=resumed, batches_total=len(batches))
+
+        def run(batch_index: int):
+            vectors = self._embed_batch(batches[batch_index])
+            self._append_checkpoint(job_id, batch_index, vectors)
+            return batch_index, vectors
+
+        pending = [i for i in range(len(batches)) if i not in results]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="embed") as pool:
+            for batch_index, vectors in pool.map(run, pending):
+                results[batch_index] = vectors
+
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            "documents": len(texts),
+            "seconds": round(elapsed, 3),
+            "docs_per_sec": round(len(texts) / elapsed, 1) if elapsed else float(len(texts)),
+            "resumed_batches": resumed,
+        }
+        logger.info("embedding_pipeline_complete", job_id=job_id, **self.last_stats)
+
+        return [vector for i in range(len(batches)) for vector in results[i]]
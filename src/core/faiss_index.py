@@ -0,0 +1,78 @@
+# ==========================================
+# File: src/core/faiss_index.py
+# ==========================================
+from typing import Optional
+
+import faiss
+import numpy as np
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+
+FLAT_FACTORY = "Flat"
+
+# Serving mode: IO_FLAG_MMAP_IFC maps the codes of flat indexes straight from
+# the file (shared page cache). IO_FLAG_MMAP alone copies them into private
+# memory, i.e. one full copy of the index per worker.
+READ_ONLY_IO_FLAGS = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+
+
+def build_index(vectors: np.ndarray, factory: Optional[str] = None) -> faiss.Index:
+    """
+    Creates an (empty) FAISS index from an index_factory string and trains it if needed.
+
+    Args:
+        vectors (np.ndarray): float32 matrix (n, dim) used as the training sample.
+        factory (str, optional): e.g. "Flat", "HNSW32", "IVF1024,PQ16". Defaults to settings.
+
+    Returns:
+        faiss.Index: A trained index, ready for `add()`. Vectors are NOT added here.
+    """
+    factory = factory or settings.VECTOR_INDEX_FACTORY
+    dimension = vectors.shape[1]
+    index = faiss.index_factory(dimension, factory, faiss.METRIC_L2)
+
+    if not index.is_trained:
+        try:
+            index.train(vectors)
+        except RuntimeError as e:
+            # IVF needs >= nlist points and PQ >= 256; tiny corpora fall back to exact search
+            logger.warning("faiss_training_failed_using_flat", factory=factory, vectors=len(vectors), error=str(e))
+            index = faiss.index_factory(dimension, FLAT_FACTORY, faiss.METRIC_L2)
+
+    if _ivf(index) is not None:
+        # MMR reconstructs candidate vectors by id, which IVF only supports with a direct map
+        _ivf(index).make_direct_map()
+
+    configure_search(index)
+    return index
+
+
+def configure_search(index: faiss.Index, nprobe: Optional[int] = None, ef_search: Optional[int] = None) -> None:
+    """
+    Applies query-time knobs (nprobe for IVF, efSearch for HNSW). No-op for flat indexes.
+    These are not persisted by faiss, so they must be re-applied after every load.
+    """
+    ivf = _ivf(index)
+    if ivf is not None:
+        ivf.nprobe = nprobe or settings.VECTOR_INDEX_NPROBE
+
+    hnsw = getattr(faiss.downcast_index(index), "hnsw", None)
+    if hnsw is not None:
+        hnsw.efSearch = ef_search or settings.VECTOR_INDEX_EF_SEARCH
+
+
+def cosine_relevance(distance: float) -> float:
+    """
+    Converts a squared L2 distance (what every METRIC_L2 index returns) into
+    cosine similarity, assuming unit-length embeddings: ||a - b||^2 = 2 - 2cos.
+    SIMILARITY_THRESHOLD is expressed on this scale.
+    """
+    return 1.0 - distance / 2.0
+
+
+def _ivf(index: faiss.Index):
+    try:
+        return faiss.extract_index_ivf(index)
+    except RuntimeError:
+        return None
@@ -0,0 +1,243 @@
+# ==========================================
+# File: src/core/lexical_index.py
+# ==========================================
+import json
+import math
+import os
+import re
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from src.core.docstore import _ReadOnlyConnection
+
+# Stored next to index.faiss in each namespace directory
+LEXICAL_FILE_NAME = "lexical.json"
+# Same index as SQLite tables, queried lazily by read-only workers (see SQLiteBM25Index)
+LEXICAL_DB_FILE_NAME = "lexical.sqlite"
+
+_LEXICAL_DB_SCHEMA = """
+    CREATE TABLE meta (k1 REAL NOT NULL, b REAL NOT NULL, documents INTEGER NOT NULL, avg_length REAL NOT NULL);
+    CREATE TABLE documents (
+        position INTEGER PRIMARY KEY,
+        doc_id TEXT,
+        page_content TEXT NOT NULL,
+        metadata TEXT NOT NULL,
+        length INTEGER NOT NULL
+    );
+    CREATE TABLE postings (
+        term TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        tf INTEGER NOT NULL,
+        PRIMARY KEY (term, position)
+    ) WITHOUT ROWID;
+"""
+
+# Keeps hyphenated identifiers such as "inv-1638" as a single token
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for", "from", "have",
+    "hi", "hello", "how", "i", "if", "in", "is", "it", "me", "my", "of", "on", "or", "our",
+    "please", "the", "this", "to", "us", "we", "what", "when", "which", "will", "with", "you", "your",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens with stopwords removed."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _bm25_idf(documents: int, df: int) -> float:
+    return math.log(1 + (documents - df + 0.5) / (df + 0.5))
+
+
+def _confidence(idfs: Iterable[float], score: float) -> float:
+    """
+    Normalises a BM25 score to [0, 1]: 1.0 means the document matches every
+    query term at least once (at average length). Terms unknown to the index
+    count at full weight, so partially-matching questions score low.
+    """
+    ideal = sum(idfs)
+    return min(score / ideal, 1.0) if ideal else 0.0
+
+
+class BM25Index:
+    """
+    Minimal Okapi BM25 inverted index over a namespace's documents.
+    Lets exact-term questions ("Net 30", "late fee", "INV-1638") be answered
+    locally without a remote embedding call.
+
+    Held in memory (lexical.json) by writer processes; read-only workers
+    query the same index from lexical.sqlite instead (SQLiteBM25Index).
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.documents: List[Dict] = []              # {"id", "page_content", "metadata"}
+        self.doc_lengths: List[int] = []
+        self.postings: Dict[str, Dict[int, int]] = {}  # term -> {doc position: term frequency}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add_documents(self, documents: Iterable[Document]) -> None:
+        for doc in documents:
+            position = len(self.documents)
+            terms = Counter(tokenize(doc.page_content))
+            self.documents.append({"id": doc.id, "page_content": doc.page_content, "metadata": doc.metadata})
+            self.doc_lengths.append(sum(terms.values()))
+            for term, tf in terms.items():
+                self.postings.setdefault(term, {})[position] = tf
+
+    def _idf(self, term: str) -> float:
+        return _bm25_idf(len(self.documents), len(self.postings.get(term, ())))
+
+    def search(self, query: str, k: int = 4) -> List[Tuple[Document, float]]:
+        """
+        Returns up to k (Document, bm25_score) pairs, best first.
+        """
+        if not self.documents:
+            return []
+
+        avg_length = sum(self.doc_lengths) / len(self.doc_lengths) or 1.0
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf(term)
+            for position, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[position] / avg_length)
+                scores[position] = scores.get(position, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(self._to_document(position), score) for position, score in ranked]
+
+    def confidence(self, query: str, score: float) -> float:
+        """Normalised [0, 1] confidence of a search score (see _confidence)."""
+        return _confidence((self._idf(term) for term in set(tokenize(query))), score)
+
+    def _to_document(self, position: int) -> Document:
+        data = self.documents[position]
+        return Document(id=data["id"], page_content=data["page_content"], metadata=data["metadata"])
+
+    def save(self, folder_path: str) -> None:
+        """Writes lexical.json and lexical.sqlite atomically (temp file + rename)."""
+        target = Path(folder_path) / LEXICAL_FILE_NAME
+        tmp_path = target.with_name(f"{LEXICAL_FILE_NAME}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"k1": self.k1, "b": self.b, "documents": self.documents}, f, default=str)
+        os.replace(tmp_path, target)
+        self._save_sqlite(Path(folder_path) / LEXICAL_DB_FILE_NAME)
+
+    def _save_sqlite(self, target: Path) -> None:
+        tmp_path = target.with_name(f"{target.name}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(str(tmp_path))
+        try:
+            conn.executescript(_LEXICAL_DB_SCHEMA)
+            avg_length = sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+            conn.execute("INSERT INTO meta VALUES (?, ?, ?, ?)", (self.k1, self.b, len(self.documents), avg_length))
+            conn.executemany("INSERT INTO documents VALUES (?, ?, ?, ?, ?)", (
+                (position, d["id"], d["page_content"], json.dumps(d["metadata"], default=str), length)
+                for position, (d, length) in enumerate(zip(self.documents, self.doc_lengths))
+            ))
+            conn.executemany("INSERT INTO postings VALUES (?, ?, ?)", (
+                (term, position, tf) for term, postings in self.postings.items() for position, tf in postings.items()
+            ))
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, target)
+
+    @classmethod
+    def load(cls, folder_path: str) -> Optional["BM25Index"]:
+        """Rebuilds the index from lexical.json; None if the file does not exist."""
+        path = Path(folder_path) / LEXICAL_FILE_NAME
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(k1=data["k1"], b=data["b"])
+        index.add_documents(
+            Document(id=d["id"], page_content=d["page_content"], metadata=d["metadata"]) for d in data["documents"]
+        )
+        return index
+
+
+class SQLiteBM25Index:
+    """
+    Read-only BM25Index over lexical.sqlite: postings are looked up per query
+    term, so a worker parses nothing at startup and every worker shares the
+    file's pages through the OS cache instead of holding its own copy of the
+    index (what BM25Index.load would cost per process).
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = _ReadOnlyConnection(db_path)
+        self.k1, self.b, self._documents, self._avg_length = self._conn.get().execute(
+            "SELECT k1, b, documents, avg_length FROM meta").fetchone()
+
+    @classmethod
+    def open(cls, folder_path: str) -> Optional["SQLiteBM25Index"]:
+        """None if the generation has no lexical.sqlite (built before it existed)."""
+        path = Path(folder_path) / LEXICAL_DB_FILE_NAME
+        return cls(str(path)) if path.exists() else None
+
+    def __len__(self) -> int:
+        return self._documents
+
+    def _postings(self, term: str) -> List[Tuple[int, int, int]]:
+        return self._conn.get().execute(
+            "SELECT p.position, p.tf, d.length FROM postings p JOIN documents d USING (position) WHERE p.term = ?",
+            (term,)).fetchall()
+
+    def _idf(self, term: str) -> float:
+        df = self._conn.get().execute("SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+        return _bm25_idf(self._documents, df)
+
+    def search(self, query: str, k: int = 4) -> List[Tuple[Document, float]]:
+        """Same ranking as BM25Index.search."""
+        if not self._documents:
+            return []
+        avg_length = self._avg_length or 1.0
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings(term)
+            if not postings:
+                continue
+            idf = _bm25_idf(self._documents, len(postings))
+            for position, tf, length in postings:
+                norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores[position] = scores.get(position, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(self._to_document(position), score) for position, score in ranked]
+
+    def confidence(self, query: str, score: float) -> float:
+        return _confidence((self._idf(term) for term in set(tokenize(query))), score)
+
+    def _to_document(self, position: int) -> Document:
+        doc_id, page_content, metadata = self._conn.get().execute(
+            "SELECT doc_id, page_content, metadata FROM documents WHERE position = ?", (position,)).fetchone()
+        return Document(id=doc_id, page_content=page_content, metadata=json.loads(metadata))
+
+
+def reciprocal_rank_fusion(result_lists: List[List[Document]], k: int = 60) -> List[Document]:
+    """
+    Merges ranked lists with RRF: score(d) = sum(1 / (k + rank)). Documents are
+    matched by id (falling back to their text).
+    """
+    scores: Dict[str, float] = {}
+    by_key: Dict[str, Document] = {}
+    for results in result_lists:
+        for rank, doc in enumerate(results, 1):
+            key = doc.id or doc.page_content
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            by_key.setdefault(key, doc)
+    return [by_key[key] for key in sorted(scores, key=scores.get, reverse=True)]
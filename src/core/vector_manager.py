@@ -1,26 +1,69 @@
 # ==========================================
 # File: src/core/vector_manager.py
 # ==========================================
+import copy
 import os
 import shutil
+import threading
+import time
+import uuid
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, Iterable, Union
+
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_core.embeddings import Embeddings
 from langchain_core.documents import Document
-from langchain_openai import OpenAIEmbeddings
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 from config.settings import settings
+from src.core.docstore import DOCSTORE_FILE_NAME, SQLiteDocstore, SQLiteIndexMap, write_sqlite_docstore
+from src.core.faiss_index import READ_ONLY_IO_FLAGS, build_index, configure_search, cosine_relevance
+from src.core.lexical_index import BM25Index, SQLiteBM25Index
+from src.core.embedding_pipeline import EmbeddingPipeline
+from src.common.admission import embedding_admission, PRIORITY_HIGH
+
+# --- Namespaces ---
+# Each namespace is an independent FAISS index stored in its own sub-directory,
+# so policy lookups never scan (or compete with) the email archive.
+POLICY_NAMESPACE = "policy"
+ARCHIVE_NAMESPACE = "email_archive"
+NAMESPACES = (POLICY_NAMESPACE, ARCHIVE_NAMESPACE)
+
+# --- Generations ---
+# Every write produces a new, immutable "gen-<number>-<pid>" directory inside the
+# namespace; the CURRENT file names the live one and is replaced atomically (os.replace).
+# Numbers are nanosecond timestamps (at least the newest existing one + 1), so a
+# name is never reused, not even after reset() or pruning.
+CURRENT_FILE_NAME = "CURRENT"
+GENERATION_PREFIX = "gen-"
+
+
+def _generation_number(name: str) -> int:
+    """Ordering key of a generation directory name (-1 if it is not one)."""
+    number = name[len(GENERATION_PREFIX):].split("-", 1)[0]
+    return int(number) if name.startswith(GENERATION_PREFIX) and number.isdigit() else -1
 
 class VectorManager:
     """
     Singleton manager for the Vector Store (FAISS).
     Handles embedding model initialization and document indexing.
+
+    Readers never lock: each search grabs the namespace's current store (a
+    snapshot that is never mutated) and uses it to the end. Writers of a
+    namespace are serialized by its lock in _write_locks (different namespaces
+    embed in parallel), build the next version on a private copy, persist it
+    to a new generation directory and then swap it in under _load_lock, which
+    guards every copy-on-write update of the shared dicts.
     """
     _instance: Optional["VectorManager"] = None
-    _vectorstore: Optional[FAISS] = None
+    _vectorstores: Dict[str, FAISS] = {}
     _embeddings: Optional[Embeddings] = None
+    _load_lock = threading.Lock()
+    _write_locks: Dict[str, threading.Lock] = {ns: threading.Lock() for ns in NAMESPACES}
+    # Bumped on every swap so caches keyed on it invalidate themselves
+    _version: int = 0
 
     def __new__(cls):
         if cls._instance is None:
@@ -30,101 +73,508 @@ class VectorManager:
 
     def _initialize(self):
         """
-        Internal init: Selects embedding model and loads the FAISS index if it exists.
+        Internal init: Selects embedding model. Namespace indexes are loaded on first use
+        (see _ensure_loaded), so a process that only touches the policy index never
+        maps the email archive.
         """
         print(f"[{settings.APP_NAME}] Initializing Vector Manager (FAISS)...")
-        
+
         # 1. Load the appropriate Embedding Model
         self._embeddings = self._get_embedding_model()
 
-        # 2. Check if FAISS index exists on disk
-        index_path = Path(settings.VECTOR_STORE_PATH)
-        if index_path.exists() and (index_path / "index.faiss").exists():
-            print(f"[{settings.APP_NAME}] Loading existing FAISS index from: {index_path}")
-            try:
-                self._vectorstore = FAISS.load_local(
+        # 2. Namespace indexes are loaded lazily
+        self._vectorstores = {}
+        self._loaded_namespaces = set()
+        self._lexical: Dict[str, Optional[Union[BM25Index, SQLiteBM25Index]]] = {}
+        self._generations: Dict[str, Optional[str]] = {}
+        root_path = Path(settings.VECTOR_STORE_PATH)
+        if (root_path / "index.faiss").exists():
+            print(f"[{settings.APP_NAME}] WARNING: Ignoring legacy single index at {root_path}. Re-ingest to build namespaces.")
+
+    def _ensure_loaded(self, namespace: str):
+        """
+        Loads the namespace's FAISS index from disk the first time it is needed.
+        """
+        if namespace in self._loaded_namespaces:
+            return
+
+        with self._load_lock:
+            if namespace in self._loaded_namespaces:
+                return
+
+            store = self._load_store(namespace)
+            if store is not None:
+                self._vectorstores = {**self._vectorstores, namespace: store}
+            self._loaded_namespaces.add(namespace)
+
+    def _load_store(self, namespace: str) -> Optional[FAISS]:
+        """
+        Reads the namespace's live generation from disk (None if there is none)
+        and records which generation was loaded.
+        """
+        generation = self._current_generation(namespace)
+        index_path = self._index_dir(namespace)
+        self._generations[namespace] = generation
+        if not (index_path / "index.faiss").exists():
+            print(f"[{settings.APP_NAME}] No existing '{namespace}' index found. Starting fresh.")
+            return None
+
+        print(f"[{settings.APP_NAME}] Loading existing '{namespace}' FAISS index from: {index_path}")
+        try:
+            if self.read_only:
+                store = self._load_read_only(index_path)
+            else:
+                store = FAISS.load_local(
                     folder_path=str(index_path),
                     embeddings=self._embeddings,
                     allow_dangerous_deserialization=True # Safe because we created the index ourselves
                 )
-            except Exception as e:
-                print(f"[{settings.APP_NAME}] Failed to load index: {e}. Starting fresh.")
-                self._vectorstore = None
-        else:
-            print(f"[{settings.APP_NAME}] No existing index found. Starting fresh.")
-            self._vectorstore = None
+            # nprobe / efSearch are runtime-only and not stored in index.faiss
+            configure_search(store.index)
+            store.override_relevance_score_fn = cosine_relevance
+            return store
+        except Exception as e:
+            print(f"[{settings.APP_NAME}] Failed to load '{namespace}' index: {e}. Starting fresh.")
+            return None
+
+    def refresh(self) -> List[str]:
+        """
+        Swaps in generations published on disk by another process (e.g. a writer
+        serving reads from read-only workers). Returns the namespaces reloaded.
+        """
+        refreshed = []
+        with self._load_lock:
+            for namespace in list(self._loaded_namespaces):
+                if self._current_generation(namespace) == self._generations.get(namespace):
+                    continue
+                store = self._load_store(namespace)
+                vectorstores = dict(self._vectorstores)
+                if store is None:
+                    vectorstores.pop(namespace, None)
+                else:
+                    vectorstores[namespace] = store
+                self._vectorstores = vectorstores
+                self._lexical = {ns: idx for ns, idx in self._lexical.items() if ns != namespace}
+                refreshed.append(namespace)
+            if refreshed:
+                self._version += 1
+        return refreshed
+
+    def load_all(self):
+        """Eagerly loads every namespace (used by background warm-up)."""
+        for namespace in NAMESPACES:
+            self._ensure_loaded(namespace)
+
+    @property
+    def read_only(self) -> bool:
+        # A mounted artifact bundle is always served read-only
+        return settings.VECTOR_STORE_READ_ONLY or bool(settings.ARTIFACT_DIR)
+
+    @staticmethod
+    def _namespace_path(namespace: str) -> Path:
+        if namespace not in NAMESPACES:
+            raise ValueError(f"Unknown vector namespace: {namespace}")
+        return Path(settings.VECTOR_STORE_PATH) / namespace
+
+    def _current_generation(self, namespace: str) -> Optional[str]:
+        pointer = self._namespace_path(namespace) / CURRENT_FILE_NAME
+        try:
+            return pointer.read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _index_dir(self, namespace: str) -> Path:
+        """Directory of the live generation (the namespace dir itself for pre-generation indexes)."""
+        generation = self._current_generation(namespace)
+        namespace_path = self._namespace_path(namespace)
+        return namespace_path / generation if generation else namespace_path
+
+    def _next_generation_dir(self, namespace: str) -> Path:
+        namespace_path = self._namespace_path(namespace)
+        latest = max((_generation_number(p.name) for p in namespace_path.glob(f"{GENERATION_PREFIX}*")), default=0)
+        number = max(time.time_ns(), latest + 1)
+        return namespace_path / f"{GENERATION_PREFIX}{number:020d}-{os.getpid()}"
+
+    def _publish_generation(self, namespace: str, generation_dir: Path) -> None:
+        """Atomically points CURRENT at generation_dir and prunes old generations."""
+        namespace_path = self._namespace_path(namespace)
+        tmp_pointer = namespace_path / f"{CURRENT_FILE_NAME}.tmp"
+        tmp_pointer.write_text(generation_dir.name, encoding="utf-8")
+        os.replace(tmp_pointer, namespace_path / CURRENT_FILE_NAME)
+        self._generations[namespace] = generation_dir.name
+
+        # Keep the previous generation(s) for processes that have not refreshed yet
+        generations = sorted((p for p in namespace_path.glob(f"{GENERATION_PREFIX}*") if p.is_dir()),
+                             key=lambda p: _generation_number(p.name))
+        for old in generations[:-max(settings.VECTOR_STORE_KEEP_GENERATIONS, 1)]:
+            shutil.rmtree(old, ignore_errors=True)
+
+    def _load_read_only(self, index_path: Path) -> FAISS:
+        """
+        Serving mode: memory-maps index.faiss and reads documents lazily from
+        docstore.sqlite, so N workers share one copy of the index in the page cache.
+        Falls back to the pickled docstore for indexes saved before it existed.
+        """
+        import faiss
+
+        index = faiss.read_index(str(index_path / "index.faiss"), READ_ONLY_IO_FLAGS)
+
+        docstore_path = index_path / DOCSTORE_FILE_NAME
+        if not docstore_path.exists():
+            print(f"[{settings.APP_NAME}] WARNING: {DOCSTORE_FILE_NAME} missing, loading pickled docstore.")
+            return FAISS.load_local(
+                folder_path=str(index_path),
+                embeddings=self._embeddings,
+                allow_dangerous_deserialization=True,
+                io_flags=READ_ONLY_IO_FLAGS
+            )
+
+        return FAISS(
+            embedding_function=self._embeddings,
+            index=index,
+            docstore=SQLiteDocstore(str(docstore_path)),
+            index_to_docstore_id=SQLiteIndexMap(str(docstore_path))
+        )
 
     def _get_embedding_model(self) -> Embeddings:
         """
         Factory method for Embedding Models based on config.
         """
+        # Provider SDKs are imported here so importing this module stays cheap
         if settings.LLM_PROVIDER == "openai":
             if not settings.OPENAI_API_KEY:
                 raise ValueError("OpenAI API Key required for OpenAI Embeddings")
+            from langchain_openai import OpenAIEmbeddings
             return OpenAIEmbeddings(
                 model=settings.EMBEDDING_MODEL_NAME,
                 openai_api_key=settings.OPENAI_API_KEY
             )
-        
+
         elif settings.LLM_PROVIDER == "gemini":
             if not settings.GOOGLE_API_KEY:
                 raise ValueError("Google API Key required for Gemini Embeddings")
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
             return GoogleGenerativeAIEmbeddings(
-                model="models/embedding-001", 
+                model="models/embedding-001",
                 google_api_key=settings.GOOGLE_API_KEY
             )
-        
+
         else:
             raise ValueError(f"Unsupported LLM_PROVIDER: {settings.LLM_PROVIDER}")
 
-    def get_retriever(self, k: int = 4):
+    def _get_store(self, namespace: str) -> FAISS:
+        self._ensure_loaded(namespace)
+        # One read of the current snapshot; a concurrent swap never changes this object
+        store = self._vectorstores.get(namespace)
+        if store is None:
+            # If no docs are indexed yet, we can't create a retriever easily
+            print(f"[{settings.APP_NAME}] WARNING: Vector store '{namespace}' is empty.")
+            raise RuntimeError(f"Vector Store '{namespace}' is empty. Please ingest documents first.")
+        return store
+
+    def has_documents(self, namespace: str) -> bool:
+        self._ensure_loaded(namespace)
+        return namespace in self._vectorstores
+
+    @property
+    def version(self) -> int:
+        """Index version; changes whenever a new snapshot is swapped in (add, reset, refresh)."""
+        return self._version
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embeds a query with the configured model (one remote call for hosted providers)."""
+        with embedding_admission.slot(PRIORITY_HIGH):
+            return self._embeddings.embed_query(text)
+
+    def search_by_vector(self, embedding: List[float], k: int = 4, namespace: str = POLICY_NAMESPACE,
+                         score_threshold: Optional[float] = None) -> List[Document]:
         """
-        Returns a retriever object for the RAG chain.
+        MMR search with a precomputed query embedding (same ranking as get_retriever).
+        With a score_threshold, only chunks whose cosine similarity to the query
+        clears it are returned (possibly none).
         """
-        if not self._vectorstore:
-            # If no docs are indexed yet, we can't create a retriever easily
-            # We return a dummy empty retriever or raise an error based on preference
-            print(f"[{settings.APP_NAME}] WARNING: Vector store is empty.")
-            # Creating a dummy store just to return a valid retriever is a common pattern
-            # but usually it's better to ensure data is loaded first.
-            raise RuntimeError("Vector Store is empty. Please ingest documents first.")
-            
-        return self._vectorstore.as_retriever(
+        store = self._get_store(namespace)
+        fetch_k = max(settings.MMR_FETCH_K, k)
+        if score_threshold is None:
+            return store.max_marginal_relevance_search_by_vector(
+                embedding, k=k, fetch_k=fetch_k, lambda_mult=settings.MMR_LAMBDA_MULT
+            )
+
+        scored = store.max_marginal_relevance_search_with_score_by_vector(
+            embedding, k=k, fetch_k=fetch_k, lambda_mult=settings.MMR_LAMBDA_MULT
+        )
+        return [doc for doc, distance in scored if cosine_relevance(distance) >= score_threshold]
+
+    def filter_by_similarity(self, embedding: List[float], docs: List[Document], score_threshold: float,
+                             namespace: str = POLICY_NAMESPACE) -> List[Document]:
+        """
+        Keeps the docs (e.g. BM25 hits) whose cosine similarity to the query
+        clears score_threshold. Scores come from one similarity search over the
+        MMR_FETCH_K nearest chunks; a doc outside them is dropped.
+        """
+        if not docs:
+            return []
+        store = self._get_store(namespace)
+        scored = store.similarity_search_with_score_by_vector(embedding, k=max(settings.MMR_FETCH_K, len(docs)))
+        passing = {doc.id or doc.page_content for doc, distance in scored
+                   if cosine_relevance(distance) >= score_threshold}
+        return [doc for doc in docs if (doc.id or doc.page_content) in passing]
+
+    def _get_lexical(self, namespace: str) -> Optional[Union[BM25Index, SQLiteBM25Index]]:
+        """
+        Loads the namespace's BM25 index on first use: read-only workers query
+        lexical.sqlite in place, writers load lexical.json into memory. Indexes
+        built before it existed are backfilled from the FAISS docstore in writer processes.
+        """
+        if namespace in self._lexical:
+            return self._lexical[namespace]
+
+        index_path = self._index_dir(namespace)
+        lexical = SQLiteBM25Index.open(str(index_path)) if self.read_only else None
+        if lexical is None:
+            lexical = BM25Index.load(str(index_path))
+        if lexical is None and not self.read_only and self.has_documents(namespace):
+            store = self._vectorstores[namespace]
+            lexical = BM25Index()
+            lexical.add_documents(store.docstore.search(doc_id) for doc_id in store.index_to_docstore_id.values())
+            lexical.save(str(index_path))
+        with self._load_lock:
+            self._lexical = {**self._lexical, namespace: lexical}
+        return lexical
+
+    def lexical_search(self, query: str, k: int = 4,
+                       namespace: str = POLICY_NAMESPACE) -> Tuple[List[Document], float]:
+        """
+        Local BM25 search (no embedding call).
+
+        Returns:
+            Tuple[List[Document], float]: ranked documents and the normalised
+            confidence (0-1) of the best match.
+        """
+        lexical = self._get_lexical(namespace)
+        if not lexical:
+            return [], 0.0
+        hits = lexical.search(query, k=k)
+        if not hits:
+            return [], 0.0
+        return [doc for doc, _ in hits], lexical.confidence(query, hits[0][1])
+
+    def get_retriever(self, k: int = 4, namespace: str = POLICY_NAMESPACE,
+                      score_threshold: Optional[float] = None):
+        """
+        Returns a retriever object for the RAG chain, scoped to a single namespace.
+        MMR by default; with a score_threshold (e.g. settings.SIMILARITY_THRESHOLD)
+        it returns only chunks above the cutoff.
+        """
+        store = self._get_store(namespace)
+        if score_threshold is not None:
+            return store.as_retriever(
+                search_type="similarity_score_threshold",
+                search_kwargs={"k": k, "score_threshold": score_threshold}
+            )
+        return store.as_retriever(
             search_type="mmr",
-            search_kwargs={"k": k}
-            # search_kwargs={"k": k, "score_threshold": settings.SIMILARITY_THRESHOLD}
+            search_kwargs={"k": k, "fetch_k": max(settings.MMR_FETCH_K, k), "lambda_mult": settings.MMR_LAMBDA_MULT}
         )
 
-    def add_documents(self, documents: List[Document]):
+    def search_vendor_archive(self, query: str, vendor_id: str, k: int = 4) -> List[Document]:
         """
-        Indexes new documents into FAISS and saves to disk.
+        Similarity search over the email archive restricted to one vendor.
+        FAISS filters metadata after the ANN lookup, so we over-fetch candidates.
         """
-        if not documents:
-            return
+        store = self._get_store(ARCHIVE_NAMESPACE)
+        return store.similarity_search_by_vector(
+            self.embed_query(query),
+            k=k,
+            filter={"vendor_id": vendor_id},
+            fetch_k=settings.VENDOR_ARCHIVE_FETCH_K
+        )
 
-        print(f"Adding {len(documents)} documents to FAISS...")
-        
-        if self._vectorstore is None:
-            # Create new index
-            self._vectorstore = FAISS.from_documents(documents, self._embeddings)
-        else:
-            # Add to existing index
-            self._vectorstore.add_documents(documents)
-        
-        # Explicitly save to disk for FAISS
-        self._vectorstore.save_local(settings.VECTOR_STORE_PATH)
-        print(f"FAISS index saved to {settings.VECTOR_STORE_PATH}")
-
-    def reset(self):
-        """
-        DANGER: Clears the vector store.
-        """
-        if os.path.exists(settings.VECTOR_STORE_PATH):
-            shutil.rmtree(settings.VECTOR_STORE_PATH)
-            print("Deleted existing vector store on disk.")
-            
-        self._vectorstore = None
-        self._initialize()
-
-# Global Accessor
-vector_manager = VectorManager()
\ No newline at end of file
+    def add_documents(self, documents: List[Document], namespace: str = POLICY_NAMESPACE):
+        """
+        Indexes new documents into the namespace's FAISS index and saves to disk.
+        """
+        self.add_document_batches([documents], namespace=namespace)
+
+    def add_document_batches(self, batches: Iterable[List[Document]], namespace: str = POLICY_NAMESPACE,
+                             replace: bool = False) -> int:
+        """
+        Streams batches of documents into the namespace and saves to disk once at the end,
+        so large ingests don't rewrite the index after every batch. With replace=True the
+        new generation contains only these documents (a full re-index); searches keep
+        using the previous one until it is swapped in.
+
+        Returns:
+            int: Number of documents indexed.
+        """
+        if self.read_only:
+            raise RuntimeError("Vector Store is in read-only serving mode. Run ingestion in a writer process.")
+
+        with self._write_locks[namespace]:
+            self._ensure_loaded(namespace)
+            # Private working copies: searches keep using the published snapshot meanwhile
+            current = None if replace else self._vectorstores.get(namespace)
+            store = self._clone_store(current) if current is not None else None
+            lexical = (None if replace else copy.deepcopy(self._get_lexical(namespace))) or BM25Index()
+            pipeline = EmbeddingPipeline(self._embeddings)
+            checkpoint_ids = []
+            total = 0
+
+            for documents in batches:
+                if not documents:
+                    continue
+                store, checkpoint_id = self._add_batch(documents, namespace, store, lexical, pipeline)
+                checkpoint_ids.append(checkpoint_id)
+                total += len(documents)
+
+            if not total:
+                return 0
+
+            # Persist to a fresh generation directory; the live one is never rewritten
+            generation_dir = self._next_generation_dir(namespace)
+            generation_dir.mkdir(parents=True)
+            store.save_local(str(generation_dir))
+            # Lazily-read docstore for read-only workers (see _load_read_only)
+            write_sqlite_docstore(store, str(generation_dir))
+            lexical.save(str(generation_dir))
+            self._publish_generation(namespace, generation_dir)
+
+            # Swap: new searches see the new snapshot, in-flight ones finish on the old
+            with self._load_lock:
+                self._vectorstores = {**self._vectorstores, namespace: store}
+                self._lexical = {**self._lexical, namespace: lexical}
+                self._version += 1
+
+            # Vectors are persisted; embedding checkpoints are no longer needed
+            for checkpoint_id in checkpoint_ids:
+                pipeline.clear_checkpoint(checkpoint_id)
+            print(f"FAISS index saved to {generation_dir} ({total} documents added)")
+            return total
+
+    def _add_batch(self, documents: List[Document], namespace: str, store: Optional[FAISS],
+                   lexical: BM25Index, pipeline: EmbeddingPipeline) -> Tuple[FAISS, str]:
+        """
+        Embeds one batch and adds it to the writer's working copies of the FAISS and
+        BM25 indexes. Returns the (possibly new) store and the batch's checkpoint id.
+        """
+        # FAISS and the BM25 index must agree on ids for rank fusion
+        documents = [doc if doc.id else doc.model_copy(update={"id": str(uuid.uuid4())}) for doc in documents]
+        print(f"Adding {len(documents)} documents to FAISS namespace '{namespace}'...")
+
+        # Batched, rate-limited, checkpointed embedding (resumes after a crash)
+        texts = [doc.page_content for doc in documents]
+        embeddings = pipeline.embed_documents(texts)
+
+        if store is None:
+            # Create new index (type from VECTOR_INDEX_FACTORY, trained on this first batch)
+            store = self._create_store(embeddings)
+
+        store.add_embeddings(
+            list(zip(texts, embeddings)),
+            metadatas=[doc.metadata for doc in documents],
+            ids=[doc.id for doc in documents]
+        )
+
+        # Local lexical index for exact-term lookups (see lexical_search)
+        lexical.add_documents(documents)
+        print(f"Embedded at {pipeline.last_stats.get('docs_per_sec')} docs/sec")
+        return store, pipeline.checkpoint_id(texts)
+
+    def _clone_store(self, store: FAISS) -> FAISS:
+        """Deep copy of a (writer-loaded, in-memory) store for copy-on-write updates."""
+        import faiss
+
+        index = faiss.clone_index(store.index)
+        configure_search(index)
+        return FAISS(
+            embedding_function=self._embeddings,
+            index=index,
+            docstore=InMemoryDocstore(dict(store.docstore._dict)),
+            index_to_docstore_id=dict(store.index_to_docstore_id),
+            relevance_score_fn=cosine_relevance
+        )
+
+    def _create_store(self, embeddings: List[List[float]]) -> FAISS:
+        """
+        Builds an empty FAISS store around a configurable index instead of
+        FAISS.from_documents, which always creates an exact IndexFlatL2.
+        """
+        index = build_index(np.array(embeddings, dtype=np.float32))
+        return FAISS(
+            embedding_function=self._embeddings,
+            index=index,
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={},
+            relevance_score_fn=cosine_relevance
+        )
+
+    def reset(self, namespace: Optional[str] = None):
+        """
+        DANGER: Clears the vector store (a single namespace, or all of them).
+
+        Publishes an empty generation instead of deleting the live one, so
+        other processes still reading it switch over on their next refresh.
+        """
+        if self.read_only:
+            raise RuntimeError("Vector Store is in read-only serving mode. Reset it from a writer process.")
+
+        namespaces = [namespace] if namespace else list(NAMESPACES)
+        with ExitStack() as stack:
+            # Fixed order, so two resets can never deadlock
+            for ns in namespaces:
+                stack.enter_context(self._write_locks[ns])
+
+            # Swap in empty snapshots first; searches already running keep their in-memory store
+            with self._load_lock:
+                self._vectorstores = {ns: s for ns, s in self._vectorstores.items() if ns not in namespaces}
+                self._lexical = {ns: idx for ns, idx in self._lexical.items() if ns not in namespaces}
+                for ns in namespaces:
+                    self._generations[ns] = None
+                self._version += 1
+
+            for ns in namespaces:
+                generation_dir = self._next_generation_dir(ns)
+                generation_dir.mkdir(parents=True)
+                self._publish_generation(ns, generation_dir)
+                print(f"Published empty '{ns}' generation: {generation_dir}")
+
+class LazyVectorManager:
+    """
+    Import-time stand-in for the VectorManager singleton.
+    Importing executor nodes, services or the CLI no longer builds an embeddings
+    client or touches FAISS; the real manager is created on the first attribute
+    access (retrieval or ingest), or ahead of time via warm_up().
+    """
+
+    def __init__(self):
+        self._manager: Optional[VectorManager] = None
+        self._lock = threading.Lock()
+
+    def _get(self) -> VectorManager:
+        if self._manager is None:
+            with self._lock:
+                if self._manager is None:
+                    self._manager = VectorManager()
+        return self._manager
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._manager is not None
+
+    def warm_up(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Creates the manager and loads every namespace index, optionally in a daemon thread
+        so server startup does not wait for it.
+        """
+        if not background:
+            self._get().load_all()
+            return None
+        thread = threading.Thread(target=lambda: self._get().load_all(), name="vector-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+
+# Global Accessor (lazy: nothing is loaded until first use)
+vector_manager = LazyVectorManager()
@@ -42,4 +42,16 @@ class ConversationRow(BaseModel):
     thread_id: str
     role: str  # 'user' or 'assistant'
     content: str
-    created_at: Optional[datetime] = None
\ No newline at end of file
+    created_at: Optional[datetime] = None
+
+class VendorChange(BaseModel):
+    """
+    Represents a row in the 'vendor_change_log' outbox table.
+    """
+    id: int
+    vendor_id: int
+    vendor_id_str: Optional[str] = None  # None for vendors that are not in the CSV
+    field: str
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    changed_at: Optional[datetime] = None
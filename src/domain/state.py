@@ -38,5 +38,10 @@ class GraphState(TypedDict):
     generated_email: str     # The draft response
     final_action: str        # Debug/Audit string of what happened
     
+    # --- Batch Prefetch ---
+    # Looked up in bulk for a whole /chat/batch: "vendor" (Vendor or None) replaces
+    # the SecurityNode query, "history" (if present) the MemoryNode query
+    prefetched: Optional[dict]
+
     # --- Control Flow ---
     error_message: Optional[str] # If something goes wrong (e.g., SQL failure)
\ No newline at end of file
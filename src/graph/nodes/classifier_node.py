@@ -5,6 +5,7 @@ import logging
 from langchain_core.messages import SystemMessage
 from langchain_core.output_parsers import StrOutputParser
 
+from src.common.admission import llm_admission, PRIORITY_NORMAL
 from src.core.llm_factory import LLMFactory
 from src.domain.state import GraphState
 from config.prompt_templates import CLASSIFIER_SYSTEM_PROMPT
@@ -34,7 +35,8 @@ def classify_email(state: GraphState) -> GraphState:
     # 3. Invoke
     # StrOutputParser cleans up the result, ensuring we just get the string text
     chain = llm | StrOutputParser()
-    response = chain.invoke(messages)
+    with llm_admission.slot(PRIORITY_NORMAL):
+        response = chain.invoke(messages)
     
     # 4. Normalize Output
     intent = response.strip().upper()
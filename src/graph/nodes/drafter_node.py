@@ -5,6 +5,7 @@ import logging
 from langchain_core.messages import SystemMessage
 from langchain_core.output_parsers import StrOutputParser
 
+from src.common.admission import llm_admission, PRIORITY_HIGH
 from src.core.llm_factory import LLMFactory
 from src.domain.state import GraphState
 from config.prompt_templates import DRAFTER_SYSTEM_PROMPT
@@ -51,7 +52,9 @@ def draft_response(state: GraphState) -> GraphState:
     messages = [SystemMessage(content=system_instruction)] + state["messages"]
     
     chain = llm | StrOutputParser()
-    response = chain.invoke(messages)
+    # The request already passed classification: finish it before starting new ones
+    with llm_admission.slot(PRIORITY_HIGH):
+        response = chain.invoke(messages)
     
     logger.info("Draft generated successfully.")
     
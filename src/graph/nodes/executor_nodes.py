@@ -7,11 +7,17 @@ from langchain_core.messages import SystemMessage
 from src.domain.state import GraphState
 from src.services.vendor_service import vendor_service
 from src.services.rag_service import rag_service
-from src.services.data_loader import data_loader # Import DataLoader
+from src.services.csv_exporter import csv_exporter
+from src.services.readiness import readiness, VECTOR
+from src.common.metrics import metrics
+from src.common.admission import llm_admission, PRIORITY_HIGH
+from src.common.exceptions import ServiceOverloadedException
 from src.core.llm_factory import LLMFactory
 from config.logging_config import GLOBAL_LOGGER as logger
 from config.prompt_templates import EXTRACTION_SYSTEM_PROMPT
 
+POLICY_INDEX_LOADING = "The policy knowledge base is still loading. Policy details are temporarily unavailable; ask the vendor to check back shortly."
+
 
 def _extract_entity(history: list, query: str) -> str:
     """Helper: Uses LLM to extract specific data."""
@@ -20,7 +26,9 @@ def _extract_entity(history: list, query: str) -> str:
         SystemMessage(content=EXTRACTION_SYSTEM_PROMPT),
         SystemMessage(content=f"Extract: {query}")
     ] + history
-    return llm.invoke(messages).content.strip().replace("'", "").replace('"', "")
+    with llm_admission.slot(PRIORITY_HIGH):
+        response = llm.invoke(messages)
+    return response.content.strip().replace("'", "").replace('"', "")
 
 # ------------------------------------------------------------------------------
 # Node 1: Execute Status Check (Full Data Context)
@@ -82,7 +90,7 @@ def execute_status(state: GraphState) -> GraphState:
 # ------------------------------------------------------------------------------
 def execute_update(state: GraphState) -> GraphState:
     """
-    Graph Node: Updates vendor contact info in SQL AND Syncs to CSV.
+    Graph Node: Updates vendor contact info in SQL AND queues a CSV sync.
     """
     log = logger.bind(node="execute_update")
     vendor = state["vendor_details"]
@@ -110,11 +118,13 @@ def execute_update(state: GraphState) -> GraphState:
         # 1. Update SQL Database
         result = vendor_service.update_vendor_contact(vendor.id, field, value)
         
-        # 2. NEW: If successful, Sync changes back to CSV
+        # 2. If successful, queue the CSV sync (debounced, off the request path)
         if "Successfully updated" in result:
-            data_loader.sync_db_to_csv()
-            log.info("triggered_csv_sync")
+            csv_exporter.mark_dirty(vendor.id)
+            log.info("queued_csv_sync")
         
+    except ServiceOverloadedException:
+        raise
     except Exception as e:
         log.warning("update_parsing_failed", error=str(e))
         result = "I could not clarify what you want to update. Please specify Field and Value."
@@ -133,6 +143,15 @@ def execute_policy(state: GraphState) -> GraphState:
     Graph Node: Retrieves policy documents from Vector Store.
     """
     log = logger.bind(node="execute_policy")
+    if not readiness.is_ready(VECTOR):
+        # Don't block on an index that is still being built: answer without policy context
+        log.info("policy_retrieval_degraded", vector=readiness.snapshot()[VECTOR]["state"])
+        metrics.inc("policy_degraded_responses")
+        return {
+            "rag_chunks": POLICY_INDEX_LOADING,
+            "final_action": "Policy Index Not Ready"
+        }
+
     log.info("executing_policy_retrieval")
     query = state["email_input"].body
     context_chunks = rag_service.retrieve_policy_context(query)
@@ -25,8 +25,12 @@ def load_memory(state: GraphState) -> GraphState:
     thread_id = email_input.thread_id
     current_message_content = email_input.body
     
-    # 1. Fetch historical context (from SQL)
-    history = session_service.get_chat_history(thread_id, limit=5)
+    # 1. Fetch historical context (from SQL, unless a batch already loaded it)
+    prefetched = state.get("prefetched") or {}
+    if "history" in prefetched:
+        history = prefetched["history"]
+    else:
+        history = session_service.get_chat_history(thread_id, limit=5)
     
     # 2. Add the CURRENT incoming email to the list
     # Note: We don't save to SQL here; we save at the End/SaveNode. 
@@ -22,7 +22,11 @@ def security_check(state: GraphState) -> GraphState:
     log = logger.bind(node="security_node", email=sender_email)
     log.info("executing_node")
     
-    vendor = auth_service.verify_vendor(sender_email)
+    prefetched = state.get("prefetched") or {}
+    if "vendor" in prefetched:
+        vendor = prefetched["vendor"]
+    else:
+        vendor = auth_service.verify_vendor(sender_email)
     
     if vendor:
         log.info("security_check_passed", vendor_id=vendor.id)
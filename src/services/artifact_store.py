@@ -0,0 +1,211 @@
+# ==========================================
+# File: src/services/artifact_store.py
+# ==========================================
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.exceptions import ArtifactVerificationException, ConfigurationException
+from src.core.db_manager import db_manager
+from src.core.vector_manager import CURRENT_FILE_NAME, NAMESPACES
+from src.services.ingest_state import file_sha256
+
+MANIFEST_FILE_NAME = "manifest.json"
+FORMAT_VERSION = 1
+# Files SQLite keeps next to a database (WAL mode and rollback journal)
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+
+
+class ArtifactFile(BaseModel):
+    size: int
+    sha256: str
+
+
+class ArtifactManifest(BaseModel):
+    """Describes one prebuilt bundle: what it was built from and the digest of every file."""
+    format_version: int = FORMAT_VERSION
+    version: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    schema_sha256: str
+    sql_db: str                           # bundle-relative path of the SQLite DB
+    vector_store: str                     # bundle-relative path of the namespace root
+    embedding_provider: str
+    embedding_model: str
+    generations: Dict[str, Optional[str]] = Field(default_factory=dict, description="namespace -> live generation")
+    sources: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="ingest_all result per source")
+    files: Dict[str, ArtifactFile] = Field(default_factory=dict)
+
+
+class ArtifactStore:
+    """
+    Versioned, checksummed bundles of a fully ingested SQLite DB and FAISS index.
+
+    build() runs the normal ingestion once (e.g. in CI) into
+    <out_dir>/<version>/. A server started with ARTIFACT_DIR pointing at a
+    bundle calls install(): the manifest and files are verified, the FAISS
+    index is served read-only straight from the (possibly read-only) mount
+    and the DB is copied to the writable SQL_DB_PATH. No embeddings are
+    computed on boot.
+    """
+
+    @property
+    def schema_path(self) -> Path:
+        return settings.BASE_DIR / "data/sql/schema.sql"
+
+    # --- Build ---
+
+    def build(self, out_dir: Union[str, Path], version: Optional[str] = None) -> ArtifactManifest:
+        """
+        Ingests every enabled source into a new bundle. Run it in a fresh process
+        (see scripts/build_artifacts.py): it redirects DATA_DIR for the duration.
+
+        Raises:
+            ConfigurationException: The bundle already exists or a source failed to load.
+        """
+        from src.services.data_loader import data_loader
+
+        version = version or datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        bundle = Path(out_dir) / version
+        if bundle.exists():
+            raise ConfigurationException(f"Artifact bundle {bundle} already exists")
+        staging = Path(out_dir) / f".{version}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+
+        overrides = {"DATA_DIR": str(staging), "ARTIFACT_DIR": None, "VECTOR_STORE_READ_ONLY": False,
+                     "INGEST_SKIP_UNCHANGED": False}
+        previous = {name: getattr(settings, name) for name in overrides}
+        start = time.perf_counter()
+        try:
+            for name, value in overrides.items():
+                setattr(settings, name, value)
+            Path(settings.SQL_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.schema_path, "r") as f, db_manager.get_connection() as conn:
+                conn.executescript(f.read())
+
+            results = data_loader.ingest_all()
+            failed = {name: r.get("error") for name, r in results.items() if r["status"] == "failed"}
+            if failed:
+                raise ConfigurationException(f"Artifact build failed, sources did not load: {failed}")
+
+            # Crash-recovery state of the embedding pipeline is not part of the artifact
+            shutil.rmtree(Path(settings.EMBEDDING_CHECKPOINT_DIR), ignore_errors=True)
+            vector_root = Path(settings.VECTOR_STORE_PATH)
+            manifest = ArtifactManifest(
+                version=version,
+                schema_sha256=file_sha256(self.schema_path),
+                sql_db=Path(settings.SQL_DB_PATH).relative_to(staging).as_posix(),
+                vector_store=vector_root.relative_to(staging).as_posix(),
+                embedding_provider=settings.LLM_PROVIDER,
+                embedding_model=settings.EMBEDDING_MODEL_NAME,
+                generations={ns: self._read_generation(vector_root / ns) for ns in NAMESPACES},
+                sources=results,
+                files=self._digest(staging),
+            )
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        finally:
+            for name, value in previous.items():
+                setattr(settings, name, value)
+
+        (staging / MANIFEST_FILE_NAME).write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+        os.replace(staging, bundle)
+        logger.info("artifact_built", path=str(bundle), version=version, files=len(manifest.files),
+                    seconds=round(time.perf_counter() - start, 3))
+        return manifest
+
+    @staticmethod
+    def _read_generation(namespace_dir: Path) -> Optional[str]:
+        pointer = namespace_dir / CURRENT_FILE_NAME
+        return pointer.read_text(encoding="utf-8").strip() if pointer.exists() else None
+
+    @staticmethod
+    def _digest(root: Path) -> Dict[str, ArtifactFile]:
+        return {
+            path.relative_to(root).as_posix(): ArtifactFile(size=path.stat().st_size, sha256=file_sha256(path))
+            for path in sorted(root.rglob("*")) if path.is_file() and path.name != MANIFEST_FILE_NAME
+        }
+
+    # --- Boot ---
+
+    def load_manifest(self, bundle: Union[str, Path]) -> ArtifactManifest:
+        path = Path(bundle) / MANIFEST_FILE_NAME
+        if not path.exists():
+            raise ArtifactVerificationException(f"No {MANIFEST_FILE_NAME} in artifact bundle {bundle}")
+        return ArtifactManifest.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def verify(self, bundle: Optional[Union[str, Path]] = None, checksums: Optional[bool] = None) -> ArtifactManifest:
+        """
+        Checks that the bundle was built for this code and configuration and that
+        every file is intact.
+
+        Raises:
+            ArtifactVerificationException: On any mismatch.
+        """
+        bundle = Path(bundle or settings.ARTIFACT_DIR)
+        checksums = settings.ARTIFACT_VERIFY_CHECKSUMS if checksums is None else checksums
+        manifest = self.load_manifest(bundle)
+
+        if manifest.format_version != FORMAT_VERSION:
+            raise ArtifactVerificationException(f"Unsupported artifact format {manifest.format_version}")
+        if (manifest.embedding_provider, manifest.embedding_model) != (settings.LLM_PROVIDER, settings.EMBEDDING_MODEL_NAME):
+            # Query embeddings from another model are not comparable with the index
+            raise ArtifactVerificationException(
+                f"Artifact embeddings are {manifest.embedding_provider}/{manifest.embedding_model}, "
+                f"server uses {settings.LLM_PROVIDER}/{settings.EMBEDDING_MODEL_NAME}"
+            )
+        if manifest.schema_sha256 != file_sha256(self.schema_path):
+            raise ArtifactVerificationException("Artifact was built for a different schema.sql; rebuild it")
+        expected_store = f"vector_store/{settings.VECTOR_STORE_DIR_NAME}"
+        if manifest.vector_store != expected_store:
+            raise ArtifactVerificationException(
+                f"Artifact vector store is {manifest.vector_store}, server expects {expected_store}")
+
+        for relative, expected in manifest.files.items():
+            path = bundle / relative
+            if not path.is_file() or path.stat().st_size != expected.size:
+                raise ArtifactVerificationException(f"Artifact file {relative} is missing or truncated")
+            if checksums and file_sha256(path) != expected.sha256:
+                raise ArtifactVerificationException(f"Artifact file {relative} failed its checksum")
+        return manifest
+
+    def install(self, bundle: Optional[Union[str, Path]] = None) -> ArtifactManifest:
+        """
+        Verifies the bundle and copies its DB to SQL_DB_PATH (temp file + rename).
+        A copy already installed from the same version is kept, with any writes
+        made since.
+        """
+        start = time.perf_counter()
+        bundle = Path(bundle or settings.ARTIFACT_DIR)
+        manifest = self.verify(bundle)
+
+        target = Path(settings.SQL_DB_PATH)
+        marker = target.with_name(f"{target.name}.artifact")
+        source = manifest.files[manifest.sql_db]
+        installed = json.loads(marker.read_text(encoding="utf-8")) if marker.exists() and target.exists() else {}
+        copied = installed != {"version": manifest.version, "sha256": source.sha256}
+        if copied:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(f"{target.name}.tmp")
+            shutil.copyfile(bundle / manifest.sql_db, tmp_path)
+            # The previous copy's WAL/shared-memory files would be replayed
+            # against the new DB (SQL_WAL_MODE): drop them with it
+            for suffix in SQLITE_SIDECAR_SUFFIXES:
+                Path(f"{target}{suffix}").unlink(missing_ok=True)
+            os.replace(tmp_path, target)
+            marker.write_text(json.dumps({"version": manifest.version, "sha256": source.sha256}), encoding="utf-8")
+
+        logger.info("artifact_installed", version=manifest.version, path=str(bundle), db_copied=copied,
+                    seconds=round(time.perf_counter() - start, 3))
+        return manifest
+
+# Singleton Instance
+artifact_store = ArtifactStore()
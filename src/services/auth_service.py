@@ -1,7 +1,7 @@
 # ==========================================
 # File: src/services/auth_service.py
 # ==========================================
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from src.core.db_manager import db_manager
 from src.domain.models import Vendor
 from config.settings import settings
@@ -14,9 +14,15 @@ class AuthService:
     acts as the 'Gatekeeper' for the AI Agent.
     """
     
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """Lookup key of an address: vendors.email is matched as LOWER(email), unique (idx_vendors_email_nocase)."""
+        return email.strip().lower()
+
     def verify_vendor(self, sender_email: str) -> Optional[Vendor]:
         """
         Checks if the email belongs to an authorized vendor in the SQL database.
+        Emails match case-insensitively (see normalize_email).
         
         Args:
             sender_email (str): The email address extracted from the incoming message.
@@ -26,12 +32,12 @@ class AuthService:
         """
         log = logger.bind(service="AuthService", email=sender_email)
         
-        query = "SELECT * FROM vendors WHERE email = ? LIMIT 1"
+        query = "SELECT * FROM vendors WHERE LOWER(email) = ?"
         
         try:
             with db_manager.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(query, (sender_email,))
+                cursor.execute(query, (self.normalize_email(sender_email),))
                 row = cursor.fetchone()
                 
                 if row:
@@ -47,4 +53,30 @@ class AuthService:
             log.error("auth_check_error", error=str(e))
             return None
 
+    def verify_vendors(self, sender_emails: Iterable[str]) -> Dict[str, Optional[Vendor]]:
+        """
+        Bulk verify_vendor: one query for every sender of a batch.
+
+        Returns:
+            Dict[str, Optional[Vendor]]: Each (normalized) email -> Vendor, or None if unknown.
+        """
+        emails = sorted({self.normalize_email(email) for email in sender_emails})
+        vendors: Dict[str, Optional[Vendor]] = dict.fromkeys(emails)
+        if not emails:
+            return vendors
+
+        query = f"SELECT * FROM vendors WHERE LOWER(email) IN ({','.join('?' * len(emails))})"
+        try:
+            with db_manager.get_connection() as conn:
+                for row in conn.execute(query, emails):
+                    email = self.normalize_email(row["email"])
+                    vendors[email] = Vendor(**dict(row))
+        except Exception as e:
+            logger.error("auth_check_error", service="AuthService", senders=len(emails), error=str(e))
+            return dict.fromkeys(emails)
+
+        logger.info("bulk_access_check", senders=len(emails),
+                    granted=sum(vendor is not None for vendor in vendors.values()))
+        return vendors
+
 auth_service = AuthService()
\ No newline at end of file
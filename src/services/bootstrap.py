@@ -0,0 +1,264 @@
+# ==========================================
+# File: src/services/bootstrap.py
+# ==========================================
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.exceptions import ConfigurationException
+from src.common.file_lock import ingest_lock
+from src.core.db_manager import db_manager
+from src.core.vector_manager import vector_manager
+from src.services.artifact_store import artifact_store
+from src.services.data_loader import data_loader
+from src.services.readiness import readiness, ReadinessRegistry, SQL, VECTOR, SUBSYSTEMS, USABLE_STATES
+
+# Written by the bootstrap leader when it finishes, read by the workers that waited for it
+STATE_FILE_NAME = "bootstrap.json"
+
+# Subsystems each ingest source has to finish loading before they are ready
+SOURCE_SUBSYSTEMS = {
+    "ledger": (SQL,),
+    "library": (VECTOR,),
+    "policy": (VECTOR,),
+    "final_export": (SQL, VECTOR),
+}
+
+
+def apply_schema() -> None:
+    """Creates missing tables (schema.sql is idempotent)."""
+    Path(settings.SQL_DB_PATH).parent.mkdir(parents=True, exist_ok=True)  # fresh DATA_DIR volume
+    with open(settings.BASE_DIR / "data/sql/schema.sql", "r") as f, db_manager.get_connection() as conn:
+        if settings.SQL_WAL_MODE:
+            # Persistent in the DB file: worker processes read while another one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+        _check_vendor_emails(conn)
+        conn.executescript(f.read())
+
+
+def _check_vendor_emails(conn) -> None:
+    """
+    Refuses a database whose vendors share an email ignoring case: senders are
+    authorized by LOWER(email) (idx_vendors_email_nocase), so such rows would make
+    the match ambiguous. They have to be merged by hand; nothing is deleted here.
+    """
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'vendors'").fetchone():
+        return
+    duplicates = [row[0] for row in conn.execute(
+        "SELECT LOWER(email) FROM vendors GROUP BY LOWER(email) HAVING COUNT(*) > 1 LIMIT 10")]
+    if duplicates:
+        raise ConfigurationException(f"Vendors share an email (ignoring case), merge them first: {duplicates}")
+
+
+class BootstrapService:
+    """
+    Brings SQL and the vector indexes up (artifact install or schema + ingestion)
+    and reports progress per subsystem in the readiness registry.
+
+    The web server runs it in a background thread, so it accepts connections
+    (and answers /healthz, /readyz) immediately; each subsystem turns ready as
+    soon as the sources it depends on are loaded, e.g. SQL after the ledger
+    even while policy PDFs are still being embedded.
+
+    With several worker processes (uvicorn --workers N) only one of them, the
+    leader holding the ingest file lock, installs the schema and ingests.
+    The others wait for the lock, then take over the leader's subsystem
+    states and load the indexes it published, so the data is written once
+    instead of N times concurrently.
+    """
+
+    def __init__(self, registry: Optional[ReadinessRegistry] = None):
+        self.readiness = registry or readiness
+        self.role: Optional[str] = None  # "leader" | "follower" once run() has finished
+        self._thread: Optional[threading.Thread] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> threading.Thread:
+        """Runs the bootstrap in a daemon thread (once per process) and returns it."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.run, name="bootstrap", daemon=True)
+                self._thread.start()
+        return self._thread
+
+    @property
+    def state_path(self) -> Path:
+        return settings.DATA_ROOT / STATE_FILE_NAME
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        for subsystem in SUBSYSTEMS:
+            self.readiness.set(subsystem, "starting")
+
+        if settings.BOOTSTRAP_LEADER_ELECTION:
+            self._elect()
+        else:
+            self.role = "leader"
+            self._bootstrap()
+        logger.info("bootstrap_complete", role=self.role, seconds=round(time.perf_counter() - start, 3),
+                    subsystems=self.readiness.snapshot())
+        self._start_refresher()
+
+    # --- Leader election ---
+
+    def _elect(self) -> None:
+        while True:
+            attempted_at = time.time()
+            lock = ingest_lock()
+            if lock.acquire(exclusive=True, blocking=False):
+                self.role = "leader"
+                try:
+                    self._bootstrap()
+                    self._write_state()
+                finally:
+                    lock.release()
+                return
+
+            self.role = "follower"
+            logger.info("bootstrap_waiting_for_leader", pid=os.getpid())
+            for subsystem in SUBSYSTEMS:
+                self.readiness.set(subsystem, "starting", detail="waiting for bootstrap leader")
+            lock.acquire(exclusive=False, blocking=True)
+            lock.release()
+
+            state = self._read_state()
+            if state and state["finished_at"] >= attempted_at:
+                self._follow(state)
+                return
+            # The lock holder exited without finishing a bootstrap (crash, re-index job): elect again
+
+    def _write_state(self) -> None:
+        state = {"pid": os.getpid(), "finished_at": time.time(), "subsystems": self.readiness.snapshot()}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(f"{STATE_FILE_NAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+    def _read_state(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _follow(self, state: Dict[str, Any]) -> None:
+        """Adopts the leader's subsystem states and loads the indexes it published."""
+        logger.info("bootstrap_following_leader", leader_pid=state["pid"])
+        for subsystem in SUBSYSTEMS:
+            leader = state["subsystems"].get(subsystem, {})
+            leader_state, detail = leader.get("state", "failed"), leader.get("detail")
+            if subsystem == VECTOR and leader_state in USABLE_STATES and settings.VECTOR_WARMUP_ON_STARTUP:
+                try:
+                    vector_manager.warm_up(background=False)
+                except Exception as e:
+                    leader_state, detail = "failed", str(e)
+            self.readiness.set(subsystem, leader_state, detail=detail)
+
+    def _start_refresher(self) -> None:
+        """Periodically swaps in index generations another worker published (e.g. after a re-index)."""
+        interval = settings.VECTOR_REFRESH_INTERVAL_SECONDS
+        if interval <= 0 or self._refresher is not None:
+            return
+
+        def refresh_loop() -> None:
+            while True:
+                time.sleep(interval)
+                if not vector_manager.is_loaded:
+                    continue
+                try:
+                    refreshed = vector_manager.refresh()
+                    if refreshed:
+                        logger.info("vector_generations_refreshed", namespaces=refreshed)
+                except Exception as e:
+                    logger.warning("vector_refresh_failed", error=str(e))
+
+        self._refresher = threading.Thread(target=refresh_loop, name="vector-refresh", daemon=True)
+        self._refresher.start()
+
+    # --- Bootstrap ---
+
+    def _bootstrap(self) -> None:
+        try:
+            if settings.ARTIFACT_DIR:
+                # Prebuilt bundle: verify it and install its DB (nothing to ingest)
+                artifact_store.install()
+            apply_schema()
+        except Exception as e:
+            logger.error("bootstrap_failed", error=str(e))
+            for subsystem in SUBSYSTEMS:
+                self.readiness.set(subsystem, "failed", detail=str(e))
+            return
+
+        if settings.ARTIFACT_DIR:
+            self.readiness.set(SQL, "ready", detail="artifact")
+            self._finish_vector([])
+        else:
+            self._ingest()
+
+    def _ingest(self) -> None:
+        names = data_loader.active_sources()
+        pending: Dict[str, Set[str]] = {s: {n for n in names if s in SOURCE_SUBSYSTEMS[n]} for s in SUBSYSTEMS}
+        failed: Dict[str, List[str]] = {s: [] for s in SUBSYSTEMS}
+        # Subsystems that got data from at least one source (loaded or already up to date)
+        loaded: Set[str] = set()
+        lock = threading.Lock()
+
+        def on_complete(name: str, result: Dict[str, Any]) -> None:
+            finished = []
+            with lock:
+                for subsystem in SOURCE_SUBSYSTEMS[name]:
+                    pending[subsystem].discard(name)
+                    if result["status"] == "failed":
+                        failed[subsystem].append(name)
+                    else:
+                        loaded.add(subsystem)
+                    if not pending[subsystem]:
+                        finished.append(subsystem)
+            for subsystem in finished:
+                self._finish(subsystem, failed[subsystem])
+
+        # Subsystems with nothing to ingest here (e.g. vectors in a read-only worker)
+        for subsystem in SUBSYSTEMS:
+            if not pending[subsystem]:
+                self._finish(subsystem, [])
+        try:
+            data_loader.ingest_all(on_complete=on_complete)
+        except Exception as e:
+            logger.error("bootstrap_ingest_failed", error=str(e))
+            for subsystem in SUBSYSTEMS:
+                if not self.readiness.is_ready(subsystem):
+                    # degraded: serves what its finished sources loaded; failed: it has nothing
+                    with lock:
+                        state = "degraded" if subsystem in loaded else "failed"
+                    self.readiness.set(subsystem, state, detail=f"ingestion failed: {e}")
+
+    def _finish(self, subsystem: str, failed_sources: List[str]) -> None:
+        if subsystem == VECTOR:
+            self._finish_vector(failed_sources)
+        else:
+            self._set_loaded(subsystem, failed_sources)
+
+    def _finish_vector(self, failed_sources: List[str]) -> None:
+        # Load the indexes now so the first POLICY request doesn't pay for it
+        if settings.VECTOR_WARMUP_ON_STARTUP:
+            try:
+                vector_manager.warm_up(background=False)
+            except Exception as e:
+                self.readiness.set(VECTOR, "failed", detail=str(e))
+                return
+        self._set_loaded(VECTOR, failed_sources)
+
+    def _set_loaded(self, subsystem: str, failed_sources: List[str]) -> None:
+        if failed_sources:
+            # Serves whatever was loaded before (previous generation / existing rows)
+            self.readiness.set(subsystem, "degraded", detail=f"failed sources: {', '.join(failed_sources)}")
+        else:
+            self.readiness.set(subsystem, "ready")
+
+# Singleton Instance
+bootstrap_service = BootstrapService()
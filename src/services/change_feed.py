@@ -0,0 +1,148 @@
+# ==========================================
+# File: src/services/change_feed.py
+# ==========================================
+import csv
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Protocol, Union
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.core.db_manager import DBManager, db_manager
+from src.domain.models import VendorChange
+
+# vendors column -> ledger_data.csv column (see DataLoader.sync_db_to_csv)
+LEDGER_CSV_COLUMNS = {
+    "phone": "phone",
+    "address": "address",
+    "contact_name": "name",
+    "name": "company",
+    "category": "role",
+}
+
+
+class ChangeSink(Protocol):
+    """Destination for vendor changes. apply() must be idempotent (delivery is at-least-once)."""
+
+    def apply(self, changes: List[VendorChange]) -> None:
+        ...
+
+
+class JSONLSink:
+    """
+    Appends each change as one JSON line, e.g. for ERP jobs. Cost is O(changes).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def apply(self, changes: List[VendorChange]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for change in changes:
+                f.write(change.model_dump_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class LedgerCSVSink:
+    """
+    Applies changes to ledger_data.csv in one streaming pass (temp file + rename).
+    No SQL join: only the changed values are read from the change log.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path or settings.RAW_DATA_DIR / "ledger_data.csv")
+
+    def apply(self, changes: List[VendorChange]) -> None:
+        # Latest value per (vendor, column); later changes overwrite earlier ones
+        updates: Dict[str, Dict[str, str]] = {}
+        for change in changes:
+            column = LEDGER_CSV_COLUMNS.get(change.field)
+            # Vendors without a CSV id have no row in the ledger file
+            if column and change.vendor_id_str:
+                updates.setdefault(change.vendor_id_str, {})[column] = change.new_value
+        if not updates or not self.path.exists():
+            return
+
+        # Unique temp name: another process may be rewriting the same file
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp")
+        try:
+            with open(self.path, "r", newline="", encoding="utf-8") as src, \
+                    os.fdopen(fd, "w", newline="", encoding="utf-8") as dst:
+                reader = csv.DictReader(src)
+                writer = csv.DictWriter(dst, fieldnames=reader.fieldnames)
+                writer.writeheader()
+                for row in reader:
+                    row.update(updates.get(row["vendor_id"], {}))
+                    writer.writerow(row)
+            shutil.copymode(self.path, tmp_path)  # mkstemp creates it 0600
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class ChangeFeed:
+    """
+    Incremental reader over the vendor_change_log outbox.
+
+    Consumers keep a cursor (last applied change id) in change_feed_cursors;
+    consume() reads the changes after it, hands them to a sink and then advances
+    the cursor, so exports cost O(changes) instead of O(ledger).
+    """
+
+    def __init__(self, db: Optional[DBManager] = None):
+        self.db = db or db_manager
+
+    def read(self, since: int = 0, limit: int = 1000) -> List[VendorChange]:
+        """Changes with id > since, oldest first."""
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM vendor_change_log WHERE id > ? ORDER BY id LIMIT ?", (since, limit)
+            ).fetchall()
+        return [VendorChange(**dict(row)) for row in rows]
+
+    def get_cursor(self, consumer: str) -> int:
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT last_change_id FROM change_feed_cursors WHERE consumer = ?", (consumer,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def commit_cursor(self, consumer: str, change_id: int) -> None:
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO change_feed_cursors (consumer, last_change_id, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(consumer) DO UPDATE SET
+                    last_change_id = MAX(last_change_id, excluded.last_change_id),
+                    updated_at = CURRENT_TIMESTAMP
+            """, (consumer, change_id))
+
+    def consume(self, consumer: str, sink: ChangeSink, batch_size: int = 1000) -> int:
+        """
+        Applies every change after the consumer's cursor to `sink`, one batch at a time.
+        The cursor advances only after a batch is applied (at-least-once delivery).
+
+        Returns:
+            int: Number of changes applied.
+        """
+        cursor = self.get_cursor(consumer)
+        applied = 0
+        while True:
+            changes = self.read(since=cursor, limit=batch_size)
+            if not changes:
+                break
+            sink.apply(changes)
+            cursor = changes[-1].id
+            self.commit_cursor(consumer, cursor)
+            applied += len(changes)
+
+        logger.info("change_feed_consumed", consumer=consumer, changes=applied, cursor=cursor)
+        return applied
+
+# Singleton Instance
+change_feed = ChangeFeed()
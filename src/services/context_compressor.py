@@ -0,0 +1,83 @@
+# ==========================================
+# File: src/services/context_compressor.py
+# ==========================================
+import math
+import re
+from typing import List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from config.settings import settings
+from src.core.lexical_index import tokenize
+
+# Sentence boundary: ., ! or ? followed by whitespace, or a blank line
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), same estimate as the embedding pipeline."""
+    return math.ceil(len(text) / 4)
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.replace("\n", " ").strip() for s in _SENTENCE_RE.split(text) if s and s.strip()]
+
+
+class ContextCompressor:
+    """
+    Local extractive compression of retrieved excerpts before they reach the
+    drafter prompt. Sentences are scored by lexical overlap with the query
+    (no model calls) and kept best-first until the token budget is spent;
+    the kept sentences are re-joined in their original order.
+    """
+
+    def __init__(self, token_budget: Optional[int] = None):
+        self.token_budget = token_budget
+
+    @staticmethod
+    def _score(query_terms: set, sentence: str, rank: int) -> float:
+        overlap = len(query_terms & set(tokenize(sentence)))
+        # Higher-ranked excerpts win ties
+        return overlap + 1.0 / (rank + 2)
+
+    def compress(self, query: str, docs: List[Document]) -> List[Tuple[Document, str]]:
+        """
+        Returns (document, compressed text) pairs in retrieval order. Excerpts with
+        no selected sentence are dropped; the best sentence overall is
+        always kept (truncated to the budget if it alone exceeds it).
+        """
+        budget = self.token_budget or settings.RAG_CONTEXT_TOKEN_BUDGET
+        query_terms = set(tokenize(query))
+        sentences_by_doc = [split_sentences(doc.page_content) for doc in docs]
+        candidates = [
+            (self._score(query_terms, sentence, rank), rank, position)
+            for rank, sentences in enumerate(sentences_by_doc)
+            for position, sentence in enumerate(sentences)
+        ]
+        if any(score >= 1 for score, _, _ in candidates):
+            candidates = [c for c in candidates if c[0] >= 1]
+        # else: the excerpts matched semantically, not lexically ("pay" vs "paid"),
+        # so their leading sentences are kept in retrieval order
+        candidates.sort(key=lambda c: (-c[0], c[1], c[2]))
+
+        kept = {}
+        used = 0
+        for _, rank, position in candidates:
+            cost = estimate_tokens(sentences_by_doc[rank][position])
+            if used + cost > budget:
+                if kept:
+                    continue
+                sentences_by_doc[rank][position] = sentences_by_doc[rank][position][:budget * 4]
+                cost = budget
+            kept.setdefault(rank, set()).add(position)
+            used += cost
+
+        compressed = []
+        for rank, doc in enumerate(docs):
+            positions = sorted(kept.get(rank, ()))
+            if positions:
+                compressed.append((doc, " ".join(sentences_by_doc[rank][p] for p in positions)))
+        return compressed
+
+# Singleton Instance
+context_compressor = ContextCompressor()
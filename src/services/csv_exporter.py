@@ -0,0 +1,129 @@
+# ==========================================
+# File: src/services/csv_exporter.py
+# ==========================================
+import atexit
+import threading
+import time
+from typing import Optional, Set
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.metrics import metrics
+from src.services.data_loader import data_loader
+
+
+class CSVExporter:
+    """
+    Background, debounced export of SQL changes to ledger_data.csv.
+
+    Updates only call mark_dirty(); a daemon thread coalesces them and runs one
+    export once the changes go quiet for `debounce_seconds`, or sooner when
+    `max_pending` changes have queued up or the oldest change is
+    `max_delay_seconds` old. Update latency no longer depends on ledger size,
+    and exports never race each other (writes are serialized by _export_lock).
+    """
+
+    def __init__(
+        self,
+        debounce_seconds: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        max_delay_seconds: Optional[float] = None,
+        changed_only: Optional[bool] = None,
+    ):
+        self.debounce_seconds = settings.CSV_EXPORT_DEBOUNCE_SECONDS if debounce_seconds is None else debounce_seconds
+        self.max_pending = max_pending or settings.CSV_EXPORT_MAX_PENDING
+        self.max_delay_seconds = settings.CSV_EXPORT_MAX_DELAY_SECONDS if max_delay_seconds is None else max_delay_seconds
+        self.changed_only = settings.CSV_EXPORT_CHANGED_ONLY if changed_only is None else changed_only
+
+        self._condition = threading.Condition()
+        # Serializes writers of ledger_data.csv (worker thread vs. shutdown/manual flush)
+        self._export_lock = threading.Lock()
+        self._dirty_vendors: Set[int] = set()
+        self._pending = 0
+        self._full_export = False
+        self._first_change: Optional[float] = None
+        self._last_change: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def mark_dirty(self, vendor_id: Optional[int] = None) -> None:
+        """
+        Records a change (non-blocking). vendor_id=None requests a full export.
+        """
+        with self._condition:
+            now = time.monotonic()
+            if vendor_id is None:
+                self._full_export = True
+            else:
+                self._dirty_vendors.add(vendor_id)
+            self._pending += 1
+            self._first_change = self._first_change or now
+            self._last_change = now
+            self._ensure_worker()
+            self._condition.notify()
+        metrics.inc("csv_export_changes")
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="csv-exporter", daemon=True)
+            self._thread.start()
+
+    def _due_in(self) -> float:
+        """Seconds until the pending batch should be flushed (<= 0 means now)."""
+        if self._pending >= self.max_pending:
+            return 0.0
+        now = time.monotonic()
+        return min(self._last_change + self.debounce_seconds, self._first_change + self.max_delay_seconds) - now
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                wait = self._due_in()
+                if wait > 0 and not self._stopped:
+                    self._condition.wait(timeout=wait)
+                    continue
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Exports the pending changes now (called by the worker, at shutdown, or by tests).
+
+        Returns:
+            int: Rows written (0 if nothing was pending).
+        """
+        with self._export_lock:
+            with self._condition:
+                if not self._pending:
+                    return 0
+                vendor_ids = None if (self._full_export or not self.changed_only) else set(self._dirty_vendors)
+                coalesced = self._pending
+                self._dirty_vendors.clear()
+                self._pending = 0
+                self._full_export = False
+                self._first_change = self._last_change = None
+
+            start = time.perf_counter()
+            rows = data_loader.sync_db_to_csv(vendor_ids=vendor_ids)
+        metrics.inc("csv_exports")
+        logger.info("csv_export_flushed", changes=coalesced, rows=rows,
+                    mode="changed" if vendor_ids is not None else "full",
+                    seconds=round(time.perf_counter() - start, 3))
+        return rows
+
+    def shutdown(self) -> None:
+        """Flushes anything pending and stops the worker."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+        self.flush()
+
+# Singleton Instance
+csv_exporter = CSVExporter()
+atexit.register(csv_exporter.shutdown)
@@ -4,16 +4,30 @@
 import csv
 import os
 import shutil
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional
 
 from langchain_core.documents import Document
-from langchain_community.document_loaders import PyPDFLoader
 
 from config.settings import settings
 from config.logging_config import GLOBAL_LOGGER as logger
 from src.core.db_manager import db_manager
-from src.core.vector_manager import vector_manager
+from src.core.vector_manager import vector_manager, POLICY_NAMESPACE, ARCHIVE_NAMESPACE
+from src.services.document_pipeline import document_pipeline
+from src.services.export_importer import final_export_importer
+from src.services.ingest_pipeline import IngestSource, SourceCallback, ingest_pipeline
+from src.services.ledger_importer import ledger_importer
+
+# Source name -> raw file it is built from
+SOURCE_FILES = {
+    "ledger": "ledger_data.csv",
+    "library": "library_data.csv",
+    "policy": "policy.pdf",
+    "final_export": "final_data.csv",
+}
+# Sources that only write vectors (skipped by read-only serving processes)
+VECTOR_SOURCES = ("library", "policy")
 
 class DataLoader:
     """
@@ -21,158 +35,321 @@ class DataLoader:
     AND syncing SQL changes back to CSV.
     """
 
-    def ingest_all(self):
-        """Orchestrates the full data loading process."""
+    def ingest_all(self, on_complete: Optional[SourceCallback] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Orchestrates the full data loading process. Sources are independent and run
+        concurrently (see IngestPipeline); a failing source does not stop the others.
+        Sources whose raw file (and the schema) are unchanged since their last
+        successful ingest are skipped (INGEST_SKIP_UNCHANGED).
+
+        Args:
+            on_complete: Called with (source, result) as each source finishes.
+
+        Returns:
+            dict: Per-source status, items and stage timings.
+        """
         self._ensure_raw_data_exists()
-        self._load_ledger_data()
-        self._load_library_data()
-        self._load_policy_data()
+        names = self.active_sources()
+        if vector_manager.read_only:
+            # Serving workers only map the index; a writer process owns ingestion
+            logger.info("vector_ingest_skipped_read_only")
+        if "ledger" in names:
+            self._flush_ledger_export()
+        sources = [self._source(name) for name in names]
+        return ingest_pipeline.run(sources, skip_unchanged=settings.INGEST_SKIP_UNCHANGED, on_complete=on_complete)
+
+    def active_sources(self) -> List[str]:
+        """Sources ingest_all runs in this process (vector-only ones are left to writer processes)."""
+        names = self.enabled_sources()
+        if vector_manager.read_only:
+            names = [name for name in names if name not in VECTOR_SOURCES]
+        return names
+
+    @staticmethod
+    def enabled_sources() -> List[str]:
+        """
+        Sources loaded by ingest_all: the wide final_data.csv export replaces the
+        ledger/library CSVs derived from it when FINAL_EXPORT_INGEST_ENABLED is set.
+        """
+        if settings.FINAL_EXPORT_INGEST_ENABLED:
+            return ["final_export", "policy"]
+        return ["ledger", "library", "policy"]
+
+    def _source(self, name: str, replace: bool = False, overwrite_vendors: bool = False) -> IngestSource:
+        sources = {
+            "ledger": lambda: self._ledger_source(overwrite_vendors),
+            "library": lambda: self._library_source(replace),
+            "policy": lambda: self._policy_source(replace),
+            "final_export": lambda: self._final_export_source(),
+        }
+        return sources[name]()
+
+    def ingest_source(self, name: str, replace: bool = False, skip_unchanged: bool = False,
+                      overwrite_vendors: bool = False) -> Dict[str, Any]:
+        """
+        Runs a single source (see SOURCE_FILES). replace=True rebuilds vector sources
+        as a new generation; overwrite_vendors=True lets the ledger CSV overwrite
+        existing vendors (see LedgerImporter.import_csv). Raises on failure.
+
+        Returns:
+            dict: status ("ok" / "skipped"), items and stage timings.
+        """
+        if name == "ledger":
+            self._flush_ledger_export()
+        return ingest_pipeline.run_source(self._source(name, replace, overwrite_vendors),
+                                          skip_unchanged=skip_unchanged)
 
     def _ensure_raw_data_exists(self):
         """Checks if files are in the root and moves them to data/raw/."""
         os.makedirs(settings.RAW_DATA_DIR, exist_ok=True)
         # Check root dir for files to move
-        files_to_move = ["ledger_data.csv", "library_data.csv", "policy.pdf"]
+        files_to_move = list(SOURCE_FILES.values())
 
         for fname in files_to_move:
             if os.path.exists(fname):
                 shutil.move(fname, str(settings.RAW_DATA_DIR / fname))
                 logger.info("moved_file_to_raw", file=fname)
 
-    def _load_ledger_data(self):
+    @staticmethod
+    def _raw_path(source: str) -> Path:
+        return settings.RAW_DATA_DIR / SOURCE_FILES[source]
+
+    @staticmethod
+    def _raw_file(name: str) -> Optional[Path]:
+        """Read stage helper: the raw file's path, or None (source skipped) if it is missing."""
+        path = settings.RAW_DATA_DIR / name
+        if not path.exists():
+            logger.warning("raw_file_not_found", path=str(path))
+            return None
+        return path
+
+    # --- Ledger (SQL) ---
+
+    def _ledger_source(self, overwrite_vendors: bool = False) -> IngestSource:
         """
-        Reads ledger_data.csv and populates 'vendors' and 'invoices' tables.
+        Reads ledger_data.csv into the 'vendors' and 'invoices' tables. The importer
+        streams the file itself, so parsing is timed as part of the (SQL) sink.
         """
+        return IngestSource("ledger", read=lambda: self._raw_file("ledger_data.csv"),
+                            sink=lambda path: ledger_importer.import_csv(path, overwrite_vendors=overwrite_vendors),
+                            writes_sql=True, state_path=self._raw_path("ledger"))
 
-        csv_path = settings.RAW_DATA_DIR / "ledger_data.csv"
-        if not csv_path.exists():
-            logger.warning("ledger_data_not_found", path=str(csv_path))
-            return
+    @staticmethod
+    def _flush_ledger_export() -> None:
+        """
+        Writes pending vendor updates to ledger_data.csv before it is read (and
+        fingerprinted), so an import never starts from a CSV that lags behind SQL.
+        """
+        # Local import: csv_exporter imports this module
+        from src.services.csv_exporter import csv_exporter
+        csv_exporter.flush()
 
-        logger.info("loading_ledger_data")
-        try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                with db_manager.get_connection() as conn:
-                    cursor = conn.cursor()
-                    for row in reader:
-                        # 1. Upsert Vendor
-                        cursor.execute("""
-                            INSERT OR IGNORE INTO vendors 
-                            (vendor_id_str, name, contact_name, email, phone, address, category)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            row['vendor_id'], row['company'], row['name'], 
-                            row['email'], row['phone'], row['address'], row['role']
-                        ))
-                        
-                        # 2. Get ID
-                        cursor.execute("SELECT id FROM vendors WHERE vendor_id_str = ?", (row['vendor_id'],))
-                        vendor_row = cursor.fetchone()
-                        
-                        if vendor_row:
-                            # 3. Insert Invoice
-                            cursor.execute("""
-                                INSERT OR IGNORE INTO invoices 
-                                (vendor_id, invoice_number, amount, status, issue_date, due_date)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            """, (
-                                vendor_row[0], row['invoice_id'], row['amount'], 
-                                row['status'], row['invoice_date'], row['due_date']
-                            ))
-            logger.info("ledger_data_loaded_successfully")
-        except Exception as e:
-            logger.error("failed_loading_ledger", error=str(e))
+    def ingest_ledger(self) -> int:
+        """
+        Merges ledger_data.csv into SQL. Runs in a single transaction, so readers see
+        either the previous or the new ledger, never a partial load. Raises on failure.
+
+        Returns:
+            int: Number of CSV rows processed.
+        """
+        # Chunked executemany import with an in-memory vendor map (see LedgerImporter)
+        self._flush_ledger_export()
+        return ingest_pipeline.run_source(self._ledger_source())["items"]
+
+    # --- Library (email archive vectors) ---
+
+    def _library_source(self, replace: bool = False) -> IngestSource:
+        """Reads library_data.csv (Past Emails) and indexes them in the Vector Store."""
+        return IngestSource(
+            "library",
+            read=lambda: self._read_csv_rows("library_data.csv"),
+            transform=self._library_documents,
+            sink=lambda documents: vector_manager.add_document_batches(
+                [documents], namespace=ARCHIVE_NAMESPACE, replace=replace) if documents else 0,
+            state_path=self._raw_path("library"),
+            is_materialized=lambda: vector_manager.has_documents(ARCHIVE_NAMESPACE),
+        )
 
-    def _load_library_data(self):
+    def _read_csv_rows(self, name: str) -> Optional[List[Dict[str, str]]]:
+        csv_path = self._raw_file(name)
+        if csv_path is None:
+            return None
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    @staticmethod
+    def _library_documents(rows: List[Dict[str, str]]) -> List[Document]:
+        documents = []
+        for row in rows:
+            content = (f"Subject: {row['subject']}\nItem: {row['item_name']} ({row['category']})\n"
+                       f"Summary: {row['summary']}\nBody: {row['body']}\nReply: {row['reply_text']}")
+            metadata = {"source": "email_archive", "vendor_id": row['vendor_id'],
+                        "invoice_id": row['invoice_id'], "category": row['category']}
+            documents.append(Document(page_content=content, metadata=metadata))
+        return documents
+
+    def ingest_library(self, replace: bool = False) -> int:
         """
-        Reads library_data.csv (Past Emails) and indexes them in Vector Store.
+        Indexes library_data.csv into the email archive. With replace=True the
+        namespace is rebuilt from this file as a new generation instead of appended to.
+        Raises on failure.
+
+        Returns:
+            int: Number of archived emails indexed.
         """
+        return ingest_pipeline.run_source(self._library_source(replace))["items"]
 
-        csv_path = settings.RAW_DATA_DIR / "library_data.csv"
-        if not csv_path.exists(): 
-            return
-        
-        try:
-            logger.info("loading_library_data_rag")
-            documents = []
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    content = (f"Subject: {row['subject']}\nItem: {row['item_name']} ({row['category']})\n"
-                               f"Summary: {row['summary']}\nBody: {row['body']}\nReply: {row['reply_text']}")
-                    metadata = {"source": "email_archive", "vendor_id": row['vendor_id'], 
-                                "invoice_id": row['invoice_id'], "category": row['category']}
-                    documents.append(Document(page_content=content, metadata=metadata))
-            if documents:
-                vector_manager.add_documents(documents)
-        except Exception as e:
-            logger.error("failed_loading_library", error=str(e))
+    # --- Policy (PDF vectors) ---
+
+    def _policy_source(self, replace: bool = False) -> IngestSource:
+        """
+        Streams policy.pdf into the policy namespace: pages are parsed and chunked
+        lazily (transform) while the VectorManager embeds earlier batches (sink).
+        """
+        return IngestSource(
+            "policy",
+            read=lambda: self._raw_file("policy.pdf"),
+            transform=lambda pdf_path: document_pipeline.iter_batches([pdf_path]),
+            sink=lambda batches: vector_manager.add_document_batches(
+                batches, namespace=POLICY_NAMESPACE, replace=replace),
+            state_path=self._raw_path("policy"),
+            is_materialized=lambda: vector_manager.has_documents(POLICY_NAMESPACE),
+        )
 
-    def _load_policy_data(self):
-        """Loads policy.pdf into Vector Store."""
-        pdf_path = settings.RAW_DATA_DIR / "policy.pdf"
-        if not pdf_path.exists(): 
-            return
-        logger.info("loading_policy_pdf")
+    def ingest_policy(self, replace: bool = False) -> int:
+        """
+        Streams policy.pdf into the policy namespace (see DocumentPipeline).
+        With replace=True the namespace is rebuilt as a new generation. Raises on failure.
 
-        try:
-            loader = PyPDFLoader(str(pdf_path))
-            docs = loader.load()
-            for d in docs: 
-                d.metadata["source"] = "policy_document"
-            vector_manager.add_documents(docs)
-            logger.info("indexed_policy_pdf", pages=len(docs))
-        except Exception as e:
-            logger.error("failed_loading_policy", error=str(e))
+        Returns:
+            int: Number of chunks indexed.
+        """
+        return ingest_pipeline.run_source(self._policy_source(replace))["items"]
+
+    # --- Final export (SQL + archive vectors from final_data.csv) ---
 
-    def sync_db_to_csv(self):
+    def _final_export_source(self) -> IngestSource:
+        """
+        Loads the wide export in DataFrame chunks (see FinalExportImporter). The
+        export is a full snapshot, so the email archive is rebuilt, not appended to.
+        Read-only processes load the SQL tables only.
+        """
+        index_documents = not vector_manager.read_only
+        return IngestSource(
+            "final_export",
+            read=lambda: self._raw_file("final_data.csv"),
+            transform=final_export_importer.iter_frames,
+            sink=lambda frames: final_export_importer.load_frames(frames, index_documents=index_documents),
+            writes_sql=True,
+            state_path=self._raw_path("final_export"),
+            is_materialized=lambda: not index_documents or vector_manager.has_documents(ARCHIVE_NAMESPACE),
+        )
+
+    _EXPORT_QUERY = """
+        SELECT 
+            v.vendor_id_str as vendor_id,
+            v.contact_name as name,
+            v.email,
+            v.phone,
+            v.address,
+            v.name as company,
+            v.category as role,
+            i.invoice_number as invoice_id,
+            i.amount,
+            i.status,
+            i.due_date,
+            i.issue_date as invoice_date
+        FROM vendors v
+        JOIN invoices i ON v.id = i.vendor_id
+    """
+
+    def sync_db_to_csv(self, vendor_ids: Optional[Iterable[int]] = None) -> int:
         """
         Re-writes ledger_data.csv based on the current state of SQL Tables.
-        Call this after any UPDATE operation.
+        Called by the background CSVExporter, not in the request path.
+
+        Args:
+            vendor_ids: If given (and the CSV exists), only these vendors' rows are
+                re-read from SQL and patched into the existing file in place
+                (new invoices are appended).
+
+        Returns:
+            int: Rows written.
         """
         csv_path = settings.RAW_DATA_DIR / "ledger_data.csv"
-        logger.info("syncing_db_to_csv")
-        
-        query = """
-            SELECT 
-                v.vendor_id_str as vendor_id,
-                v.contact_name as name,
-                v.email,
-                v.phone,
-                v.address,
-                v.name as company,
-                v.category as role,
-                i.invoice_number as invoice_id,
-                i.amount,
-                i.status,
-                i.due_date,
-                i.issue_date as invoice_date
-            FROM vendors v
-            JOIN invoices i ON v.id = i.vendor_id
-        """
-        
+        vendor_ids = sorted(set(vendor_ids)) if vendor_ids is not None else None
+        if vendor_ids == []:
+            return 0
+        # Large change sets (beyond SQLite's parameter limit) are cheaper as a full export anyway
+        patch = vendor_ids is not None and len(vendor_ids) <= 900 and csv_path.exists()
+        logger.info("syncing_db_to_csv", vendors=len(vendor_ids) if patch else "all")
+
+        query = self._EXPORT_QUERY
+        params: tuple = ()
+        if patch:
+            query += f" WHERE v.id IN ({','.join('?' * len(vendor_ids))})"
+            params = tuple(vendor_ids)
+
+        tmp_path = None
         try:
             with db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                
-                if rows:
-                    # Get headers from cursor description
-                    headers = [description[0] for description in cursor.description]
-                    
-                    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow(headers)
-                        writer.writerows(rows)
-                        
-                    logger.info("csv_sync_complete", rows_written=len(rows))
-                else:
-                    logger.warning("csv_sync_skipped_empty_db")
-                    
+                cursor = conn.execute(query, params)
+                # Get headers from cursor description
+                headers = [description[0] for description in cursor.description]
+                rows_written = 0
+
+                # Temp file + rename: readers never see a half-written CSV. Unique
+                # name: exporters in different workers never share a temp file
+                fd, tmp_path = tempfile.mkstemp(dir=csv_path.parent, prefix=f"{csv_path.name}.", suffix=".tmp")
+                with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(headers)
+                    fresh = cursor.fetchall() if patch else cursor
+                    if patch:
+                        # Changed vendors' rows are replaced where they are, invoice by invoice
+                        fresh_by_invoice = {row["invoice_id"]: row for row in fresh}
+                        changed = {row["vendor_id"] for row in fresh}
+                        changed.update(self._vendor_id_strs(conn, vendor_ids))
+                        with open(csv_path, 'r', newline='', encoding='utf-8') as existing:
+                            for row in csv.DictReader(existing):
+                                if row["vendor_id"] in changed or row["invoice_id"] in fresh_by_invoice:
+                                    # Dropped if the invoice is gone
+                                    row = fresh_by_invoice.pop(row["invoice_id"], None)
+                                    if row is None:
+                                        continue
+                                    writer.writerow(row)
+                                else:
+                                    writer.writerow([row.get(h, "") for h in headers])
+                                rows_written += 1
+                        fresh = fresh_by_invoice.values()  # new invoices
+                    for row in fresh:
+                        writer.writerow(row)
+                        rows_written += 1
+
+            if not rows_written:
+                os.unlink(tmp_path)
+                logger.warning("csv_sync_skipped_empty_db")
+                return 0
+
+            if csv_path.exists():
+                shutil.copymode(csv_path, tmp_path)  # mkstemp creates it 0600
+            os.replace(tmp_path, csv_path)
+            logger.info("csv_sync_complete", rows_written=rows_written)
+            return rows_written
+
         except Exception as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             logger.error("failed_syncing_csv", error=str(e))
+            return 0
+
+    @staticmethod
+    def _vendor_id_strs(conn, vendor_ids: List[int]) -> List[str]:
+        """CSV vendor ids of vendors that may no longer have any invoice rows."""
+        rows = conn.execute(
+            f"SELECT vendor_id_str FROM vendors WHERE id IN ({','.join('?' * len(vendor_ids))})", vendor_ids
+        ).fetchall()
+        return [row[0] for row in rows]
 
 # Singleton
 data_loader = DataLoader()
\ No newline at end of file
@@ -0,0 +1,142 @@
+# ==========================================
+# File: src/services/document_pipeline.py
+# ==========================================
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from pypdf import PdfReader
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.core.vector_manager import vector_manager, POLICY_NAMESPACE
+
+PathLike = Union[str, Path]
+
+
+def _parse_page_range(pdf_path: str, start: int, end: int) -> List[Tuple[int, str]]:
+    """
+    Worker-process task: extracts the text of pages [start, end).
+    Each worker opens its own reader, so only page ranges cross the process boundary.
+    """
+    reader = PdfReader(pdf_path)
+    return [(i, reader.pages[i].extract_text() or "") for i in range(start, end)]
+
+
+class DocumentPipeline:
+    """
+    Streaming PDF -> chunk -> embedding pipeline shared by DataLoader and RAGService.
+
+    Pages are parsed in a process pool with a bounded window of in-flight page
+    ranges, chunked as they arrive, and handed to the VectorManager in fixed-size
+    batches, so memory stays flat for 1,000-page manuals and folders of PDFs.
+    """
+
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        pages_per_task: Optional[int] = None,
+    ):
+        self.chunk_size = chunk_size or settings.CHUNK_SIZE
+        self.chunk_overlap = settings.CHUNK_OVERLAP if chunk_overlap is None else chunk_overlap
+        self.batch_size = batch_size or settings.INGEST_BATCH_SIZE
+        self.max_workers = settings.PDF_PARSE_WORKERS if max_workers is None else max_workers
+        self.pages_per_task = pages_per_task or settings.PDF_PAGES_PER_TASK
+
+        # Policies usually have paragraphs; 1000 chars is a good balance.
+        self.splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            separators=["\n\n", "\n", ".", " ", ""]
+        )
+
+    @staticmethod
+    def expand_paths(paths: Iterable[PathLike]) -> List[Path]:
+        """Accepts PDF files and/or folders (all *.pdf inside, sorted)."""
+        expanded = []
+        for path in map(Path, paths):
+            expanded.extend(sorted(path.glob("*.pdf")) if path.is_dir() else [path])
+        return expanded
+
+    def iter_pages(self, pdf_path: PathLike) -> Iterator[Document]:
+        """
+        Yields one Document per page, in page order.
+        Small files (a single task's worth of pages) are parsed in-process.
+        """
+        pdf_path = str(pdf_path)
+        total_pages = len(PdfReader(pdf_path).pages)
+        ranges = [(s, min(s + self.pages_per_task, total_pages)) for s in range(0, total_pages, self.pages_per_task)]
+
+        if self.max_workers <= 1 or len(ranges) <= 1:
+            for start, end in ranges:
+                yield from self._to_documents(pdf_path, total_pages, _parse_page_range(pdf_path, start, end))
+            return
+
+        # spawn: the server has live threads (job workers, refreshers) and held
+        # locks that a forked child would inherit in whatever state they were in
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            # At most 2 ranges per worker are parsed ahead of the consumer
+            window = deque()
+            pending = iter(ranges)
+            for start, end in pending:
+                window.append(pool.submit(_parse_page_range, pdf_path, start, end))
+                if len(window) >= self.max_workers * 2:
+                    break
+            while window:
+                pages = window.popleft().result()
+                next_range = next(pending, None)
+                if next_range:
+                    window.append(pool.submit(_parse_page_range, pdf_path, *next_range))
+                yield from self._to_documents(pdf_path, total_pages, pages)
+
+    @staticmethod
+    def _to_documents(pdf_path: str, total_pages: int, pages: List[Tuple[int, str]]) -> Iterator[Document]:
+        for page_number, text in pages:
+            yield Document(
+                page_content=text,
+                metadata={
+                    "source": "policy_document",
+                    "file": Path(pdf_path).name,
+                    "page": page_number,
+                    "total_pages": total_pages,
+                }
+            )
+
+    def iter_chunks(self, paths: Iterable[PathLike]) -> Iterator[Document]:
+        """Chunks pages as they arrive (chunks never span two pages, keeping page metadata exact)."""
+        for pdf_path in self.expand_paths(paths):
+            for page in self.iter_pages(pdf_path):
+                if page.page_content.strip():
+                    yield from self.splitter.split_documents([page])
+
+    def iter_batches(self, paths: Iterable[PathLike]) -> Iterator[List[Document]]:
+        batch: List[Document] = []
+        for chunk in self.iter_chunks(paths):
+            batch.append(chunk)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def ingest(self, paths: Iterable[PathLike], namespace: str = POLICY_NAMESPACE, replace: bool = False) -> int:
+        """
+        Streams every PDF in `paths` into the namespace (replacing its contents when
+        replace=True). Returns the number of chunks indexed.
+        """
+        paths = self.expand_paths(paths)
+        logger.info("document_pipeline_started", files=len(paths), namespace=namespace)
+        chunks = vector_manager.add_document_batches(self.iter_batches(paths), namespace=namespace, replace=replace)
+        logger.info("document_pipeline_complete", files=len(paths), chunks=chunks)
+        return chunks
+
+# Singleton
+document_pipeline = DocumentPipeline()
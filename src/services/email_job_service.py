@@ -0,0 +1,343 @@
+# ==========================================
+# File: src/services/email_job_service.py
+# ==========================================
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.exceptions import ServiceOverloadedException, ValidationException
+from src.common.metrics import metrics
+from src.core.db_manager import DBManager, db_manager
+from src.domain.email_schemas import EmailInput
+from src.graph.workflow import app as agent_app
+from src.services.readiness import readiness, SQL
+
+# Nodes with effects outside the graph state: a run refused by admission control
+# after one of them finished is not retried (it would apply the update twice)
+SIDE_EFFECT_NODES = frozenset({"execute_update", "save_conversation"})
+
+# Oldest queued job whose thread has no earlier job still queued or running
+_CLAIM_SQL = """
+    UPDATE email_jobs
+    SET status = 'running', attempts = attempts + 1, claimed_pid = ?, started_at = CURRENT_TIMESTAMP
+    WHERE id = (
+        SELECT j.id FROM email_jobs j
+        WHERE j.status = 'queued' AND j.available_at <= ?
+          AND NOT EXISTS (
+              SELECT 1 FROM email_jobs e
+              WHERE e.thread_id = j.thread_id AND e.id < j.id AND e.status IN ('queued', 'running'))
+        ORDER BY j.id
+        LIMIT 1
+    )
+    RETURNING job_id, payload, attempts, webhook_url
+"""
+
+
+class EmailJob(BaseModel):
+    """
+    State of one submitted email (returned by POST /jobs, GET /jobs/{id} and
+    posted to the webhook when it finishes).
+    """
+    job_id: str
+    status: str = "queued"  # queued | running | succeeded | failed
+    thread_id: str
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None  # response, intent, action
+    error: Optional[str] = None
+    webhook_url: Optional[str] = None
+    webhook_status: Optional[str] = None     # pending | delivered | failed
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class EmailJobService:
+    """
+    Fire-and-forget email processing: submit() persists the EmailInput in the
+    email_jobs table and returns at once; worker threads drain the table
+    through the agent graph at whatever rate admission control lets through.
+
+    - Jobs on the same thread run one at a time in submission order.
+    - Claiming is one UPDATE ... RETURNING, so workers in several processes
+      sharing the DB never run a job twice.
+    - A run refused by admission control before any side-effecting node ran
+      (SIDE_EFFECT_NODES) goes back to the queue with backoff; other failures
+      fail the job, so an update is never applied twice.
+    - Webhooks go only to JOB_WEBHOOK_ALLOWED_HOSTS and are posted by a
+      separate delivery thread, so a slow endpoint never holds a job worker.
+    - Jobs left running (or webhooks left pending) by a process that died are
+      picked up again when the workers start and every
+      JOB_RECOVERY_INTERVAL_SECONDS after that.
+    """
+
+    def __init__(self, db: Optional[DBManager] = None):
+        self.db = db or db_manager
+        self._workers: List[threading.Thread] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._recovered = False
+        self._next_recovery = 0.0
+        # (job_id, url) of finished jobs whose webhook is pending; None stops the delivery thread
+        self._webhooks: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self._webhook_thread: Optional[threading.Thread] = None
+
+    # --- API ---
+
+    def submit(self, email: EmailInput, webhook_url: Optional[str] = None) -> EmailJob:
+        """
+        Raises:
+            ValidationException: webhook_url's host is not in JOB_WEBHOOK_ALLOWED_HOSTS.
+        """
+        if webhook_url is not None:
+            self.check_webhook_url(webhook_url)
+        job_id = uuid.uuid4().hex[:12]
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO email_jobs (job_id, thread_id, payload, webhook_url) VALUES (?, ?, ?, ?)",
+                (job_id, email.thread_id, email.model_dump_json(), webhook_url),
+            )
+        metrics.inc("email_jobs_submitted")
+        logger.info("email_job_submitted", job_id=job_id, thread_id=email.thread_id)
+        self._wake.set()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[EmailJob]:
+        with self.db.get_connection() as conn:
+            row = conn.execute("SELECT * FROM email_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return EmailJob(**job)
+
+    @staticmethod
+    def check_webhook_url(url: str) -> None:
+        """
+        Webhooks are posted from inside our network, so only allowlisted hosts
+        are accepted (anything else would let callers probe internal services).
+
+        Raises:
+            ValidationException: Not http(s), or host not in JOB_WEBHOOK_ALLOWED_HOSTS.
+        """
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        allowed = {h.lower() for h in settings.JOB_WEBHOOK_ALLOWED_HOSTS}
+        if parts.scheme not in ("http", "https") or host not in allowed:
+            raise ValidationException(f"Webhook host '{host}' is not allowed (see JOB_WEBHOOK_ALLOWED_HOSTS).")
+
+    def queue_depth(self) -> int:
+        with self.db.get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM email_jobs WHERE status = 'queued'").fetchone()[0]
+
+    # --- Workers ---
+
+    def start(self, workers: Optional[int] = None) -> None:
+        """Starts the worker threads (once per process); they wait until SQL is ready."""
+        workers = settings.JOB_WORKERS if workers is None else workers
+        with self._lock:
+            if self._workers or workers <= 0:
+                return
+            self._stop.clear()
+            for i in range(workers):
+                thread = threading.Thread(target=self._work, name=f"email-job-{i}", daemon=True)
+                thread.start()
+                self._workers.append(thread)
+            self._webhook_thread = threading.Thread(target=self._deliver_webhooks, name="email-job-webhooks",
+                                                    daemon=True)
+            self._webhook_thread.start()
+        metrics.register_gauge("email_jobs_queued", self.queue_depth)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stops the workers after their current job; unfinished jobs stay queued."""
+        self._stop.set()
+        self._wake.set()
+        with self._lock:
+            workers, self._workers = self._workers, []
+            webhook_thread, self._webhook_thread = self._webhook_thread, None
+        for thread in workers:
+            thread.join(timeout)
+        if webhook_thread is not None:
+            self._webhooks.put(None)
+            webhook_thread.join(timeout)
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            if not readiness.is_ready(SQL):
+                self._stop.wait(settings.JOB_POLL_INTERVAL_SECONDS)
+                continue
+            try:
+                self._recover_if_due()
+                if self.process_next() is None:
+                    self._wake.wait(settings.JOB_POLL_INTERVAL_SECONDS)
+                    self._wake.clear()
+            except Exception as e:
+                logger.error("email_job_worker_error", error=str(e))
+                self._stop.wait(settings.JOB_POLL_INTERVAL_SECONDS)
+
+    def _recover_if_due(self) -> None:
+        """Runs recover() when the workers start and every JOB_RECOVERY_INTERVAL_SECONDS after that."""
+        with self._lock:
+            if time.monotonic() < self._next_recovery:
+                return
+            # The first pass runs before this process claims anything, so our own pid counts as dead
+            self.recover(startup=not self._recovered)
+            self._recovered = True
+            self._next_recovery = time.monotonic() + settings.JOB_RECOVERY_INTERVAL_SECONDS
+
+    def recover(self, startup: bool = True) -> int:
+        """
+        Re-queues jobs marked running by a process that is gone and queues the
+        webhooks such processes left pending for delivery here.
+
+        Args:
+            startup: Also treat our own pid as gone (an earlier process with the
+                same pid, e.g. PID 1 in a restarted container). Only safe before
+                this process claims any job.
+
+        Returns:
+            int: Number of jobs re-queued.
+        """
+        with self.db.get_connection() as conn:
+            pids = [row[0] for row in conn.execute(
+                "SELECT DISTINCT claimed_pid FROM email_jobs WHERE status = 'running' OR webhook_status = 'pending'")]
+            dead = [pid for pid in pids if (startup and pid == os.getpid()) or not self._alive(pid)]
+            if not dead:
+                return 0
+            placeholders = ",".join("?" * len(dead))
+            requeued = conn.execute(
+                f"UPDATE email_jobs SET status = 'queued', claimed_pid = NULL "
+                f"WHERE status = 'running' AND claimed_pid IN ({placeholders})", dead).rowcount
+            webhooks = conn.execute(
+                f"UPDATE email_jobs SET claimed_pid = ? WHERE webhook_status = 'pending' "
+                f"AND status IN ('succeeded', 'failed') AND claimed_pid IN ({placeholders}) "
+                f"RETURNING job_id, webhook_url", (os.getpid(), *dead)).fetchall()
+        for job_id, url in webhooks:
+            self._webhooks.put((job_id, url))
+        logger.warning("email_jobs_recovered", count=requeued, webhooks=len(webhooks))
+        return requeued
+
+    @staticmethod
+    def _alive(pid: Optional[int]) -> bool:
+        if pid is None:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def process_next(self) -> Optional[str]:
+        """Claims and runs one job. Returns its id, or None if nothing is runnable."""
+        with self.db.get_connection() as conn:
+            row = conn.execute(_CLAIM_SQL, (os.getpid(), time.time())).fetchone()
+        if row is None:
+            return None
+        job_id, payload, attempts, webhook_url = row
+        log = logger.bind(job_id=job_id)
+        log.info("email_job_started", attempt=attempts)
+        start = time.perf_counter()
+        completed: List[str] = []
+
+        try:
+            result = self._run_graph(EmailInput.model_validate_json(payload), completed)
+        except ServiceOverloadedException as e:
+            applied = sorted(SIDE_EFFECT_NODES.intersection(completed))
+            if applied:
+                log.error("email_job_failed", error=e.error_message, applied=applied)
+                self._finish(job_id, "failed", error=f"Overloaded after {', '.join(applied)} ran (not retried)")
+            elif attempts < settings.JOB_MAX_ATTEMPTS:
+                delay = settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1))
+                with self.db.get_connection() as conn:
+                    conn.execute("UPDATE email_jobs SET status = 'queued', claimed_pid = NULL, available_at = ? "
+                                 "WHERE job_id = ?", (time.time() + delay, job_id))
+                metrics.inc("email_jobs_retried")
+                log.warning("email_job_requeued", delay=delay, reason=e.error_message)
+                return job_id
+            else:
+                self._finish(job_id, "failed", error=f"Overloaded after {attempts} attempts")
+        except Exception as e:
+            log.error("email_job_failed", error=str(e))
+            self._finish(job_id, "failed", error=str(e))
+        else:
+            self._finish(job_id, "succeeded", result=result)
+
+        metrics.inc("email_jobs_seconds", time.perf_counter() - start)
+        if webhook_url:
+            self._webhooks.put((job_id, webhook_url))
+        return job_id
+
+    @staticmethod
+    def _run_graph(email: EmailInput, completed: List[str]) -> Dict[str, Any]:
+        """Runs the graph, appending each node to completed as it finishes."""
+        output: Dict[str, Any] = {}
+        for mode, chunk in agent_app.stream({"email_input": email, "messages": [], "trials": 0},
+                                            stream_mode=["updates", "values"]):
+            if mode == "updates":
+                completed.extend(chunk)
+            else:
+                output = chunk
+        return {
+            "response": output.get("generated_email"),
+            "intent": output.get("intent"),
+            "action": output.get("final_action"),
+        }
+
+    def _finish(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+                error: Optional[str] = None) -> None:
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "UPDATE email_jobs SET status = ?, result = ?, error = ?, finished_at = CURRENT_TIMESTAMP, "
+                "webhook_status = CASE WHEN webhook_url IS NULL THEN NULL ELSE 'pending' END "
+                "WHERE job_id = ?",
+                (status, json.dumps(result) if result is not None else None, error, job_id),
+            )
+        metrics.inc(f"email_jobs_{status}")
+        logger.info("email_job_finished", job_id=job_id, status=status)
+
+    def _deliver_webhooks(self) -> None:
+        while (item := self._webhooks.get()) is not None:
+            try:
+                self._deliver_webhook(*item)
+            except Exception as e:
+                logger.error("email_job_webhook_error", job_id=item[0], error=str(e))
+
+    def _deliver_webhook(self, job_id: str, url: str) -> None:
+        """POSTs the finished job to its webhook, retrying with backoff; records the outcome."""
+        body = self.get(job_id).model_dump(mode="json")
+        status = "failed"
+        try:
+            # Re-checked: the allowlist may have shrunk since the job was submitted
+            self.check_webhook_url(url)
+        except ValidationException as e:
+            logger.warning("email_job_webhook_refused", job_id=job_id, error=e.error_message)
+            attempts = 0
+        else:
+            attempts = settings.JOB_WEBHOOK_ATTEMPTS
+        for attempt in range(attempts):
+            try:
+                response = httpx.post(url, json=body, timeout=settings.JOB_WEBHOOK_TIMEOUT_SECONDS)
+                response.raise_for_status()
+                status = "delivered"
+                break
+            except httpx.HTTPError as e:
+                logger.warning("email_job_webhook_failed", job_id=job_id, attempt=attempt + 1, error=str(e))
+                if attempt + 1 < attempts:
+                    time.sleep(2 ** attempt)
+        with self.db.get_connection() as conn:
+            conn.execute("UPDATE email_jobs SET webhook_status = ? WHERE job_id = ?", (status, job_id))
+
+# Singleton Instance
+email_job_service = EmailJobService()
@@ -0,0 +1,245 @@
+# ==========================================
+# File: src/services/export_importer.py
+# ==========================================
+import importlib.util
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+from langchain_core.documents import Document
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.core.db_manager import DBManager, db_manager
+from src.core.vector_manager import vector_manager, ARCHIVE_NAMESPACE
+from src.services.ledger_importer import resolve_vendor_ids
+
+# Float-formatted integers in the export (e.g. phone "9569733980.0")
+_INTEGER_COLUMNS = ("user_id", "phone", "stock")
+
+# Parquet schema metadata: which CSV the cache was built from
+_CACHE_SIZE_KEY = b"source_size"
+_CACHE_MTIME_KEY = b"source_mtime_ns"
+
+
+class FinalExportImporter:
+    """
+    Vectorized loader for final_data.csv, the wide (35-column) operational export
+    the ledger and library CSVs are derived from.
+
+    The export is read in DataFrame chunks (dtype=str, so nothing is re-inferred
+    per chunk) and normalized with column operations into vendors, invoices,
+    items and email_archive rows plus email-archive Documents. Each chunk is
+    written with executemany in its own transaction (INSERT OR IGNORE makes a
+    re-run idempotent), so other SQL writers are never blocked for a whole load.
+    The parsed frame can be cached as Parquet when pyarrow is installed.
+    """
+
+    def __init__(
+        self,
+        db: Optional[DBManager] = None,
+        chunk_size: Optional[int] = None,
+        parquet_cache: Optional[bool] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        self.db = db or db_manager
+        self.chunk_size = chunk_size or settings.FINAL_EXPORT_CHUNK_SIZE
+        self.parquet_cache = settings.FINAL_EXPORT_PARQUET_CACHE if parquet_cache is None else parquet_cache
+        self._cache_dir = cache_dir
+        # Stats of the most recent load (rows, vendors, invoices, items, emails, seconds)
+        self.last_stats: Dict[str, float] = {}
+
+    # --- Read ---
+
+    def iter_frames(self, csv_path: Union[str, Path]) -> Iterator[pd.DataFrame]:
+        """Yields the export in chunks, from the Parquet cache when it is up to date."""
+        csv_path = Path(csv_path)
+        if not self.parquet_cache:
+            yield from self._read_csv(csv_path)
+            return
+        if importlib.util.find_spec("pyarrow") is None:
+            logger.warning("parquet_cache_unavailable", reason="pyarrow is not installed")
+            yield from self._read_csv(csv_path)
+            return
+
+        cache_path = self.cache_path(csv_path)
+        if self._cache_is_fresh(cache_path, csv_path):
+            logger.info("final_export_cache_hit", path=str(cache_path))
+            yield from self._read_parquet(cache_path)
+        else:
+            yield from self._read_csv_and_cache(csv_path, cache_path)
+
+    def cache_path(self, csv_path: Path) -> Path:
+        return Path(self._cache_dir or settings.PARQUET_CACHE_DIR) / f"{csv_path.stem}.parquet"
+
+    def _read_csv(self, csv_path: Path) -> Iterator[pd.DataFrame]:
+        yield from pd.read_csv(csv_path, dtype=str, keep_default_na=False, chunksize=self.chunk_size)
+
+    @staticmethod
+    def _cache_is_fresh(cache_path: Path, csv_path: Path) -> bool:
+        import pyarrow.parquet as pq
+
+        if not cache_path.exists():
+            return False
+        metadata = pq.read_schema(cache_path).metadata or {}
+        stat = csv_path.stat()
+        return (metadata.get(_CACHE_SIZE_KEY) == str(stat.st_size).encode()
+                and metadata.get(_CACHE_MTIME_KEY) == str(stat.st_mtime_ns).encode())
+
+    def _read_parquet(self, cache_path: Path) -> Iterator[pd.DataFrame]:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(cache_path).iter_batches(batch_size=self.chunk_size):
+            yield batch.to_pandas()
+
+    def _read_csv_and_cache(self, csv_path: Path, cache_path: Path) -> Iterator[pd.DataFrame]:
+        """Streams the CSV and writes each chunk to the cache (temp file + rename on completion)."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        stat = csv_path.stat()
+        metadata = {_CACHE_SIZE_KEY: str(stat.st_size).encode(), _CACHE_MTIME_KEY: str(stat.st_mtime_ns).encode()}
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        writer = None
+        complete = False
+        try:
+            for frame in self._read_csv(csv_path):
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema.with_metadata(metadata))
+                writer.write_table(table)
+                yield frame
+            complete = True
+        finally:
+            if writer is not None:
+                writer.close()
+            if complete and writer is not None:
+                os.replace(tmp_path, cache_path)
+                logger.info("final_export_cache_written", path=str(cache_path))
+            elif tmp_path.exists():
+                tmp_path.unlink()
+
+    # --- Transform ---
+
+    @staticmethod
+    def normalize(frame: pd.DataFrame) -> pd.DataFrame:
+        """Drops the export's index column and fixes float-formatted integer columns."""
+        frame = frame.drop(columns=[c for c in frame.columns if c.startswith("Unnamed")])
+        for column in _INTEGER_COLUMNS:
+            if column in frame:
+                frame[column] = frame[column].str.replace(r"\.0$", "", regex=True)
+        # Hand-written replies win over generated ones
+        frame["reply"] = frame["reply_text"].where(frame["reply_text"] != "", frame["generated_reply"])
+        frame["email_item_id"] = frame["related_item_id"].where(frame["related_item_id"] != "", frame["item_id"])
+        return frame
+
+    @staticmethod
+    def documents(frame: pd.DataFrame) -> List[Document]:
+        """Email-archive Documents (same layout as DataLoader's library_data.csv documents)."""
+        emails = frame[(frame["subject"] != "") | (frame["body"] != "")]
+        content = ("Subject: " + emails["subject"] + "\nItem: " + emails["item_name"] + " (" + emails["category"]
+                   + ")\nSummary: " + emails["summary"] + "\nBody: " + emails["body"] + "\nReply: " + emails["reply"])
+        return [
+            Document(page_content=text, metadata={"source": "email_archive", "vendor_id": vendor_id,
+                                                  "invoice_id": invoice_id, "category": category})
+            for text, vendor_id, invoice_id, category in zip(
+                content, emails["vendor_id"], emails["invoice_id"], emails["category"])
+        ]
+
+    # --- Sink ---
+
+    def load_frames(self, frames: Iterable[pd.DataFrame], index_documents: bool = True,
+                    replace: bool = True) -> int:
+        """
+        Writes every chunk to SQL and (optionally) indexes its emails in the
+        email_archive namespace. replace=True rebuilds the namespace from this
+        export as a new generation, since the export is a full snapshot.
+
+        Returns:
+            int: Number of export rows processed.
+        """
+        start = time.perf_counter()
+        stats = dict.fromkeys(("rows", "vendors", "invoices", "items", "emails", "documents"), 0)
+
+        def batches() -> Iterator[List[Document]]:
+            for frame in frames:
+                frame = self.normalize(frame)
+                for table, added in self._write_chunk(frame).items():
+                    stats[table] += added
+                stats["rows"] += len(frame)
+                if index_documents:
+                    documents = self.documents(frame)
+                    stats["documents"] += len(documents)
+                    yield documents
+
+        if index_documents:
+            vector_manager.add_document_batches(batches(), namespace=ARCHIVE_NAMESPACE, replace=replace)
+        else:
+            for _ in batches():
+                pass
+
+        self.last_stats = {**stats, "seconds": round(time.perf_counter() - start, 3)}
+        logger.info("final_export_loaded", **self.last_stats)
+        return stats["rows"]
+
+    def _write_chunk(self, frame: pd.DataFrame) -> Dict[str, int]:
+        """One transaction per chunk. Returns rows added per table."""
+        added = {}
+        with self.db.get_connection() as conn:
+            # 1. Vendors, first occurrence wins (same as LedgerImporter)
+            vendors = frame[frame["vendor_id"] != ""].drop_duplicates("vendor_id")
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO vendors
+                (vendor_id_str, name, contact_name, email, phone, address, category)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, vendors[["vendor_id", "company", "name", "email", "phone", "address", "role"]]
+                         .itertuples(index=False, name=None))
+            added["vendors"] = conn.total_changes - before
+            vendor_ids = resolve_vendor_ids(conn, vendors["vendor_id"].tolist())
+
+            # 2. Invoices; rows whose vendor was rejected (e.g. duplicate email) are skipped
+            invoices = frame[frame["invoice_id"] != ""].assign(vendor_pk=frame["vendor_id"].map(vendor_ids))
+            invoices = invoices.dropna(subset=["vendor_pk"]).drop_duplicates("invoice_id")
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO invoices
+                (vendor_id, invoice_number, amount, status, issue_date, due_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, invoices.astype({"vendor_pk": int})[["vendor_pk", "invoice_id", "amount", "status",
+                                                      "invoice_date", "due_date"]].itertuples(index=False, name=None))
+            added["invoices"] = conn.total_changes - before
+
+            # 3. Items: the export is a snapshot, so price/stock take the latest values
+            items = frame[frame["item_id"] != ""].drop_duplicates("item_id", keep="last")
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT INTO items (item_id, name, category, description, price, supplier, stock)
+                VALUES (?, ?, ?, ?, NULLIF(?, ''), ?, NULLIF(?, ''))
+                ON CONFLICT(item_id) DO UPDATE SET
+                    name = excluded.name, category = excluded.category, description = excluded.description,
+                    price = excluded.price, supplier = excluded.supplier, stock = excluded.stock,
+                    updated_at = CURRENT_TIMESTAMP
+            """, items[["item_id", "item_name", "category", "description", "price", "supplier", "stock"]]
+                         .itertuples(index=False, name=None))
+            added["items"] = conn.total_changes - before
+
+            # 4. Email archive
+            emails = frame[(frame["subject"] != "") | (frame["body"] != "")]
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO email_archive
+                (invoice_number, vendor_id_str, item_id, from_address, to_address, subject, body,
+                 email_type, reply_text, summary, previous_interactions, response_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, emails[["invoice_id", "vendor_id", "email_item_id", "from", "to", "subject", "body", "email_type",
+                         "reply", "summary", "previous_interactions", "response_date"]]
+                         .itertuples(index=False, name=None))
+            added["emails"] = conn.total_changes - before
+        return added
+
+# Singleton Instance
+final_export_importer = FinalExportImporter()
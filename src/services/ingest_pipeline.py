@@ -0,0 +1,229 @@
+# ==========================================
+# File: src/services/ingest_pipeline.py
+# ==========================================
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.metrics import metrics
+from src.services.ingest_state import IngestState, SourceFingerprint, ingest_state
+
+STAGES = ("read", "transform", "sink")
+
+# (source name, result) -> None; see IngestPipeline.run
+SourceCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class IngestSource:
+    """
+    One independent ingest source, split into stages:
+
+        read()          -> raw input (None: nothing to ingest, the source is skipped)
+        transform(raw)  -> what the sink consumes (may be a lazy iterator)
+        sink(data)      -> number of items written
+
+    Sources with writes_sql=True run their sink under the pipeline's SQL lock.
+    A source with a state_path is fingerprinted (see IngestState) and can be
+    skipped while that file is unchanged and is_materialized() still holds
+    (e.g. its vector namespace was not wiped).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        read: Callable[[], Any],
+        sink: Callable[[Any], int],
+        transform: Optional[Callable[[Any], Any]] = None,
+        writes_sql: bool = False,
+        state_path: Optional[Path] = None,
+        is_materialized: Optional[Callable[[], bool]] = None,
+    ):
+        self.name = name
+        self.read = read
+        self.transform = transform or (lambda raw: raw)
+        self.sink = sink
+        self.writes_sql = writes_sql
+        self.state_path = state_path
+        self.is_materialized = is_materialized or (lambda: True)
+
+
+class _TimedIterator:
+    """
+    Wraps a lazy transform so the time spent producing items is charged to the
+    transform stage instead of the sink that pulls them.
+    """
+
+    def __init__(self, iterable: Iterable):
+        self._iterator = iter(iterable)
+        self.seconds = 0.0
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return next(self._iterator)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
+class IngestPipeline:
+    """
+    Runs independent ingest sources concurrently (read -> transform -> sink per source).
+
+    Sources are dominated by different resources (local SQL I/O vs. embedding
+    latency), so running them side by side makes bootstrap take about as long as
+    the slowest source rather than the sum. SQL sinks are serialized by
+    sql_lock (one SQLite writer at a time); vector sinks only lock their own
+    namespace in the VectorManager, so their embedding calls overlap.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, state: Optional[IngestState] = None):
+        self.max_workers = max_workers or settings.INGEST_MAX_WORKERS
+        self.state = state or ingest_state
+        self.sql_lock = threading.Lock()
+
+    def _check(self, source: IngestSource, skip_unchanged: bool) -> Tuple[bool, Optional[SourceFingerprint]]:
+        """(unchanged, fingerprint to record after a successful load)."""
+        if source.state_path is None:
+            return False, None
+        if skip_unchanged:
+            unchanged, fingerprint = self.state.check(source.name, source.state_path)
+            if unchanged and source.is_materialized():
+                return True, None
+            if fingerprint is not None:
+                return False, fingerprint
+        return False, self.state.fingerprint(source.state_path)
+
+    def run_source(self, source: IngestSource, skip_unchanged: bool = False) -> Dict[str, Any]:
+        """
+        Runs one source's stages in order (or skips it, see skip_unchanged). Raises on failure.
+
+        Returns:
+            dict: status ("ok" / "skipped"), items written and seconds per stage.
+        """
+        unchanged, fingerprint = self._check(source, skip_unchanged)
+        if unchanged:
+            return self._report(source, "skipped", 0, dict.fromkeys(STAGES, 0.0), reason="unchanged")
+        return self._run_stages(source, fingerprint)
+
+    def _run_stages(self, source: IngestSource, fingerprint: Optional[SourceFingerprint]) -> Dict[str, Any]:
+        timings = dict.fromkeys(STAGES, 0.0)
+
+        start = time.perf_counter()
+        raw = source.read()
+        timings["read"] = time.perf_counter() - start
+        if raw is None:
+            return self._report(source, "skipped", 0, timings, reason="missing")
+
+        start = time.perf_counter()
+        data = source.transform(raw)
+        timings["transform"] = time.perf_counter() - start
+        if isinstance(data, Iterator):
+            data = _TimedIterator(data)
+
+        start = time.perf_counter()
+        if source.writes_sql:
+            with self.sql_lock:
+                items = source.sink(data)
+        else:
+            items = source.sink(data)
+        timings["sink"] = time.perf_counter() - start
+
+        if isinstance(data, _TimedIterator):
+            timings["transform"] += data.seconds
+            timings["sink"] -= data.seconds
+
+        if fingerprint is not None:
+            # Recorded only after a successful load, so a failed source is retried next time
+            with self.sql_lock:
+                self.state.record(source.name, fingerprint, items)
+        return self._report(source, "ok", items, timings)
+
+    def run(self, sources: List[IngestSource], skip_unchanged: bool = False,
+            on_complete: Optional[SourceCallback] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs all sources concurrently. A failing source is logged and reported
+        without affecting the others. With skip_unchanged=True, sources whose
+        fingerprint matches their last successful ingest are not re-run.
+        on_complete(name, result) is called as each source finishes (e.g. to
+        mark a subsystem ready before slower sources are done).
+
+        Returns:
+            dict: source name -> result of run_source (status "failed" + error on failure).
+        """
+        start = time.perf_counter()
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        # Fingerprints are checked before any SQL writer starts
+        for source in sources:
+            try:
+                unchanged, fingerprint = self._check(source, skip_unchanged)
+            except Exception as e:
+                results[source.name] = self._failed(source.name, e)
+                self._notify(on_complete, source.name, results[source.name])
+                continue
+            if unchanged:
+                results[source.name] = self._report(source, "skipped", 0, dict.fromkeys(STAGES, 0.0),
+                                                    reason="unchanged")
+                self._notify(on_complete, source.name, results[source.name])
+            else:
+                pending.append((source, fingerprint))
+
+        workers = max(1, min(self.max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as pool:
+            futures = {pool.submit(self._run_stages, source, fingerprint): source.name
+                       for source, fingerprint in pending}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = self._failed(name, e)
+                self._notify(on_complete, name, results[name])
+
+        logger.info("ingest_all_complete", sources=len(sources), workers=workers,
+                    skipped=[name for name, r in results.items() if r["status"] == "skipped"],
+                    seconds=round(time.perf_counter() - start, 3),
+                    slowest_source_seconds=max((r.get("seconds", 0) for r in results.values()), default=0))
+        return {source.name: results[source.name] for source in sources}
+
+    @staticmethod
+    def _notify(on_complete: Optional[SourceCallback], name: str, result: Dict[str, Any]) -> None:
+        if on_complete is None:
+            return
+        try:
+            on_complete(name, result)
+        except Exception as e:
+            logger.error("ingest_callback_failed", source=name, error=str(e))
+
+    @staticmethod
+    def _failed(name: str, error: Exception) -> Dict[str, Any]:
+        logger.error("ingest_source_failed", source=name, error=str(error))
+        metrics.inc("ingest_source_failures")
+        return {"status": "failed", "items": 0, "error": str(error)}
+
+    @staticmethod
+    def _report(source: IngestSource, status: str, items: int, timings: Dict[str, float],
+                reason: Optional[str] = None) -> Dict[str, Any]:
+        result = {
+            "status": status,
+            "items": items,
+            **{stage: round(seconds, 3) for stage, seconds in timings.items()},
+            "seconds": round(sum(timings.values()), 3),
+        }
+        if reason:
+            result["reason"] = reason
+        if status == "skipped":
+            logger.info("ingest_source_skipped", source=source.name, reason=reason)
+        else:
+            logger.info("ingest_source_complete", source=source.name, **result)
+        return result
+
+# Singleton Instance
+ingest_pipeline = IngestPipeline()
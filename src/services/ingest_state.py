@@ -0,0 +1,118 @@
+# ==========================================
+# File: src/services/ingest_state.py
+# ==========================================
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.core.db_manager import DBManager, db_manager
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class SourceFingerprint(BaseModel):
+    """What a source was (or is about to be) ingested from."""
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    schema_sha256: str
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestState:
+    """
+    Per-source fingerprints in the ingest_state table.
+
+    check() compares a raw file with the fingerprint recorded at its last
+    successful ingest: equal size + mtime is trusted without reading the file;
+    otherwise the content hash decides (a touched but identical file is still
+    unchanged). A different schema.sql invalidates every source.
+    """
+
+    def __init__(self, db: Optional[DBManager] = None, schema_path: Optional[Union[str, Path]] = None):
+        self.db = db or db_manager
+        self._schema_path = schema_path
+
+    @property
+    def schema_path(self) -> Path:
+        return Path(self._schema_path or settings.BASE_DIR / "data/sql/schema.sql")
+
+    def fingerprint(self, path: Union[str, Path]) -> Optional[SourceFingerprint]:
+        """Full fingerprint of `path` (None if the file does not exist)."""
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            return None
+        return SourceFingerprint(
+            path=str(path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=file_sha256(path),
+            schema_sha256=file_sha256(self.schema_path),
+        )
+
+    def get(self, source: str) -> Optional[SourceFingerprint]:
+        try:
+            with self.db.get_connection() as conn:
+                row = conn.execute("SELECT * FROM ingest_state WHERE source = ?", (source,)).fetchone()
+        except sqlite3.OperationalError as e:
+            # Database created before ingest_state existed: nothing is known to be ingested
+            logger.warning("ingest_state_unavailable", error=str(e))
+            return None
+        return SourceFingerprint(**{k: row[k] for k in SourceFingerprint.model_fields}) if row else None
+
+    def check(self, source: str, path: Union[str, Path]) -> Tuple[bool, Optional[SourceFingerprint]]:
+        """
+        Returns:
+            (unchanged, fingerprint): fingerprint is the file's current full
+            fingerprint when it changed (None if unchanged or missing).
+        """
+        recorded = self.get(source)
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            return False, None
+        if (recorded is not None and recorded.path == str(path) and recorded.size == stat.st_size
+                and recorded.mtime_ns == stat.st_mtime_ns
+                and recorded.schema_sha256 == file_sha256(self.schema_path)):
+            return True, None
+
+        current = self.fingerprint(path)
+        if recorded is not None and current is not None and recorded.model_dump(exclude={"mtime_ns"}) == \
+                current.model_dump(exclude={"mtime_ns"}):
+            # Same content with a new mtime: remember it so the next check is stat-only
+            self.record(source, current)
+            return True, None
+        return False, current
+
+    def record(self, source: str, fingerprint: SourceFingerprint, items: Optional[int] = None) -> None:
+        try:
+            with self.db.get_connection() as conn:
+                conn.execute("""
+                    INSERT INTO ingest_state (source, path, size, mtime_ns, sha256, schema_sha256, items, ingested_at)
+                    VALUES (:source, :path, :size, :mtime_ns, :sha256, :schema_sha256, :items, CURRENT_TIMESTAMP)
+                    ON CONFLICT(source) DO UPDATE SET
+                        path = excluded.path, size = excluded.size, mtime_ns = excluded.mtime_ns,
+                        sha256 = excluded.sha256, schema_sha256 = excluded.schema_sha256,
+                        items = COALESCE(excluded.items, items),
+                        -- A re-fingerprint without a load (items NULL) keeps the ingest time
+                        ingested_at = CASE WHEN excluded.items IS NULL THEN ingested_at ELSE excluded.ingested_at END
+                """, {"source": source, "items": items, **fingerprint.model_dump()})
+        except sqlite3.OperationalError as e:
+            logger.warning("ingest_state_not_recorded", source=source, error=str(e))
+
+# Singleton Instance
+ingest_state = IngestState()
@@ -0,0 +1,233 @@
+# ==========================================
+# File: src/services/ledger_importer.py
+# ==========================================
+import csv
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.core.db_manager import DBManager, db_manager
+
+# Column order written by DataLoader.sync_db_to_csv
+LEDGER_COLUMNS = ("vendor_id", "name", "email", "phone", "address", "company", "role",
+                  "invoice_id", "amount", "status", "due_date", "invoice_date")
+
+# Default: vendors are insert-only, so a CSV that lags behind SQL (contact updates
+# made through chat are exported with a delay) never reverts them
+_INSERT_VENDOR_SQL = """
+    INSERT INTO vendors (vendor_id_str, name, contact_name, email, phone, address, category)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT DO NOTHING
+"""
+
+# overwrite_vendors: known vendors take the CSV's values when a field changed. A row
+# whose email belongs to another vendor (ignoring case) is rejected (DO NOTHING / guarded update).
+_UPSERT_VENDOR_SQL = """
+    INSERT INTO vendors (vendor_id_str, name, contact_name, email, phone, address, category)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (vendor_id_str) DO UPDATE SET
+        name = excluded.name, contact_name = excluded.contact_name, email = excluded.email,
+        phone = excluded.phone, address = excluded.address, category = excluded.category
+    WHERE (name, contact_name, email, phone, address, category) IS NOT
+          (excluded.name, excluded.contact_name, excluded.email, excluded.phone, excluded.address, excluded.category)
+      AND NOT EXISTS (SELECT 1 FROM vendors other
+                      WHERE LOWER(other.email) = LOWER(excluded.email)
+                        AND other.vendor_id_str IS NOT excluded.vendor_id_str)
+    ON CONFLICT DO NOTHING
+"""
+
+_UPSERT_INVOICE_SQL = """
+    INSERT INTO invoices (vendor_id, invoice_number, amount, status, issue_date, due_date)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (invoice_number) DO UPDATE SET
+        vendor_id = excluded.vendor_id, amount = excluded.amount, status = excluded.status,
+        issue_date = excluded.issue_date, due_date = excluded.due_date
+    WHERE (vendor_id, amount, status, issue_date, due_date) IS NOT
+          (excluded.vendor_id, excluded.amount, excluded.status, excluded.issue_date, excluded.due_date)
+"""
+
+# vendors columns compared (and recorded in vendor_change_log) when overwriting
+_VENDOR_FIELDS = ("name", "contact_name", "email", "phone", "address", "category")
+
+# SQLite's default limit on host parameters per statement is 999
+_IN_CLAUSE_LIMIT = 900
+
+# Connection-local tuning for the duration of one import
+_BULK_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -200000",   # ~200 MB page cache
+)
+
+
+def resolve_vendor_ids(conn, vendor_id_strs: List[str]) -> Dict[str, int]:
+    """vendors.id for each known CSV vendor id (batched IN queries)."""
+    resolved = {}
+    for i in range(0, len(vendor_id_strs), _IN_CLAUSE_LIMIT):
+        batch = vendor_id_strs[i:i + _IN_CLAUSE_LIMIT]
+        placeholders = ",".join("?" * len(batch))
+        resolved.update(conn.execute(
+            f"SELECT vendor_id_str, id FROM vendors WHERE vendor_id_str IN ({placeholders})", batch
+        ).fetchall())
+    return resolved
+
+
+def _vendor_snapshot(conn, vendor_id_strs: List[str]) -> Dict[str, tuple]:
+    """(vendors.id, *_VENDOR_FIELDS) of each known CSV vendor id (batched IN queries)."""
+    snapshot = {}
+    for i in range(0, len(vendor_id_strs), _IN_CLAUSE_LIMIT):
+        batch = vendor_id_strs[i:i + _IN_CLAUSE_LIMIT]
+        placeholders = ",".join("?" * len(batch))
+        for row in conn.execute(
+                f"SELECT vendor_id_str, id, {', '.join(_VENDOR_FIELDS)} FROM vendors "
+                f"WHERE vendor_id_str IN ({placeholders})", batch):
+            snapshot[row[0]] = tuple(row[1:])
+    return snapshot
+
+
+def _log_vendor_changes(conn, before: Dict[str, tuple], after: Dict[str, tuple]) -> None:
+    """Outbox rows (vendor_change_log) for the fields an overwrite changed, like VendorService updates."""
+    conn.executemany("""
+        INSERT INTO vendor_change_log (vendor_id, vendor_id_str, field, old_value, new_value)
+        VALUES (?, ?, ?, ?, ?)
+    """, (
+        (new[0], vendor_id, field, old_value, new_value)
+        for vendor_id, old in before.items() if (new := after.get(vendor_id)) and new != old
+        for field, old_value, new_value in zip(_VENDOR_FIELDS, old[1:], new[1:]) if old_value != new_value
+    ))
+
+
+def _records(reader, width: int, skipped: List[int]) -> Iterator[list]:
+    """
+    Data rows of the reader. Blank lines (csv.reader yields []) are dropped;
+    rows with fewer than width fields are dropped with a warning and their
+    line numbers appended to skipped.
+    """
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        if len(row) < width:
+            skipped.append(reader.line_num)
+            logger.warning("ledger_import_row_skipped", line=reader.line_num, fields=len(row), expected=width)
+            continue
+        yield row
+
+
+def _chunks(rows: Iterable[list], size: int) -> Iterator[List[list]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+class LedgerImporter:
+    """
+    Bulk loader for ledger_data.csv (vendors + invoices).
+
+    Streams the CSV in chunks, dedupes vendors in memory, resolves vendor ids
+    through a single in-memory map (one IN query per chunk for new vendors)
+    and writes with executemany: invoices are upserted, so edited rows
+    replace what an earlier import stored; vendors only when asked to
+    (overwrite_vendors), since SQL holds the newer contact details. The
+    whole file is one transaction, so readers see the previous or the new
+    ledger, never a partial load.
+    """
+
+    def __init__(self, db: Optional[DBManager] = None, chunk_size: Optional[int] = None):
+        self.db = db or db_manager
+        self.chunk_size = chunk_size or settings.LEDGER_IMPORT_CHUNK_SIZE
+        # Stats of the most recent import (rows, vendors/invoices added and updated, rows_skipped, seconds, ...)
+        self.last_stats: Dict[str, float] = {}
+
+    def import_csv(self, csv_path: Union[str, Path], overwrite_vendors: bool = False) -> int:
+        """
+        Merges the CSV into SQL: new vendors/invoices are inserted and existing
+        invoices (same invoice_id) take the CSV's values.
+
+        Blank lines are ignored and rows with missing fields are skipped.
+
+        Args:
+            csv_path: The ledger CSV.
+            overwrite_vendors: Existing vendors also take the CSV's values (forced
+                re-index); each changed field is recorded in vendor_change_log.
+
+        Returns:
+            int: Number of CSV rows processed.
+        """
+        start = time.perf_counter()
+        rows = vendors_added = vendor_changes = invoice_changes = 0
+
+        with open(csv_path, "r", encoding="utf-8", newline="") as f, self.db.get_connection() as conn:
+            for pragma in _BULK_PRAGMAS:
+                conn.execute(pragma)
+
+            # vendor_id_str -> vendors.id, loaded once
+            vendor_ids: Dict[str, int] = dict(conn.execute("SELECT vendor_id_str, id FROM vendors").fetchall())
+            invoices_before = conn.execute("SELECT COUNT(*) FROM invoices").fetchone()[0]
+            seen_vendors = set()
+
+            # csv.reader + column positions is ~2x faster than DictReader on large files
+            reader = csv.reader(f)
+            # An empty file has no header (and no rows): fall back to the export's column order
+            col = {name: i for i, name in enumerate(next(reader, None) or LEDGER_COLUMNS)}
+            vendor_col = col["vendor_id"]
+            vendor_cols = [col[c] for c in ("vendor_id", "company", "name", "email", "phone", "address", "role")]
+            invoice_cols = [col[c] for c in ("invoice_id", "amount", "status", "invoice_date", "due_date")]
+
+            skipped: List[int] = []
+            records = _records(reader, max(col.values()) + 1, skipped)
+            for chunk in _chunks(records, self.chunk_size):
+                rows += len(chunk)
+
+                # 1. Vendors, first occurrence in the file wins
+                chunk_vendors: Dict[str, tuple] = {}
+                for row in chunk:
+                    vendor_id = row[vendor_col]
+                    if vendor_id not in seen_vendors and vendor_id not in chunk_vendors:
+                        chunk_vendors[vendor_id] = tuple(row[i] for i in vendor_cols)
+                if chunk_vendors:
+                    seen_vendors.update(chunk_vendors)
+                    before = conn.total_changes
+                    if overwrite_vendors:
+                        known = [v for v in chunk_vendors if v in vendor_ids]
+                        snapshot = _vendor_snapshot(conn, known)
+                        conn.executemany(_UPSERT_VENDOR_SQL, chunk_vendors.values())
+                        vendor_changes += conn.total_changes - before
+                        _log_vendor_changes(conn, snapshot, _vendor_snapshot(conn, known))
+                    else:
+                        conn.executemany(_INSERT_VENDOR_SQL, chunk_vendors.values())
+                        vendor_changes += conn.total_changes - before
+                    new_ids = [v for v in chunk_vendors if v not in vendor_ids]
+                    resolved = resolve_vendor_ids(conn, new_ids)
+                    vendors_added += len(resolved)
+                    vendor_ids.update(resolved)
+
+                # 2. Invoices; rows whose vendor was rejected (e.g. duplicate email) are skipped
+                before = conn.total_changes
+                conn.executemany(_UPSERT_INVOICE_SQL, (
+                    (vendor_ids[row[vendor_col]], *(row[i] for i in invoice_cols))
+                    for row in chunk if row[vendor_col] in vendor_ids
+                ))
+                invoice_changes += conn.total_changes - before
+
+            invoices_added = conn.execute("SELECT COUNT(*) FROM invoices").fetchone()[0] - invoices_before
+
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            "rows": rows,
+            "vendors_added": vendors_added,
+            "vendors_updated": vendor_changes - vendors_added,
+            "invoices_added": invoices_added,
+            "invoices_updated": invoice_changes - invoices_added,
+            "rows_skipped": len(skipped),
+            "seconds": round(elapsed, 3),
+            "rows_per_sec": round(rows / elapsed, 1) if elapsed else float(rows),
+        }
+        logger.info("ledger_import_complete", path=str(csv_path), overwrite_vendors=overwrite_vendors,
+                    **self.last_stats)
+        return rows
+
+# Singleton Instance
+ledger_importer = LedgerImporter()
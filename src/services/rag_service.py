@@ -3,23 +3,107 @@
 # ==========================================
 import logging
 import os
+import re
 from pathlib import Path
 from typing import List
 
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
 
-from src.core.vector_manager import vector_manager
+from src.core.vector_manager import vector_manager, POLICY_NAMESPACE
+from src.core.lexical_index import reciprocal_rank_fusion
+from src.services.document_pipeline import document_pipeline
+from src.services.context_compressor import context_compressor, estimate_tokens
+from src.common.cache import LRUCache
+from src.common.metrics import metrics
+from src.common.exceptions import ServiceOverloadedException
 from config.settings import settings
 
 logger = logging.getLogger(settings.APP_NAME)
 
+# Short context for off-topic queries: keeps the drafter prompt small and stops it citing unrelated excerpts
+NO_POLICY_CONTEXT = "No relevant policy documents found."
+
 class RAGService:
     """
     Service responsible for Policy Retrieval and Knowledge Management.
     Used by the RAGExecutor node to fetch context for the Drafter.
     """
 
+    def __init__(self):
+        # Formatted context keyed by (normalized query, k, index version)
+        self._context_cache = LRUCache(settings.RAG_CONTEXT_CACHE_SIZE)
+        # Query embeddings keyed by normalized query (independent of the index)
+        self._embedding_cache = LRUCache(settings.RAG_EMBEDDING_CACHE_SIZE)
+        self._cached_index_version = None
+
+        metrics.register_gauge("rag_context_cache", self._context_cache.stats)
+        metrics.register_gauge("rag_embedding_cache", self._embedding_cache.stats)
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Lower-cases, collapses whitespace and drops trailing punctuation."""
+        return re.sub(r"\s+", " ", query).strip().lower().rstrip("?!. ")
+
+    def _get_query_embedding(self, normalized_query: str) -> List[float]:
+        embedding = self._embedding_cache.get(normalized_query)
+        if embedding is None:
+            embedding = vector_manager.embed_query(normalized_query)
+            metrics.inc("rag_embedding_calls")
+            self._embedding_cache.put(normalized_query, embedding)
+        return embedding
+
+    def _search_policy(self, normalized_query: str, k: int) -> List[Document]:
+        """
+        Hybrid search over the policy namespace.
+        1. BM25 first: if the best lexical match clears LEXICAL_FAST_PATH_THRESHOLD,
+           return it without embedding the query.
+        2. Otherwise run the vector search and merge both lists with RRF.
+        With the score threshold on, a query with no vector hit above
+        SIMILARITY_THRESHOLD is treated as off-topic and returns nothing, and
+        lexical hits below it are left out of the merge.
+        """
+        threshold = settings.SIMILARITY_THRESHOLD if settings.RETRIEVAL_SCORE_THRESHOLD_ENABLED else None
+        if not settings.HYBRID_RETRIEVAL_ENABLED:
+            embedding = self._get_query_embedding(normalized_query)
+            return vector_manager.search_by_vector(embedding, k=k, namespace=POLICY_NAMESPACE,
+                                                   score_threshold=threshold)
+
+        lexical_docs, confidence = vector_manager.lexical_search(normalized_query, k=k, namespace=POLICY_NAMESPACE)
+        if lexical_docs and confidence >= settings.LEXICAL_FAST_PATH_THRESHOLD:
+            metrics.inc("rag_lexical_fast_path")
+            logger.info(f"Lexical fast path (confidence {confidence:.2f}) for query: '{normalized_query}'")
+            return lexical_docs
+
+        try:
+            embedding = self._get_query_embedding(normalized_query)
+        except ServiceOverloadedException:
+            if not lexical_docs:
+                raise
+            # Embedding provider saturated: answer from BM25 alone rather than failing
+            metrics.inc("rag_lexical_overload_fallback")
+            return lexical_docs
+        vector_docs = vector_manager.search_by_vector(embedding, k=k, namespace=POLICY_NAMESPACE,
+                                                      score_threshold=threshold)
+        if not vector_docs:
+            # Weak lexical matches alone are not evidence of a relevant policy
+            return []
+        if threshold is not None:
+            # RRF ranks carry no similarity: lexical hits must clear the same cutoff
+            lexical_docs = vector_manager.filter_by_similarity(embedding, lexical_docs, threshold,
+                                                               namespace=POLICY_NAMESPACE)
+        metrics.inc("rag_hybrid_merges")
+        return reciprocal_rank_fusion([lexical_docs, vector_docs], k=settings.RRF_K)[:k]
+
+    @staticmethod
+    def _record_compression(docs: List[Document], context: str) -> None:
+        """Logs and counts the drafter prompt-size reduction for one POLICY request."""
+        tokens_before = sum(estimate_tokens(doc.page_content) for doc in docs)
+        tokens_after = estimate_tokens(context)
+        metrics.inc("rag_context_tokens_before", tokens_before)
+        metrics.inc("rag_context_tokens_after", tokens_after)
+        reduction = 1 - tokens_after / tokens_before if tokens_before else 0.0
+        logger.info(f"Policy context compressed: ~{tokens_before} -> ~{tokens_after} tokens ({reduction:.0%} smaller)")
+
     def retrieve_policy_context(self, query: str, k: int = 3) -> str:
         """
         Retrieves the most relevant policy chunks for a given query.
@@ -31,31 +115,52 @@ class RAGService:
         Returns:
             str: A formatted string containing the retrieved context.
         """
+        normalized_query = self._normalize_query(query)
+        index_version = vector_manager.version
+        if index_version != self._cached_index_version:
+            # The index changed (add_documents / reset): every cached context is stale
+            self._context_cache.clear()
+            self._cached_index_version = index_version
+
+        cache_key = (normalized_query, k, index_version)
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"RAG cache hit for query: '{query}'")
+            return cached
+
         try:
-            # 1. Get the retriever from our Singleton Manager
-            retriever = vector_manager.get_retriever(k=k)
-            
-            # 2. Execute Search
-            docs = retriever.invoke(query)
-            
+            # 1. Search the policy namespace only (lexical fast path, else hybrid)
+            docs = self._search_policy(normalized_query, k)
+
             if not docs:
-                logger.info(f"RAG Search yielded no results for: '{query}'")
-                return "No relevant policy documents found."
+                logger.info(f"RAG Search yielded no results above threshold for: '{query}'")
+                metrics.inc("rag_no_relevant_policy")
+                result_str = NO_POLICY_CONTEXT
+                self._context_cache.put(cache_key, result_str)
+                return result_str
+
+            # 2. Keep only the sentences relevant to the query, within the token budget
+            excerpts = [(doc, doc.page_content.replace("\n", " ").strip()) for doc in docs]
+            if settings.RAG_COMPRESSION_ENABLED:
+                excerpts = context_compressor.compress(normalized_query, docs)
 
             # 3. Format Context for the LLM
             # We explicitly label excerpts to help the LLM cite sources if needed
             formatted_chunks = []
-            for i, doc in enumerate(docs, 1):
-                content = doc.page_content.replace("\n", " ").strip()
+            for i, (doc, content) in enumerate(excerpts, 1):
                 source = doc.metadata.get("source", "Policy Doc")
                 page = doc.metadata.get("page", "N/A")
                 chunk_str = f"[Excerpt {i} from {source} (Page {page})]:\n{content}"
                 formatted_chunks.append(chunk_str)
 
             result_str = "\n\n".join(formatted_chunks)
+            self._record_compression(docs, result_str)
             logger.info(f"Retrieved {len(docs)} chunks for query: '{query}'")
+            self._context_cache.put(cache_key, result_str)
             return result_str
 
+        except ServiceOverloadedException:
+            raise
         except RuntimeError as re:
             # Handles the case where the index is empty
             logger.warning(f"RAG Retrieval skipped: {re}")
@@ -64,9 +169,46 @@ class RAGService:
             logger.error(f"RAG Retrieval failed: {e}")
             return "Error retrieving policy information."
 
+    def retrieve_vendor_history(self, query: str, vendor_id: str, k: int = 3) -> str:
+        """
+        Retrieves past email exchanges for a single vendor from the email archive.
+
+        Args:
+            query (str): The user's question.
+            vendor_id (str): The CSV Vendor ID (e.g., V7755) stored in the archive metadata.
+            k (int): Number of archived emails to retrieve.
+
+        Returns:
+            str: A formatted string containing the matching archive entries.
+        """
+        try:
+            docs = vector_manager.search_vendor_archive(query, vendor_id=vendor_id, k=k)
+
+            if not docs:
+                logger.info(f"Archive search yielded no results for vendor {vendor_id}")
+                return "No previous correspondence found."
+
+            formatted_chunks = []
+            for i, doc in enumerate(docs, 1):
+                content = doc.page_content.replace("\n", " ").strip()
+                invoice = doc.metadata.get("invoice_id", "N/A")
+                formatted_chunks.append(f"[Archived Email {i} (Invoice {invoice})]:\n{content}")
+
+            return "\n\n".join(formatted_chunks)
+
+        except ServiceOverloadedException:
+            raise
+        except RuntimeError as re:
+            logger.warning(f"Archive Retrieval skipped: {re}")
+            return "Email archive is currently empty."
+        except Exception as e:
+            logger.error(f"Archive Retrieval failed: {e}")
+            return "Error retrieving previous correspondence."
+
     def ingest_policy_file(self, file_path: str = None) -> str:
         """
-        Admin Utility: Loads a PDF, splits it, and indexes it into FAISS.
+        Admin Utility: Streams a PDF (or every PDF in a folder) through the
+        DocumentPipeline and indexes the chunks into FAISS.
         Defaults to the policy.pdf defined in settings.
         """
         target_path = file_path or str(settings.RAW_DATA_DIR / "policy.pdf")
@@ -76,24 +218,8 @@ class RAGService:
 
         try:
             logger.info(f"Starting ingestion for: {target_path}")
-            
-            # 1. Load PDF
-            loader = PyPDFLoader(target_path)
-            docs = loader.load()
-            
-            # 2. Split Text (Optimized for Policy retrieval)
-            # Policies usually have paragraphs; 1000 chars is a good balance.
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000,
-                chunk_overlap=200,
-                separators=["\n\n", "\n", ".", " ", ""]
-            )
-            splits = text_splitter.split_documents(docs)
-            
-            # 3. Index via VectorManager
-            vector_manager.add_documents(splits)
-            
-            return f"Successfully ingested {len(splits)} chunks from {Path(target_path).name}."
+            chunks = document_pipeline.ingest([target_path], namespace=POLICY_NAMESPACE)
+            return f"Successfully ingested {chunks} chunks from {Path(target_path).name}."
 
         except Exception as e:
             logger.error(f"Ingestion failed: {e}")
@@ -0,0 +1,61 @@
+# ==========================================
+# File: src/services/readiness.py
+# ==========================================
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from config.logging_config import GLOBAL_LOGGER as logger
+
+SQL = "sql"
+VECTOR = "vector"
+SUBSYSTEMS = (SQL, VECTOR)
+
+# pending -> starting -> ready | degraded (usable, but a source failed) | failed (unusable)
+USABLE_STATES = ("ready", "degraded")
+
+
+class SubsystemState(BaseModel):
+    state: str = "pending"
+    detail: Optional[str] = None
+    since: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class ReadinessRegistry:
+    """
+    Per-subsystem startup state, reported by GET /readyz and checked by request
+    handlers that need a subsystem (so they can answer fast instead of blocking
+    on a bootstrap still in progress).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: Dict[str, SubsystemState] = {name: SubsystemState() for name in SUBSYSTEMS}
+
+    def set(self, subsystem: str, state: str, detail: Optional[str] = None) -> None:
+        with self._lock:
+            self._states[subsystem] = SubsystemState(state=state, detail=detail)
+        logger.info("subsystem_state_changed", subsystem=subsystem, state=state, detail=detail)
+
+    def is_ready(self, subsystem: str) -> bool:
+        return self._states[subsystem].state in USABLE_STATES
+
+    def not_ready(self) -> list:
+        return [name for name in SUBSYSTEMS if not self.is_ready(name)]
+
+    @property
+    def ready(self) -> bool:
+        return not self.not_ready()
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {name: state.model_dump(mode="json") for name, state in self._states.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._states = {name: SubsystemState() for name in SUBSYSTEMS}
+
+# Singleton Instance
+readiness = ReadinessRegistry()
@@ -0,0 +1,126 @@
+# ==========================================
+# File: src/services/reindex_service.py
+# ==========================================
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.exceptions import ValidationException, ReindexInProgressException
+from src.common.file_lock import ingest_lock
+from src.core.vector_manager import vector_manager
+from src.services.data_loader import data_loader, SOURCE_FILES
+
+
+class ReindexJob(BaseModel):
+    """
+    Progress of one hot re-index run (returned by the admin API).
+    """
+    job_id: str
+    status: str = "queued"  # queued | running | succeeded | failed
+    sources: List[str]
+    current_source: Optional[str] = None
+    completed: Dict[str, int] = Field(default_factory=dict, description="source -> rows/chunks loaded")
+    skipped: List[str] = Field(default_factory=list, description="sources unchanged since the last re-index")
+    progress: float = 0.0
+    error: Optional[str] = None
+    index_version: Optional[int] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None
+
+
+class ReindexService:
+    """
+    Runs re-ingestion of changed raw sources in a background thread while the
+    server keeps answering requests.
+
+    - SQL: the ledger merge commits as one transaction (readers see old or new).
+    - Vectors: each namespace is rebuilt into a new generation and swapped in
+      atomically (see VectorManager.add_document_batches(replace=True)).
+    Unless forced, sources unchanged since their last successful ingest
+    (ingest_state fingerprints, shared with startup) are skipped and the
+    ledger only adds vendors (SQL holds the newer contact details).
+    Only one job runs at a time, and it holds the ingest file lock so it never
+    writes concurrently with another worker process; the other workers pick up
+    the new generations through their periodic vector refresh.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, ReindexJob] = {}
+        self._lock = threading.Lock()
+        self._running: Optional[str] = None
+
+    def start(self, sources: Optional[List[str]] = None, force: bool = False) -> ReindexJob:
+        """
+        Queues a re-index of `sources` (default: those ingest_all loads) and returns immediately.
+
+        Raises:
+            ValidationException: Unknown source name.
+            ReindexInProgressException: Another job is still running.
+        """
+        sources = list(sources or data_loader.enabled_sources())
+        unknown = [s for s in sources if s not in SOURCE_FILES]
+        if unknown:
+            raise ValidationException(f"Unknown sources: {unknown}. Expected any of {list(SOURCE_FILES)}")
+
+        with self._lock:
+            if self._running:
+                raise ReindexInProgressException(f"Re-index job {self._running} is still running")
+            job = ReindexJob(job_id=uuid.uuid4().hex[:12], sources=sources)
+            self._jobs[job.job_id] = job
+            self._running = job.job_id
+
+        threading.Thread(target=self._run, args=(job, force), name=f"reindex-{job.job_id}", daemon=True).start()
+        logger.info("reindex_job_queued", job_id=job.job_id, sources=sources, force=force)
+        return job
+
+    def get(self, job_id: str) -> Optional[ReindexJob]:
+        return self._jobs.get(job_id)
+
+    def latest(self) -> Optional[ReindexJob]:
+        return max(self._jobs.values(), key=lambda job: job.created_at, default=None)
+
+    def _run(self, job: ReindexJob, force: bool) -> None:
+        log = logger.bind(job_id=job.job_id)
+        start = time.perf_counter()
+        job.status = "running"
+        lock = ingest_lock()
+        try:
+            # Other worker processes may be ingesting (bootstrap leader, their own re-index job)
+            lock.acquire()
+            for i, source in enumerate(job.sources):
+                job.current_source = source
+                log.info("reindex_source_started", source=source)
+                result = data_loader.ingest_source(source, replace=True, skip_unchanged=not force,
+                                                   overwrite_vendors=force)
+                if result["status"] == "skipped":
+                    job.skipped.append(source)
+                    log.info("reindex_source_skipped", source=source, reason=result.get("reason"))
+                else:
+                    job.completed[source] = result["items"]
+                    log.info("reindex_source_promoted", source=source, loaded=job.completed[source])
+                job.progress = round((i + 1) / len(job.sources), 3)
+
+            job.status = "succeeded"
+        except Exception as e:
+            # The live generation is untouched when a rebuild fails before its swap
+            job.status = "failed"
+            job.error = str(e)
+            log.error("reindex_job_failed", source=job.current_source, error=str(e))
+        finally:
+            lock.release()
+            job.current_source = None
+            job.index_version = vector_manager.version
+            job.finished_at = datetime.now(timezone.utc)
+            job.duration_seconds = round(time.perf_counter() - start, 3)
+            with self._lock:
+                self._running = None
+            log.info("reindex_job_finished", status=job.status, duration_seconds=job.duration_seconds)
+
+# Singleton Instance
+reindex_service = ReindexService()
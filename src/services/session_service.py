@@ -2,7 +2,7 @@
 # File: src/services/session_service.py
 # ==========================================
 import logging
-from typing import List
+from typing import Dict, Iterable, List
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 
 from src.core.db_manager import db_manager
@@ -76,5 +76,41 @@ class SessionService:
             logger.error(f"Error retrieving history for thread {thread_id}: {e}")
             return []
 
+    def get_chat_histories(self, thread_ids: Iterable[str], limit: int = 5) -> Dict[str, List[BaseMessage]]:
+        """
+        Bulk get_chat_history: the last N messages of every thread in one query.
+
+        Returns:
+            Dict[str, List[BaseMessage]]: thread_id -> messages, oldest first.
+        """
+        thread_ids = sorted(set(thread_ids))
+        histories: Dict[str, List[BaseMessage]] = {thread_id: [] for thread_id in thread_ids}
+        if not thread_ids:
+            return histories
+
+        # Rank each thread's rows newest first and keep the top N per thread
+        query = f"""
+            SELECT thread_id, role, content FROM (
+                SELECT thread_id, role, content, created_at, id,
+                       ROW_NUMBER() OVER (PARTITION BY thread_id ORDER BY created_at DESC, id DESC) AS rank
+                FROM conversation_history
+                WHERE thread_id IN ({','.join('?' * len(thread_ids))})
+            )
+            WHERE rank <= ?
+            ORDER BY thread_id, created_at, id
+        """
+        try:
+            with db_manager.get_connection() as conn:
+                for row in conn.execute(query, [*thread_ids, limit]):
+                    if row['role'] == 'user':
+                        histories[row['thread_id']].append(HumanMessage(content=row['content']))
+                    elif row['role'] == 'assistant':
+                        histories[row['thread_id']].append(AIMessage(content=row['content']))
+            return histories
+
+        except Exception as e:
+            logger.error(f"Error retrieving history for {len(thread_ids)} threads: {e}")
+            return {thread_id: [] for thread_id in thread_ids}
+
 # Singleton Instance
 session_service = SessionService()
\ No newline at end of file
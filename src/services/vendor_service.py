@@ -72,13 +72,20 @@ class VendorService:
         try:
             with db_manager.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(query, (value, vendor_id))
-                
-                if cursor.rowcount > 0:
-                    logger.info("vendor_updated", vendor_id=vendor_id, field=field)
-                    return f"Successfully updated your {field} to '{value}'."
-                else:
+                cursor.execute(f"SELECT vendor_id_str, {field} FROM vendors WHERE id = ?", (vendor_id,))
+                current = cursor.fetchone()
+                if current is None:
                     return "Update failed. Vendor record not found."
+
+                cursor.execute(query, (value, vendor_id))
+                # Outbox row in the same transaction: committed (or rolled back) with the update
+                cursor.execute("""
+                    INSERT INTO vendor_change_log (vendor_id, vendor_id_str, field, old_value, new_value)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (vendor_id, current[0], field, current[1], value))
+
+                logger.info("vendor_updated", vendor_id=vendor_id, field=field, change_id=cursor.lastrowid)
+                return f"Successfully updated your {field} to '{value}'."
                     
         except Exception as e:
             logger.error("error_updating_vendor", error=str(e))
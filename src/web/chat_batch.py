@@ -0,0 +1,103 @@
+# ==========================================
+# File: src/web/chat_batch.py
+# ==========================================
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.exceptions import ServiceOverloadedException
+from src.common.metrics import metrics
+from src.domain.email_schemas import EmailInput
+from src.graph.workflow import app as agent_app
+from src.services.auth_service import auth_service
+from src.services.session_service import session_service
+from src.web.chat_scheduler import chat_scheduler
+
+# Email signature the drafter appends; dropped for chat replies
+EMAIL_SIGNATURE = "Best regards,\nAgentia Vendor Team"
+
+
+def reply_text(output: Dict[str, Any]) -> str:
+    """The chat reply of a finished graph run."""
+    return output.get("generated_email", "No response generated.").replace(EMAIL_SIGNATURE, "").strip()
+
+
+class ChatBatchRunner:
+    """
+    Runs many chat messages (POST /chat/batch) through the graph and yields
+    each result as soon as it completes.
+
+    - Senders are verified with one vendors query and the history of every
+      thread is loaded with one query; the graph nodes use these prefetched
+      values instead of querying per message.
+    - Messages run in waves: wave n holds the n-th message of each thread, so
+      turns on one thread stay in order (later waves load the history the
+      earlier ones saved). Each wave runs with agent_app.abatch_as_completed
+      bounded by max_concurrency.
+    - The turns of all the batch's threads are held for the whole run, so
+      /chat calls on those threads queue behind it.
+    """
+
+    def __init__(self, graph=None):
+        self.graph = graph or agent_app
+
+    @staticmethod
+    def waves(emails: List[EmailInput]) -> List[List[int]]:
+        """Indexes of the batch grouped into waves (n-th message of every thread)."""
+        waves: List[List[int]] = []
+        seen: Dict[str, int] = {}
+        for index, email in enumerate(emails):
+            position = seen.get(email.thread_id, 0)
+            seen[email.thread_id] = position + 1
+            if position == len(waves):
+                waves.append([])
+            waves[position].append(index)
+        return waves
+
+    async def stream(self, emails: List[EmailInput], max_concurrency: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        max_concurrency = max_concurrency or settings.CHAT_BATCH_MAX_CONCURRENCY
+        start = time.perf_counter()
+        thread_ids = {email.thread_id for email in emails}
+        waves = self.waves(emails)
+        log = logger.bind(endpoint="/chat/batch", messages=len(emails), threads=len(thread_ids), waves=len(waves))
+        log.info("chat_batch_started")
+
+        async with chat_scheduler.turns(thread_ids):
+            vendors = await run_in_threadpool(auth_service.verify_vendors, [email.sender for email in emails])
+            histories = await run_in_threadpool(session_service.get_chat_histories, thread_ids, 5)
+
+            for wave_number, wave in enumerate(waves):
+                states = []
+                for index in wave:
+                    email = emails[index]
+                    prefetched = {"vendor": vendors.get(auth_service.normalize_email(email.sender))}
+                    if wave_number == 0:
+                        # Later waves need the history their own thread's earlier turns saved
+                        prefetched["history"] = histories.get(email.thread_id, [])
+                    states.append({"email_input": email, "messages": [], "trials": 0, "prefetched": prefetched})
+
+                async for position, output in self.graph.abatch_as_completed(
+                        states, config={"max_concurrency": max_concurrency}, return_exceptions=True):
+                    yield self._result(wave[position], emails[wave[position]], output)
+
+        metrics.inc("chat_batch_messages", len(emails))
+        log.info("chat_batch_finished", seconds=round(time.perf_counter() - start, 3))
+
+    @staticmethod
+    def _result(index: int, email: EmailInput, output: Any) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"index": index, "thread_id": email.thread_id}
+        if isinstance(output, ServiceOverloadedException):
+            metrics.inc("chat_overloaded_responses")
+            result.update(error="overloaded", retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS)
+        elif isinstance(output, Exception):
+            logger.error("web_chat_error", endpoint="/chat/batch", thread_id=email.thread_id, error=str(output))
+            result.update(error="System Error: Please check the logs.")
+        else:
+            result["response"] = reply_text(output)
+        return result
+
+# Singleton Instance
+chat_batch_runner = ChatBatchRunner()
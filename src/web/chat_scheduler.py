@@ -0,0 +1,101 @@
+# ==========================================
+# File: src/web/chat_scheduler.py
+# ==========================================
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional
+
+from config.settings import settings
+from config.logging_config import GLOBAL_LOGGER as logger
+from src.common.metrics import metrics
+
+
+class _ThreadQueue:
+    """FIFO turn lock of one conversation thread, dropped when nobody holds or awaits it."""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class ChatScheduler:
+    """
+    Orders /chat turns per conversation thread and coalesces duplicate requests.
+
+    Turns on the same thread_id run one at a time in arrival order (asyncio.Lock
+    wakes waiters FIFO), so each turn loads the history saved by the previous
+    one; turns on different threads run concurrently. A request identical to
+    one still queued or running (same key, i.e. the same request body) does
+    not start another graph run: it awaits the first one and gets its result.
+
+    State is per event loop / worker process; with several workers, turns on
+    one thread are only ordered if the load balancer routes by thread_id.
+    """
+
+    def __init__(self, coalesce: Optional[bool] = None):
+        self.coalesce = settings.CHAT_COALESCE_REQUESTS if coalesce is None else coalesce
+        self._threads: Dict[str, _ThreadQueue] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        metrics.register_gauge("chat_threads_active", lambda: len(self._threads))
+
+    async def run(self, thread_id: str, key: str, turn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs turn() once it is this thread's turn and returns its result (or
+        the result of an identical in-flight request).
+        """
+        if self.coalesce and key in self._inflight:
+            metrics.inc("chat_requests_coalesced")
+            logger.info("chat_request_coalesced", thread_id=thread_id)
+            # shield: a disconnecting duplicate must not cancel the shared run
+            return await asyncio.shield(self._inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        if self.coalesce:
+            self._inflight[key] = future
+        try:
+            result = await self._run_in_turn(thread_id, turn)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved: no "never retrieved" warning without duplicates
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _run_in_turn(self, thread_id: str, turn: Callable[[], Awaitable[Any]]) -> Any:
+        async with self.turn(thread_id):
+            return await turn()
+
+    @asynccontextmanager
+    async def turn(self, thread_id: str) -> AsyncIterator[None]:
+        """Holds the thread's turn for the duration of the block."""
+        queue = self._threads.get(thread_id)
+        if queue is None:
+            queue = self._threads[thread_id] = _ThreadQueue()
+        queue.users += 1
+        waited = time.perf_counter()
+        try:
+            async with queue.lock:
+                wait = time.perf_counter() - waited
+                if wait > 0.001:
+                    metrics.inc("chat_thread_waits")
+                    metrics.inc("chat_thread_wait_seconds", wait)
+                yield
+        finally:
+            queue.users -= 1
+            if queue.users == 0:
+                del self._threads[thread_id]
+
+    @asynccontextmanager
+    async def turns(self, thread_ids: Iterable[str]) -> AsyncIterator[None]:
+        """Holds the turns of several threads (taken in sorted order, so two holders never deadlock)."""
+        async with AsyncExitStack() as stack:
+            for thread_id in sorted(set(thread_ids)):
+                await stack.enter_async_context(self.turn(thread_id))
+            yield
+
+# Singleton Instance
+chat_scheduler = ChatScheduler()
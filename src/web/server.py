@@ -1,11 +1,16 @@
 # ==========================================
 # File: src/web/server.py
 # ==========================================
+import hmac
+import json
+from typing import List, Optional
+
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import AnyHttpUrl, BaseModel, Field
 import sys
 import os
 
@@ -16,8 +21,16 @@ from src.graph.workflow import app as agent_app
 from src.domain.email_schemas import EmailInput
 from config.logging_config import GLOBAL_LOGGER as logger
 from config.settings import settings
-from src.core.db_manager import db_manager
-from src.services.data_loader import data_loader
+from src.common.metrics import metrics
+from src.common.exceptions import ValidationException, ReindexInProgressException, ServiceOverloadedException
+from src.services.reindex_service import reindex_service
+from src.services.csv_exporter import csv_exporter
+from src.services.change_feed import change_feed
+from src.services.bootstrap import bootstrap_service
+from src.services.email_job_service import email_job_service
+from src.services.readiness import readiness, SQL
+from src.web.chat_scheduler import chat_scheduler
+from src.web.chat_batch import chat_batch_runner, reply_text
 
 # Initialize FastAPI
 app = FastAPI(title="Agentia Vendor Portal")
@@ -26,38 +39,158 @@ app = FastAPI(title="Agentia Vendor Portal")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
+OVERLOADED_RESPONSE = "The assistant is handling a lot of requests right now. Please try again in a moment."
+STARTING_UP_RESPONSE = "The assistant is still starting up and can't look up your records yet. Please try again in a few seconds."
+
 # --- LIFECYCLE EVENTS ---
 @app.on_event("startup")
 async def startup_event():
     """
-    Ensures the DB is initialized and CSV data is loaded when the server starts.
+    Starts the bootstrap (artifact install or schema + ingestion). It runs in the
+    background by default, so the server accepts requests right away; GET /readyz
+    reports when SQL and the vector indexes are usable.
     """
     logger.info("web_server_startup_initiated")
-    
-    # 1. Initialize Schema
-    schema_path = settings.BASE_DIR / "data/sql/schema.sql"
-    try:
-        with open(schema_path, "r") as f:
-            schema_sql = f.read()
-        with db_manager.get_connection() as conn:
-            conn.executescript(schema_sql)
-        logger.info("schema_verified")
-    except Exception as e:
-        logger.error("schema_load_failed", error=str(e))
+    if settings.BOOTSTRAP_IN_BACKGROUND:
+        bootstrap_service.start()
+    else:
+        bootstrap_service.run()
+    # Job workers wait for SQL readiness before draining email_jobs
+    email_job_service.start()
 
-    # 2. Ingest CSV Data
-    data_loader.ingest_all()
-    logger.info("data_ingestion_complete")
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Write out CSV changes still waiting for their debounce window
+    csv_exporter.shutdown()
+    email_job_service.shutdown()
 
 class ChatRequest(BaseModel):
     sender: str
     thread_id: str
     message: str
 
+    def to_email_input(self) -> EmailInput:
+        """Maps the web message to the agent's input."""
+        return EmailInput(
+            id=f"web_{self.thread_id}",
+            thread_id=self.thread_id,
+            message_id="web_msg",
+            references="",
+            sender=self.sender,
+            subject="Web Chat Inquiry",
+            body=self.message
+        )
+
+class ChatBatchRequest(BaseModel):
+    requests: List[ChatRequest] = Field(..., min_length=1, max_length=settings.CHAT_BATCH_MAX_ITEMS)
+    max_concurrency: Optional[int] = Field(default=None, ge=1)  # capped at CHAT_BATCH_MAX_CONCURRENCY
+
 @app.get("/")
 async def serve_frontend(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
+@app.get("/healthz")
+async def healthz():
+    """Liveness: the process is up and serving (independent of data loading)."""
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def readyz():
+    """
+    Readiness per subsystem (pending / starting / ready / degraded / failed).
+    200 once every subsystem is usable ("degraded" = a source failed to load,
+    previously loaded data is served), 503 before that.
+    """
+    body = {"ready": readiness.ready, "subsystems": readiness.snapshot()}
+    return JSONResponse(body, status_code=200 if body["ready"] else 503)
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """
+    Process-local operational metrics (cache hit rates, etc.) as JSON.
+    """
+    return metrics.snapshot()
+
+# --- ADMIN API ---
+def require_admin(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    Dependency guarding /admin/*: the X-Admin-Token header must match ADMIN_API_TOKEN.
+    """
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(status_code=503, detail="Admin API is disabled (ADMIN_API_TOKEN not set).")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_API_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token.")
+
+class ReindexRequest(BaseModel):
+    sources: Optional[List[str]] = None  # ledger | library | policy | final_export (default: enabled sources)
+    force: bool = False                  # re-index even if the file is unchanged
+
+@app.post("/admin/reindex", status_code=202, dependencies=[Depends(require_admin)])
+async def start_reindex(payload: ReindexRequest):
+    """
+    Re-ingests changed raw sources in the background; traffic keeps flowing and the
+    new SQL/vector generation is promoted when it is complete.
+    """
+    try:
+        job = reindex_service.start(payload.sources, force=payload.force)
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=e.error_message)
+    except ReindexInProgressException as e:
+        raise HTTPException(status_code=409, detail=e.error_message)
+    return job
+
+@app.get("/admin/reindex", dependencies=[Depends(require_admin)])
+async def latest_reindex():
+    job = reindex_service.latest()
+    if job is None:
+        raise HTTPException(status_code=404, detail="No re-index job has run yet.")
+    return job
+
+@app.get("/admin/reindex/{job_id}", dependencies=[Depends(require_admin)])
+async def reindex_status(job_id: str):
+    job = reindex_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown re-index job: {job_id}")
+    return job
+
+@app.get("/admin/changes", dependencies=[Depends(require_admin)])
+async def vendor_changes(since: int = 0, limit: int = 1000):
+    """
+    Vendor change feed: changes with id > since (pass the last id back as `since`).
+    """
+    changes = change_feed.read(since=since, limit=min(limit, 10000))
+    return {"changes": changes, "next_cursor": changes[-1].id if changes else since}
+
+# --- EMAIL JOBS ---
+class JobRequest(BaseModel):
+    email: EmailInput
+    webhook_url: Optional[AnyHttpUrl] = None  # receives the finished job as a JSON POST
+
+@app.post("/jobs", status_code=202)
+async def submit_job(payload: JobRequest):
+    """
+    Queues an email for background processing and returns the job right away;
+    poll GET /jobs/{job_id} or wait for the webhook.
+    """
+    if not readiness.is_ready(SQL):
+        return JSONResponse(
+            {"detail": STARTING_UP_RESPONSE, "waiting_for": [SQL]},
+            status_code=503,
+            headers={"Retry-After": str(settings.READINESS_RETRY_AFTER_SECONDS)},
+        )
+    webhook_url = str(payload.webhook_url) if payload.webhook_url else None
+    try:
+        return email_job_service.submit(payload.email, webhook_url=webhook_url)
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=e.error_message)
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = email_job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
 @app.post("/chat")
 async def chat_endpoint(payload: ChatRequest):
     """
@@ -66,19 +199,36 @@ async def chat_endpoint(payload: ChatRequest):
     log = logger.bind(endpoint="/chat", thread_id=payload.thread_id)
     log.info("received_web_message", sender=payload.sender)
 
-    # 1. Map Web Input to Agent Input
-    agent_input = EmailInput(
-        id=f"web_{payload.thread_id}",
-        thread_id=payload.thread_id,
-        message_id="web_msg",
-        references="",
-        sender=payload.sender,
-        subject="Web Chat Inquiry",
-        body=payload.message
-    )
+    # Every intent starts with SQL (sender lookup, history): answer fast while it loads
+    if not readiness.is_ready(SQL):
+        metrics.inc("chat_degraded_responses")
+        log.info("chat_degraded_response", waiting_for=SQL)
+        return JSONResponse(
+            {"response": STARTING_UP_RESPONSE, "degraded": True, "waiting_for": [SQL]},
+            status_code=503,
+            headers={"Retry-After": str(settings.READINESS_RETRY_AFTER_SECONDS)},
+        )
 
+    try:
+        # Turns on one thread run in order; a duplicate of an in-flight request shares its result
+        return await chat_scheduler.run(payload.thread_id, payload.model_dump_json(), lambda: run_chat_turn(payload))
+    except ServiceOverloadedException as e:
+        # Refuse fast instead of queueing more provider calls (see AdmissionController)
+        metrics.inc("chat_overloaded_responses")
+        log.warning("chat_overloaded", reason=e.error_message)
+        return JSONResponse(
+            {"response": OVERLOADED_RESPONSE, "overloaded": True},
+            status_code=429,
+            headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)},
+        )
+
+async def run_chat_turn(payload: ChatRequest) -> dict:
+    """Runs the agent graph for one chat message."""
+    log = logger.bind(endpoint="/chat", thread_id=payload.thread_id)
+
+    # 1. Map Web Input to Agent Input
     initial_state = {
-        "email_input": agent_input,
+        "email_input": payload.to_email_input(),
         "messages": [], # MemoryNode will handle history loading
         "trials": 0
     }
@@ -86,17 +236,42 @@ async def chat_endpoint(payload: ChatRequest):
     try:
         # 2. Invoke Graph
         output = await agent_app.ainvoke(initial_state)
-        response_text = output.get("generated_email", "No response generated.")
-        
         # Cleanup: Remove standard email signature for a better chat experience
-        response_text = response_text.replace("Best regards,\nAgentia Vendor Team", "")
-        
-        return {"response": response_text.strip()}
+        return {"response": reply_text(output)}
 
+    except ServiceOverloadedException:
+        raise
     except Exception as e:
         log.error("web_chat_error", error=str(e))
         return {"response": "System Error: Please check the logs."}
 
+@app.post("/chat/batch")
+async def chat_batch_endpoint(payload: ChatBatchRequest):
+    """
+    Replies to many chat messages in one call. Results stream back as NDJSON,
+    one line per message as soon as it completes: {"index", "thread_id",
+    "response"} or {"index", "thread_id", "error"} (index = position in the
+    request).
+    """
+    if not readiness.is_ready(SQL):
+        metrics.inc("chat_degraded_responses")
+        return JSONResponse(
+            {"response": STARTING_UP_RESPONSE, "degraded": True, "waiting_for": [SQL]},
+            status_code=503,
+            headers={"Retry-After": str(settings.READINESS_RETRY_AFTER_SECONDS)},
+        )
+
+    max_concurrency = min(payload.max_concurrency or settings.CHAT_BATCH_MAX_CONCURRENCY,
+                          settings.CHAT_BATCH_MAX_CONCURRENCY)
+    emails = [request.to_email_input() for request in payload.requests]
+
+    async def lines():
+        async for result in chat_batch_runner.stream(emails, max_concurrency=max_concurrency):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 if __name__ == "__main__":
     print("Starting Web Server at http://127.0.0.1:8000")
-    uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
+    # Several workers need the import string; bootstrap elects one of them to ingest
+    uvicorn.run("src.web.server:app", host="127.0.0.1", port=8000, workers=settings.WEB_WORKERS)
\ No newline at end of file
@@ -0,0 +1,50 @@
+import os
+import sys
+
+import pytest
+
+# config.settings validates provider keys at import time; tests never call the provider
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """A fresh VectorManager writing to tmp_path with offline fake embeddings."""
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from config.settings import settings
+    from src.core.vector_manager import VectorManager
+
+    monkeypatch.setattr(type(settings), "VECTOR_STORE_PATH", property(lambda self: str(tmp_path / "vectors")))
+    monkeypatch.setattr(type(settings), "EMBEDDING_CHECKPOINT_DIR", property(lambda self: str(tmp_path / "checkpoints")))
+    monkeypatch.setattr(VectorManager, "_get_embedding_model", lambda self: DeterministicFakeEmbedding(size=16))
+    monkeypatch.setattr(VectorManager, "_instance", None)
+    return VectorManager()
+
+
+LEDGER_CSV = (
+    "vendor_id,name,email,phone,address,company,role,invoice_id,amount,status,due_date,invoice_date\n"
+    "V1,Ann,ann@a.com,1,Addr 1,Acme,Buyer,INV-1,100,Pending,2025-09-01,2025-08-01\n"
+    "V2,Bob,bob@b.com,2,Addr 2,Bolt,Buyer,INV-2,200,Paid,2025-09-02,2025-08-02\n"
+)
+
+
+@pytest.fixture
+def ledger_db(tmp_path, monkeypatch):
+    """A scratch SQL database (schema + two-vendor ledger) and raw dir. Returns (csv_path, db_manager)."""
+    from config.settings import settings
+    from src.core.db_manager import db_manager
+    from src.services.data_loader import data_loader
+
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "ledger_data.csv").write_text(LEDGER_CSV, encoding="utf-8")
+    monkeypatch.setattr(type(settings), "RAW_DATA_DIR", property(lambda self: raw))
+    monkeypatch.setattr(type(settings), "SQL_DB_PATH", property(lambda self: str(tmp_path / "test.db")))
+    monkeypatch.setattr(settings, "DATA_DIR", str(tmp_path))  # lock and bootstrap state files
+
+    with open(settings.BASE_DIR / "data/sql/schema.sql", "r") as f, db_manager.get_connection() as conn:
+        conn.executescript(f.read())
+    data_loader.ingest_ledger()
+    return raw / "ledger_data.csv", db_manager
@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from src.common.admission import AdmissionController, PRIORITY_HIGH, PRIORITY_LOW
+from src.common.exceptions import ServiceOverloadedException
+from src.services.readiness import ReadinessRegistry, SQL, VECTOR
+
+
+def hold(controller, priority, started, release, order, name):
+    with controller.slot(priority):
+        order.append(name)
+        started.set()
+        release.wait(5)
+
+
+def test_bounded_queue_refuses_and_admits_by_priority():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=2, max_wait_seconds=5)
+    release, order = threading.Event(), []
+    first = threading.Event()
+    threads = [threading.Thread(target=hold, args=(controller, PRIORITY_HIGH, first, release, order, "first"))]
+    threads[0].start()
+    first.wait(5)
+
+    # Queue two waiters: the low-priority one arrives first but is admitted last
+    for priority, name in ((PRIORITY_LOW, "low"), (PRIORITY_HIGH, "high")):
+        threads.append(threading.Thread(target=hold, args=(controller, priority, threading.Event(), release,
+                                                            order, name)))
+        threads[-1].start()
+    while controller.stats()["queued"] < 2:
+        time.sleep(0.01)
+
+    with pytest.raises(ServiceOverloadedException):
+        with controller.slot():
+            pass
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert order == ["first", "high", "low"]
+    stats = controller.stats()
+    assert stats["admitted"] == 3 and stats["rejected"] == 1 and stats["active"] == 0
+
+
+def test_wait_timeout_refuses():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=5, max_wait_seconds=0.05)
+    with controller.slot():
+        with pytest.raises(ServiceOverloadedException):
+            with controller.slot():
+                pass
+    assert controller.stats()["queued"] == 0
+    # reject=False (background work) waits as long as it takes
+    with controller.slot(reject=False):
+        pass
+
+
+def test_chat_answers_429_when_overloaded(monkeypatch):
+    from fastapi.testclient import TestClient
+    import src.web.server as server
+
+    registry = ReadinessRegistry()
+    registry.set(SQL, "ready")
+    registry.set(VECTOR, "ready")
+    monkeypatch.setattr(server, "readiness", registry)
+
+    async def overloaded(payload):
+        raise ServiceOverloadedException("llm queue is full")
+    monkeypatch.setattr(server, "run_chat_turn", overloaded)
+
+    response = TestClient(server.app).post("/chat", json={"sender": "a@b.com", "thread_id": "t1", "message": "hi"})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(server.settings.ADMISSION_RETRY_AFTER_SECONDS)
+    assert response.json()["overloaded"] is True
+
+
+def test_embedding_admission_cap_is_independent_of_ingest_batches():
+    from config.settings import Settings
+    from src.common.admission import embedding_admission
+
+    defaults = Settings.model_fields
+    assert defaults["EMBEDDING_ADMISSION_MAX_CONCURRENCY"].default == 8
+    assert defaults["EMBEDDING_MAX_CONCURRENCY"].default == 4
+    assert embedding_admission.max_concurrency == 8
@@ -0,0 +1,93 @@
+import pytest
+
+import src.services.data_loader as data_loader_module
+from config.settings import settings
+from src.common.exceptions import ArtifactVerificationException
+from src.core.vector_manager import VectorManager
+from src.services.artifact_store import ArtifactStore
+
+LIBRARY_CSV = (
+    "vendor_id,invoice_id,category,subject,item_name,summary,body,reply_text\n"
+    "V1,INV-1,General,Subject,Item,Summary,Body,Reply\n"
+)
+
+
+@pytest.fixture
+def bundle(tmp_path, monkeypatch):
+    """Builds a bundle from a one-vendor ledger and a one-email library with fake embeddings."""
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from tests.conftest import LEDGER_CSV
+
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "ledger_data.csv").write_text(LEDGER_CSV, encoding="utf-8")
+    (raw / "library_data.csv").write_text(LIBRARY_CSV, encoding="utf-8")
+    monkeypatch.setattr(type(settings), "RAW_DATA_DIR", property(lambda self: raw))
+    monkeypatch.setattr(VectorManager, "_get_embedding_model", lambda self: DeterministicFakeEmbedding(size=16))
+    monkeypatch.setattr(VectorManager, "_instance", None)
+    monkeypatch.setattr(data_loader_module, "vector_manager", VectorManager())
+
+    manifest = ArtifactStore().build(tmp_path / "artifacts", version="v1")
+    return tmp_path / "artifacts" / "v1", manifest
+
+
+def test_build_writes_a_checksummed_bundle(bundle):
+    path, manifest = bundle
+    assert manifest.sources["ledger"]["items"] == 2 and manifest.sources["library"]["items"] == 1
+    assert manifest.sql_db in manifest.files
+    assert manifest.generations["email_archive"] is not None
+    assert not any("checkpoints" in name for name in manifest.files)
+    assert ArtifactStore().verify(path).version == "v1"
+
+
+def test_install_copies_the_db_once_and_rejects_corruption(bundle, tmp_path, monkeypatch):
+    path, manifest = bundle
+    monkeypatch.setattr(settings, "DATA_DIR", str(tmp_path / "runtime"))
+    store = ArtifactStore()
+
+    store.install(path)
+    db_path = tmp_path / "runtime" / "sql" / settings.SQL_DB_NAME
+    assert db_path.exists()
+    mtime = db_path.stat().st_mtime_ns
+    store.install(path)
+    assert db_path.stat().st_mtime_ns == mtime   # same version: runtime copy is kept
+
+    lexical = next(name for name in manifest.files if name.endswith("lexical.json"))
+    with open(path / lexical, "r+b") as f:
+        f.write(b"X")
+    with pytest.raises(ArtifactVerificationException):
+        store.verify(path)
+    assert store.verify(path, checksums=False).version == "v1"   # size-only check still passes
+
+
+def test_new_version_replaces_a_used_db_and_its_wal(bundle, tmp_path, monkeypatch):
+    import shutil
+    import sqlite3
+    from tests.conftest import LEDGER_CSV
+    path, _ = bundle
+    (tmp_path / "raw" / "ledger_data.csv").write_text(
+        LEDGER_CSV + "V3,Cid,cid@c.com,3,Addr 3,Core,Buyer,INV-3,300,Pending,2025-09-03,2025-08-03\n",
+        encoding="utf-8")
+    ArtifactStore().build(tmp_path / "artifacts", version="v2")
+
+    monkeypatch.setattr(settings, "DATA_DIR", str(tmp_path / "runtime"))
+    store = ArtifactStore()
+    store.install(path)
+    db_path = tmp_path / "runtime" / "sql" / settings.SQL_DB_NAME
+
+    # v1 in use in WAL mode; a crash leaves committed frames in its -wal file
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    with conn:
+        conn.execute("DELETE FROM invoices")
+    shutil.copyfile(f"{db_path}-wal", tmp_path / "stale-wal")
+    conn.close()
+    shutil.copyfile(tmp_path / "stale-wal", f"{db_path}-wal")
+
+    store.install(tmp_path / "artifacts" / "v2")
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert conn.execute("SELECT COUNT(*) FROM invoices").fetchone()[0] == 3
+    conn.close()
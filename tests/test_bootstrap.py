@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import src.services.bootstrap as bootstrap_module
+import src.services.data_loader as data_loader_module
+from config.settings import settings
+from src.common.exceptions import ConfigurationException
+from src.services.bootstrap import BootstrapService
+from src.services.readiness import ReadinessRegistry, SQL, VECTOR
+
+
+def test_health_and_degraded_chat_while_sql_loads(monkeypatch):
+    import src.web.server as server
+    registry = ReadinessRegistry()
+    monkeypatch.setattr(server, "readiness", registry)
+    client = TestClient(server.app)
+
+    assert client.get("/healthz").json() == {"status": "ok"}
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json()["subsystems"][SQL]["state"] == "pending"
+
+    chat = client.post("/chat", json={"sender": "a@b.com", "thread_id": "t1", "message": "Status of INV-1?"})
+    assert chat.status_code == 503 and chat.headers["Retry-After"] == str(settings.READINESS_RETRY_AFTER_SECONDS)
+    assert chat.json()["degraded"] is True
+
+    registry.set(SQL, "ready")
+    registry.set(VECTOR, "degraded", detail="failed sources: policy")
+    assert client.get("/readyz").status_code == 200
+
+
+def test_bootstrap_reports_each_subsystem(ledger_db, manager, monkeypatch):
+    csv_path, _ = ledger_db
+    # Library rows without the expected columns fail in the transform stage
+    (csv_path.parent / "library_data.csv").write_text("vendor_id\nV1\n", encoding="utf-8")
+    monkeypatch.setattr(data_loader_module, "vector_manager", manager)
+    monkeypatch.setattr(settings, "VECTOR_WARMUP_ON_STARTUP", False)
+    registry = ReadinessRegistry()
+
+    BootstrapService(registry).run()
+
+    states = {name: s["state"] for name, s in registry.snapshot().items()}
+    assert states == {SQL: "ready", VECTOR: "degraded"}
+    assert "library" in registry.snapshot()[VECTOR]["detail"]
+
+
+def test_schema_failure_marks_everything_failed(tmp_path, monkeypatch):
+    def broken():
+        raise OSError("disk full")
+    monkeypatch.setattr(settings, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(bootstrap_module, "apply_schema", broken)
+    registry = ReadinessRegistry()
+
+    BootstrapService(registry).run()
+
+    assert registry.not_ready() == [SQL, VECTOR]
+    assert registry.snapshot()[SQL]["detail"] == "disk full"
+
+
+def test_schema_refuses_vendors_sharing_an_email_ignoring_case(ledger_db):
+    _, db = ledger_db
+    # A database created before the unique index existed
+    with db.get_connection() as conn:
+        conn.execute("DROP INDEX idx_vendors_email_nocase")
+        conn.execute("INSERT INTO vendors (vendor_id_str, name, email) VALUES ('V9', 'Eve', 'ANN@a.com')")
+
+    with pytest.raises(ConfigurationException, match="ann@a.com"):
+        bootstrap_module.apply_schema()
+
+
+def test_ingest_crash_marks_only_subsystems_with_data_degraded(ledger_db, monkeypatch):
+    def crash_after_ledger(on_complete=None):
+        on_complete("ledger", {"status": "loaded", "items": 2})
+        raise RuntimeError("out of memory")
+    monkeypatch.setattr(bootstrap_module.data_loader, "active_sources", lambda: ["ledger", "library", "final_export"])
+    monkeypatch.setattr(bootstrap_module.data_loader, "ingest_all", crash_after_ledger)
+    registry = ReadinessRegistry()
+
+    BootstrapService(registry)._ingest()
+
+    states = {name: s["state"] for name, s in registry.snapshot().items()}
+    # SQL still waits for final_export but has the ledger rows; no vector source finished
+    assert states == {SQL: "degraded", VECTOR: "failed"}
@@ -0,0 +1,61 @@
+import csv
+import json
+
+from src.services.change_feed import ChangeFeed, JSONLSink, LedgerCSVSink
+from src.services.vendor_service import vendor_service
+
+
+def vendor_pk(db, vendor_id_str):
+    with db.get_connection() as conn:
+        return conn.execute("SELECT id FROM vendors WHERE vendor_id_str = ?", (vendor_id_str,)).fetchone()[0]
+
+
+def test_update_writes_change_log_row(ledger_db):
+    _, db = ledger_db
+    vendor_service.update_vendor_contact(vendor_pk(db, "V1"), "phone", "555")
+
+    (change,) = ChangeFeed(db).read()
+    assert (change.vendor_id_str, change.field, change.old_value, change.new_value) == ("V1", "phone", "1", "555")
+
+
+def test_rejected_update_writes_nothing(ledger_db):
+    _, db = ledger_db
+    vendor_service.update_vendor_contact(vendor_pk(db, "V1"), "email", "x@y.com")
+    vendor_service.update_vendor_contact(9999, "phone", "555")
+
+    assert ChangeFeed(db).read() == []
+
+
+def test_consumers_apply_only_new_changes(ledger_db, tmp_path):
+    csv_path, db = ledger_db
+    feed = ChangeFeed(db)
+    jsonl = JSONLSink(tmp_path / "changes.jsonl")
+
+    vendor_service.update_vendor_contact(vendor_pk(db, "V2"), "phone", "111")
+    vendor_service.update_vendor_contact(vendor_pk(db, "V2"), "contact_name", "Robert")
+    assert feed.consume("erp", jsonl) == 2
+    vendor_service.update_vendor_contact(vendor_pk(db, "V2"), "phone", "222")
+    assert feed.consume("erp", jsonl) == 1
+    assert feed.consume("ledger_csv", LedgerCSVSink(csv_path)) == 3
+
+    lines = [json.loads(line) for line in (tmp_path / "changes.jsonl").read_text().splitlines()]
+    assert [line["new_value"] for line in lines] == ["111", "Robert", "222"]
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = {row["vendor_id"]: row for row in csv.DictReader(f)}
+    assert (rows["V2"]["phone"], rows["V2"]["name"]) == ("222", "Robert")
+    assert rows["V1"]["phone"] == "1"
+
+
+def test_vendor_without_csv_id_is_logged_and_skipped_by_the_csv_sink(ledger_db):
+    csv_path, db = ledger_db
+    with db.get_connection() as conn:
+        vendor_id = conn.execute("INSERT INTO vendors (name, email, phone) VALUES ('Manual', 'm@m.com', '9')").lastrowid
+    before = csv_path.read_text(encoding="utf-8")
+
+    assert vendor_service.update_vendor_contact(vendor_id, "phone", "10").startswith("Successfully")
+    (change,) = ChangeFeed(db).read()
+    assert change.vendor_id == vendor_id and change.vendor_id_str is None
+
+    assert ChangeFeed(db).consume("ledger_csv", LedgerCSVSink(csv_path)) == 1
+    assert csv_path.read_text(encoding="utf-8") == before
+    assert list(csv_path.parent.glob("*.tmp")) == []
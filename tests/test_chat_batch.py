@@ -0,0 +1,112 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+import src.graph.nodes.security_node as security_node
+from src.domain.email_schemas import EmailInput
+from src.services.auth_service import auth_service
+from src.services.session_service import session_service
+from src.web.chat_batch import ChatBatchRunner
+
+
+class FakeGraph:
+    """Records each wave and completes its runs in reverse order."""
+
+    def __init__(self):
+        self.waves = []
+
+    async def abatch_as_completed(self, states, config=None, return_exceptions=False):
+        self.waves.append((states, config))
+        for position in reversed(range(len(states))):
+            body = states[position]["email_input"].body
+            if body == "boom":
+                yield position, RuntimeError("provider error")
+            else:
+                yield position, {"generated_email": f"re: {body}\n\nBest regards,\nAgentia Vendor Team"}
+
+
+def email(thread_id, body, sender="ann@a.com"):
+    return EmailInput(id=f"web_{thread_id}", thread_id=thread_id, sender=sender, subject="Chat", body=body)
+
+
+def test_bulk_lookups(ledger_db):
+    for role, content in [("user", "q1"), ("assistant", "a1"), ("user", "q2")]:
+        session_service.log_message("t1", "t1", role, content)
+
+    vendors = auth_service.verify_vendors(["ANN@a.com ", "bob@b.com", "nobody@x.com"])
+    assert vendors["ann@a.com"].vendor_id_str == "V1" and vendors["nobody@x.com"] is None
+
+    histories = session_service.get_chat_histories(["t1", "t2"], limit=2)
+    assert [m.content for m in histories["t1"]] == ["a1", "q2"] and histories["t2"] == []
+
+
+def test_single_and_bulk_lookups_ignore_case(ledger_db):
+    _, db = ledger_db
+    with db.get_connection() as conn:
+        conn.execute("UPDATE vendors SET email = 'Bob.Smith@B.com' WHERE vendor_id_str = 'V2'")
+
+    for sender in ("Bob.Smith@B.com", "bob.smith@b.com", " BOB.SMITH@b.COM"):
+        assert auth_service.verify_vendor(sender).vendor_id_str == "V2"
+        assert auth_service.verify_vendors([sender])["bob.smith@b.com"].vendor_id_str == "V2"
+
+
+def test_vendor_emails_are_unique_ignoring_case(ledger_db):
+    _, db = ledger_db
+    # V1 is ann@a.com: a second vendor under another case could be authorized as V1
+    with pytest.raises(sqlite3.IntegrityError), db.get_connection() as conn:
+        conn.execute("INSERT INTO vendors (vendor_id_str, name, email) VALUES ('V9', 'Eve', 'ANN@a.com')")
+
+    assert auth_service.verify_vendor("ann@a.com").vendor_id_str == "V1"
+
+
+def test_batch_runs_in_waves_with_prefetched_lookups(ledger_db):
+    graph = FakeGraph()
+    emails = [email("t1", "one"), email("t2", "two", sender="bob@b.com"), email("t1", "three"),
+              email("t3", "boom", sender="nobody@x.com")]
+
+    async def collect():
+        return [result async for result in ChatBatchRunner(graph).stream(emails, max_concurrency=2)]
+    results = asyncio.run(collect())
+
+    assert ChatBatchRunner.waves(emails) == [[0, 1, 3], [2]]
+    first_wave, config = graph.waves[0]
+    assert config == {"max_concurrency": 2}
+    assert first_wave[0]["prefetched"]["vendor"].vendor_id_str == "V1"
+    assert first_wave[2]["prefetched"]["vendor"] is None and first_wave[0]["prefetched"]["history"] == []
+    # Second turn on t1 loads the history the first one saved
+    assert "history" not in graph.waves[1][0][0]["prefetched"]
+
+    by_index = {result["index"]: result for result in results}
+    assert by_index[0]["response"] == "re: one" and by_index[2]["response"] == "re: three"
+    assert "error" in by_index[3]
+    assert [result["index"] for result in results] == [3, 1, 0, 2]  # streamed in completion order
+
+
+def test_security_node_uses_the_prefetched_vendor(monkeypatch):
+    def unexpected(_):
+        raise AssertionError("queried per message")
+    monkeypatch.setattr(security_node.auth_service, "verify_vendor", unexpected)
+
+    state = security_node.security_check({"email_input": email("t1", "hi"), "prefetched": {"vendor": None}})
+    assert state["is_authorized"] is False
+
+
+def test_batch_endpoint_streams_ndjson(ledger_db, monkeypatch):
+    from fastapi.testclient import TestClient
+    import src.web.server as server
+    from src.services.readiness import ReadinessRegistry, SQL
+
+    registry = ReadinessRegistry()
+    registry.set(SQL, "ready")
+    monkeypatch.setattr(server, "readiness", registry)
+    monkeypatch.setattr(server, "chat_batch_runner", ChatBatchRunner(FakeGraph()))
+
+    response = TestClient(server.app).post("/chat/batch", json={"requests": [
+        {"sender": "ann@a.com", "thread_id": "t1", "message": "one"},
+        {"sender": "bob@b.com", "thread_id": "t2", "message": "two"},
+    ]})
+    assert response.status_code == 200 and response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["response"] for line in lines) == ["re: one", "re: two"]
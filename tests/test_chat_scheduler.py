@@ -0,0 +1,65 @@
+import asyncio
+
+from src.web.chat_scheduler import ChatScheduler
+
+
+def test_turns_on_a_thread_run_in_order_while_threads_overlap():
+    scheduler = ChatScheduler(coalesce=True)
+    events = []
+
+    def turn(name):
+        async def run():
+            events.append(f"{name}:start")
+            await asyncio.sleep(0.02)
+            events.append(f"{name}:end")
+            return name
+        return run
+
+    async def main():
+        return await asyncio.gather(
+            scheduler.run("t1", "a", turn("a")),
+            scheduler.run("t1", "b", turn("b")),
+            scheduler.run("t2", "c", turn("c")),
+        )
+
+    assert asyncio.run(main()) == ["a", "b", "c"]
+    # b waits for a on t1; c (t2) runs alongside a
+    assert events.index("a:end") < events.index("b:start")
+    assert events.index("c:start") < events.index("a:end")
+    assert scheduler._threads == {} and scheduler._inflight == {}
+
+
+def test_identical_requests_share_one_run():
+    scheduler = ChatScheduler(coalesce=True)
+    calls = []
+
+    async def turn():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"response": "ok"}
+
+    async def main():
+        return await asyncio.gather(*(scheduler.run("t1", "same body", turn) for _ in range(3)))
+
+    assert asyncio.run(main()) == [{"response": "ok"}] * 3
+    assert len(calls) == 1
+
+
+def test_failure_is_shared_and_not_cached():
+    scheduler = ChatScheduler(coalesce=True)
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider down")
+
+    async def main():
+        return await asyncio.gather(scheduler.run("t1", "k", failing), scheduler.run("t1", "k", failing),
+                                    return_exceptions=True)
+
+    assert [str(r) for r in asyncio.run(main())] == ["provider down"] * 2
+    assert len(calls) == 1
+    # A retry after the failure runs the turn again
+    asyncio.run(main())
+    assert len(calls) == 2
@@ -0,0 +1,40 @@
+from langchain_core.documents import Document
+
+from src.services.context_compressor import ContextCompressor, estimate_tokens
+
+PAGE = (
+    "This manual describes the vendor onboarding process. "
+    "Vendors must register a tax identifier before the first order. "
+    "Late fees of 2% per month apply to overdue invoices. "
+    "Office hours are nine to five on weekdays. "
+    "Disputes are handled by the finance team."
+)
+
+
+def test_keeps_query_relevant_sentences_in_original_order():
+    compressed = ContextCompressor(token_budget=25).compress(
+        "late fees on overdue invoices", [Document(page_content=PAGE)]
+    )
+
+    (_, text), = compressed
+    assert text.startswith("Late fees of 2% per month apply to overdue invoices.")
+    assert "Office hours" not in text
+    assert estimate_tokens(text) <= 25
+
+
+def test_budget_spans_excerpts_and_drops_irrelevant_ones():
+    docs = [
+        Document(page_content="Payment terms are Net 30. Invoices need a PO number."),
+        Document(page_content="The cafeteria opens at noon. Parking is free."),
+    ]
+
+    compressed = ContextCompressor(token_budget=12).compress("payment terms", docs)
+
+    assert [text for _, text in compressed] == ["Payment terms are Net 30."]
+
+
+def test_oversized_single_sentence_is_truncated_to_budget():
+    compressed = ContextCompressor(token_budget=10).compress("fees", [Document(page_content="fees " * 100)])
+
+    (_, text), = compressed
+    assert estimate_tokens(text) <= 10
@@ -0,0 +1,73 @@
+import csv
+import time
+
+import src.services.csv_exporter as exporter_module
+from src.services.csv_exporter import CSVExporter
+from src.services.data_loader import data_loader
+from src.services.vendor_service import vendor_service
+
+
+def read_phones(csv_path):
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return {row["vendor_id"]: row["phone"] for row in csv.DictReader(f)}
+
+
+def test_burst_of_updates_is_coalesced_into_one_export(ledger_db, monkeypatch):
+    calls = []
+    monkeypatch.setattr(exporter_module.data_loader, "sync_db_to_csv", lambda vendor_ids=None: calls.append(vendor_ids) or 1)
+    exporter = CSVExporter(debounce_seconds=0.05, max_pending=100, max_delay_seconds=5)
+
+    for _ in range(20):
+        exporter.mark_dirty(1)
+    time.sleep(0.3)
+
+    assert calls == [None]
+
+
+def test_changed_only_patches_the_vendor_rows(ledger_db):
+    csv_path, db = ledger_db
+    with db.get_connection() as conn:
+        conn.execute("UPDATE vendors SET phone = '999' WHERE vendor_id_str = 'V2'")
+        vendor_id = conn.execute("SELECT id FROM vendors WHERE vendor_id_str = 'V2'").fetchone()[0]
+
+    exporter = CSVExporter(debounce_seconds=60, changed_only=True)
+    exporter.mark_dirty(vendor_id)
+    assert exporter.flush() == 2
+
+    assert read_phones(csv_path) == {"V1": "1", "V2": "999"}
+    assert not list(csv_path.parent.glob("ledger_data.csv*.tmp"))
+
+
+def test_changed_only_keeps_the_row_order(ledger_db):
+    csv_path, db = ledger_db
+    with db.get_connection() as conn:
+        v1 = conn.execute("SELECT id FROM vendors WHERE vendor_id_str = 'V1'").fetchone()[0]
+        conn.execute("UPDATE vendors SET phone = '777' WHERE id = ?", (v1,))
+        conn.execute("INSERT INTO invoices (vendor_id, invoice_number, amount, status) VALUES (?, 'INV-9', 9, 'Pending')",
+                     (v1,))
+
+    exporter = CSVExporter(debounce_seconds=60, changed_only=True)
+    exporter.mark_dirty(v1)
+    assert exporter.flush() == 3
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = [(row["invoice_id"], row["phone"]) for row in csv.DictReader(f)]
+    # V1's invoice stays first; its new invoice is appended
+    assert rows == [("INV-1", "777"), ("INV-2", "2"), ("INV-9", "777")]
+
+
+def test_reindex_before_the_export_keeps_the_update(ledger_db, monkeypatch):
+    csv_path, db = ledger_db
+    exporter = CSVExporter(debounce_seconds=60, max_delay_seconds=60, changed_only=True)
+    monkeypatch.setattr(exporter_module, "csv_exporter", exporter)
+    with db.get_connection() as conn:
+        vendor_id = conn.execute("SELECT id FROM vendors WHERE vendor_id_str = 'V2'").fetchone()[0]
+    vendor_service.update_vendor_contact(vendor_id, "phone", "555")
+    exporter.mark_dirty(vendor_id)  # still pending: the CSV has the old phone
+
+    data_loader.ingest_source("ledger", replace=True)
+
+    with db.get_connection() as conn:
+        phone = conn.execute("SELECT phone FROM vendors WHERE id = ?", (vendor_id,)).fetchone()[0]
+    assert phone == "555"
+    assert read_phones(csv_path)["V2"] == "555"  # flushed before the import read the file
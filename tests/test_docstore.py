@@ -0,0 +1,22 @@
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.core.docstore import DOCSTORE_FILE_NAME, SQLiteDocstore, SQLiteIndexMap, write_sqlite_docstore
+
+
+def test_sqlite_docstore_round_trip(tmp_path):
+    embeddings = DeterministicFakeEmbedding(size=8)
+    store = FAISS.from_texts(["alpha", "beta"], embeddings, metadatas=[{"page": 1}, {"page": 2}])
+
+    write_sqlite_docstore(store, str(tmp_path))
+
+    db_path = str(tmp_path / DOCSTORE_FILE_NAME)
+    index_map = SQLiteIndexMap(db_path)
+    docstore = SQLiteDocstore(db_path)
+
+    assert len(index_map) == 2
+    assert dict(index_map) == dict(store.index_to_docstore_id)
+    doc = docstore.search(index_map[1])
+    assert doc.page_content == "beta"
+    assert doc.metadata == {"page": 2}
+    assert docstore.search("missing") == "ID missing not found."
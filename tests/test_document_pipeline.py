@@ -0,0 +1,39 @@
+from langchain_core.documents import Document
+
+from src.core.lexical_index import BM25Index
+from src.core.vector_manager import POLICY_NAMESPACE
+from src.services.document_pipeline import DocumentPipeline
+
+
+def fake_pages(n_pages):
+    def iter_pages(pdf_path):
+        for i in range(n_pages):
+            yield Document(page_content=f"Section {i}. Late fees apply after thirty days. " * 5,
+                           metadata={"source": "policy_document", "file": "policy.pdf", "page": i})
+    return iter_pages
+
+
+def test_chunks_are_batched_and_keep_page_metadata(monkeypatch):
+    pipeline = DocumentPipeline(chunk_size=100, chunk_overlap=0, batch_size=4, max_workers=1)
+    monkeypatch.setattr(pipeline, "iter_pages", fake_pages(3))
+
+    batches = list(pipeline.iter_batches(["policy.pdf"]))
+    chunks = [chunk for batch in batches for chunk in batch]
+
+    assert all(len(batch) <= 4 for batch in batches)
+    assert len(chunks) > 3
+    assert {chunk.metadata["page"] for chunk in chunks} == {0, 1, 2}
+
+
+def test_streamed_batches_are_indexed_and_persisted_once(manager, monkeypatch):
+    pipeline = DocumentPipeline(chunk_size=100, chunk_overlap=0, batch_size=4, max_workers=1)
+    monkeypatch.setattr(pipeline, "iter_pages", fake_pages(3))
+    saves = []
+    original_save = BM25Index.save
+    monkeypatch.setattr(BM25Index, "save", lambda self, folder: saves.append(folder) or original_save(self, folder))
+
+    total = manager.add_document_batches(pipeline.iter_batches(["policy.pdf"]), namespace=POLICY_NAMESPACE)
+
+    assert total == len(manager._vectorstores[POLICY_NAMESPACE].index_to_docstore_id)
+    assert len(manager._lexical[POLICY_NAMESPACE]) == total
+    assert len(saves) == 1
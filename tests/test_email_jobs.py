@@ -0,0 +1,161 @@
+import os
+
+import pytest
+
+from src.common.exceptions import ServiceOverloadedException
+from src.domain.email_schemas import EmailInput
+from src.services.email_job_service import EmailJobService
+
+
+def email(thread_id, body="Status of INV-1?"):
+    return EmailInput(id=f"msg-{thread_id}", thread_id=thread_id, sender="ann@a.com", subject="Status", body=body)
+
+
+@pytest.fixture
+def jobs(ledger_db, monkeypatch):
+    _, db = ledger_db
+    service = EmailJobService(db)
+    runs = []
+
+    def run_graph(email_input, completed):
+        runs.append(email_input.body)
+        return {"response": f"re: {email_input.body}", "intent": "STATUS", "action": "Drafted Response"}
+    monkeypatch.setattr(service, "_run_graph", run_graph)
+    return service, runs
+
+
+def test_jobs_run_in_order_per_thread(jobs):
+    service, runs = jobs
+    first = service.submit(email("t1", "one"))
+    service.submit(email("t1", "two"))
+    other = service.submit(email("t2", "three"))
+    assert first.status == "queued"
+
+    # While t1's first job runs, its second one waits; t2 is runnable
+    with service.db.get_connection() as conn:
+        conn.execute("UPDATE email_jobs SET status = 'running', claimed_pid = 1 WHERE job_id = ?", (first.job_id,))
+    assert service.process_next() == other.job_id
+
+    with service.db.get_connection() as conn:
+        conn.execute("UPDATE email_jobs SET status = 'queued' WHERE job_id = ?", (first.job_id,))
+    assert service.process_next() == first.job_id
+    service.process_next()
+    assert service.process_next() is None
+    assert runs == ["three", "one", "two"]
+
+    done = service.get(first.job_id)
+    assert done.status == "succeeded" and done.result["response"] == "re: one" and done.attempts == 1
+
+
+def test_overloaded_run_is_requeued_with_backoff(jobs, monkeypatch):
+    service, _ = jobs
+
+    def overloaded(email_input, completed):
+        completed.extend(["security_check", "load_memory"])
+        raise ServiceOverloadedException("llm queue is full")
+    monkeypatch.setattr(service, "_run_graph", overloaded)
+    job = service.submit(email("t1"))
+
+    service.process_next()
+    assert service.get(job.job_id).status == "queued"
+    assert service.process_next() is None  # backing off
+
+
+def test_overload_after_an_update_is_not_retried(jobs, monkeypatch):
+    service, _ = jobs
+
+    def drafter_overloaded(email_input, completed):
+        completed.extend(["security_check", "load_memory", "classify_email", "execute_update"])
+        raise ServiceOverloadedException("llm queue is full")
+    monkeypatch.setattr(service, "_run_graph", drafter_overloaded)
+    job = service.submit(email("t1", "Change my phone to 555"))
+
+    service.process_next()
+    failed = service.get(job.job_id)
+    assert failed.status == "failed" and "execute_update" in failed.error and failed.attempts == 1
+
+
+def test_jobs_of_a_dead_process_are_requeued(jobs):
+    service, _ = jobs
+    job = service.submit(email("t1"))
+    with service.db.get_connection() as conn:
+        conn.execute("UPDATE email_jobs SET status = 'running', claimed_pid = 999999999 WHERE job_id = ?",
+                     (job.job_id,))
+
+    assert service.recover() == 1
+    assert service.process_next() == job.job_id
+
+
+def test_workers_keep_recovering_after_startup(jobs, monkeypatch):
+    import src.services.email_job_service as module
+    service, _ = jobs
+    monkeypatch.setattr(module.settings, "JOB_RECOVERY_INTERVAL_SECONDS", 0)
+    mine, orphan = service.submit(email("t1")), service.submit(email("t2"))
+    service._recover_if_due()  # startup pass
+
+    # Later: one job runs here, another was claimed by a worker that has since died
+    with service.db.get_connection() as conn:
+        conn.execute("UPDATE email_jobs SET status = 'running', claimed_pid = ? WHERE job_id = ?",
+                     (os.getpid(), mine.job_id))
+        conn.execute("UPDATE email_jobs SET status = 'running', claimed_pid = 999999999 WHERE job_id = ?",
+                     (orphan.job_id,))
+    service._recover_if_due()
+
+    assert service.get(orphan.job_id).status == "queued"
+    assert service.get(mine.job_id).status == "running"
+
+
+def test_webhook_receives_the_finished_job(jobs, monkeypatch):
+    import src.services.email_job_service as module
+    service, _ = jobs
+    posted = []
+
+    class Response:
+        def raise_for_status(self):
+            pass
+    monkeypatch.setattr(module.httpx, "post", lambda url, json, timeout: posted.append((url, json)) or Response())
+    monkeypatch.setattr(module.settings, "JOB_WEBHOOK_ALLOWED_HOSTS", ["hooks.example"])
+
+    job = service.submit(email("t1"), webhook_url="http://hooks.example/done")
+    service.process_next()
+
+    # Posted by the delivery thread, not the job worker
+    assert posted == [] and service.get(job.job_id).webhook_status == "pending"
+    service._deliver_webhook(*service._webhooks.get_nowait())
+
+    assert posted[0][0] == "http://hooks.example/done" and posted[0][1]["status"] == "succeeded"
+    assert service.get(job.job_id).webhook_status == "delivered"
+
+
+def test_webhooks_outside_the_allowlist_are_refused(jobs, monkeypatch):
+    from src.common.exceptions import ValidationException
+    import src.services.email_job_service as module
+    service, _ = jobs
+    monkeypatch.setattr(module.settings, "JOB_WEBHOOK_ALLOWED_HOSTS", ["hooks.example"])
+
+    for url in ("http://169.254.169.254/latest/meta-data", "http://localhost:8000/admin", "file:///etc/passwd"):
+        with pytest.raises(ValidationException):
+            service.submit(email("t1"), webhook_url=url)
+
+
+def test_job_api(jobs, monkeypatch):
+    from fastapi.testclient import TestClient
+    import src.web.server as server
+    from src.services.readiness import ReadinessRegistry, SQL
+
+    service, _ = jobs
+    registry = ReadinessRegistry()
+    registry.set(SQL, "ready")
+    monkeypatch.setattr(server, "readiness", registry)
+    monkeypatch.setattr(server, "email_job_service", service)
+    client = TestClient(server.app)
+
+    response = client.post("/jobs", json={"email": email("t1").model_dump()})
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    service.process_next()
+
+    assert client.get(f"/jobs/{job_id}").json()["status"] == "succeeded"
+    assert client.get("/jobs/missing").status_code == 404
+    refused = client.post("/jobs", json={"email": email("t2").model_dump(), "webhook_url": "http://10.0.0.1/"})
+    assert refused.status_code == 400
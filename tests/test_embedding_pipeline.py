@@ -0,0 +1,76 @@
+import time
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.core.embedding_pipeline import EmbeddingPipeline, TokenBucket
+
+
+class RecordingEmbeddings(DeterministicFakeEmbedding):
+    """Offline fake embeddings that record batches and can fail on demand."""
+    calls: list = []
+    fail_on: set = set()
+    transient_failures: int = 0
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        if self.transient_failures:
+            self.transient_failures -= 1
+            raise ConnectionError("rate limited")
+        if texts[0] in self.fail_on:
+            raise RuntimeError("provider down")
+        return super().embed_documents(texts)
+
+
+def _pipeline(embeddings, tmp_path, **kwargs):
+    options = dict(batch_size=2, max_concurrency=2, requests_per_minute=0, tokens_per_minute=0,
+                   max_retries=2, backoff_seconds=0.01, checkpoint_dir=str(tmp_path))
+    options.update(kwargs)
+    return EmbeddingPipeline(embeddings, **options)
+
+
+def test_embeds_in_batches_and_preserves_order(tmp_path):
+    embeddings = RecordingEmbeddings(size=8, calls=[])
+    texts = [f"doc {i}" for i in range(5)]
+
+    vectors = _pipeline(embeddings, tmp_path).embed_documents(texts)
+
+    assert vectors == DeterministicFakeEmbedding(size=8).embed_documents(texts)
+    assert sorted(len(batch) for batch in embeddings.calls) == [1, 2, 2]
+
+
+def test_transient_errors_are_retried(tmp_path):
+    embeddings = RecordingEmbeddings(size=8, calls=[], transient_failures=2)
+    pipeline = _pipeline(embeddings, tmp_path, max_concurrency=1)
+
+    vectors = pipeline.embed_documents(["a", "b"])
+
+    assert len(vectors) == 2
+    assert len(embeddings.calls) == 3
+
+
+def test_interrupted_ingest_resumes_from_checkpoint(tmp_path):
+    texts = [f"doc {i}" for i in range(6)]
+    failing = RecordingEmbeddings(size=8, calls=[], fail_on={"doc 4"})
+    with pytest.raises(RuntimeError):
+        _pipeline(failing, tmp_path, max_concurrency=1, max_retries=0).embed_documents(texts)
+
+    resumed = RecordingEmbeddings(size=8, calls=[])
+    pipeline = _pipeline(resumed, tmp_path, max_concurrency=1)
+    vectors = pipeline.embed_documents(texts)
+
+    assert resumed.calls == [["doc 4", "doc 5"]]
+    assert pipeline.last_stats["resumed_batches"] == 2
+    assert vectors == DeterministicFakeEmbedding(size=8).embed_documents(texts)
+
+    pipeline.clear_checkpoint(pipeline.checkpoint_id(texts))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate_per_second=20, capacity=1)
+    start = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+
+    assert time.monotonic() - start >= 0.09
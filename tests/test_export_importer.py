@@ -0,0 +1,60 @@
+import shutil
+
+import pytest
+
+import src.services.export_importer as export_module
+from config.settings import settings
+from src.core.vector_manager import ARCHIVE_NAMESPACE
+from src.services.export_importer import FinalExportImporter
+
+FINAL_DATA = settings.BASE_DIR / "data/raw/final_data.csv"
+
+
+@pytest.fixture
+def export_csv(ledger_db):
+    csv_path, db = ledger_db
+    path = csv_path.parent / "final_data.csv"
+    shutil.copy(FINAL_DATA, path)
+    return path, db
+
+
+def table_count(db, table):
+    with db.get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_export_is_normalized_into_tables_and_documents(export_csv, manager, monkeypatch):
+    path, db = export_csv
+    monkeypatch.setattr(export_module, "vector_manager", manager)
+    importer = FinalExportImporter(db=db, chunk_size=2, parquet_cache=False)
+
+    assert importer.load_frames(importer.iter_frames(path)) == 5
+
+    # Fixture ledger has 2 vendors / 2 invoices already
+    assert table_count(db, "vendors") == 7 and table_count(db, "invoices") == 7
+    assert table_count(db, "items") == 3 and table_count(db, "email_archive") == 5
+    assert manager._get_store(ARCHIVE_NAMESPACE).index.ntotal == 5
+    with db.get_connection() as conn:
+        vendor = conn.execute("SELECT * FROM vendors WHERE vendor_id_str = 'V7755'").fetchone()
+        email = conn.execute("SELECT * FROM email_archive WHERE invoice_number = 'INV-1638'").fetchone()
+    assert vendor["phone"] == "9569733980" and vendor["name"] == "Brown Inc"
+    assert email["reply_text"].startswith("Dear Aaron Roberts") and email["item_id"] == "C103"
+
+    # Re-running is idempotent for SQL; the archive namespace is rebuilt, not appended to
+    importer.load_frames(importer.iter_frames(path))
+    assert table_count(db, "email_archive") == 5
+    assert manager._get_store(ARCHIVE_NAMESPACE).index.ntotal == 5
+
+
+def test_parquet_cache_is_reused_until_the_csv_changes(export_csv, tmp_path):
+    pytest.importorskip("pyarrow")
+    path, db = export_csv
+    importer = FinalExportImporter(db=db, chunk_size=2, parquet_cache=True, cache_dir=tmp_path / "cache")
+
+    first = list(importer.iter_frames(path))
+    cache = importer.cache_path(path)
+    assert cache.exists()
+    assert sum(len(f) for f in importer.iter_frames(path)) == sum(len(f) for f in first) == 5
+
+    path.write_text(path.read_text(encoding="utf-8").rsplit("\n", 2)[0] + "\n", encoding="utf-8")
+    assert sum(len(f) for f in importer.iter_frames(path)) == 4
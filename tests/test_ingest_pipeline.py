@@ -0,0 +1,73 @@
+import threading
+import time
+
+from src.services.ingest_pipeline import IngestPipeline, IngestSource
+
+
+def slow_sink(seconds, items=1):
+    def sink(_data):
+        time.sleep(seconds)
+        return items
+    return sink
+
+
+def test_sources_run_concurrently_with_stage_timings():
+    pipeline = IngestPipeline(max_workers=3)
+    sources = [IngestSource(name, read=lambda: "raw", sink=slow_sink(0.3)) for name in ("a", "b", "c")]
+
+    start = time.perf_counter()
+    results = pipeline.run(sources)
+
+    assert time.perf_counter() - start < 0.8
+    assert {r["status"] for r in results.values()} == {"ok"}
+    assert results["a"]["sink"] >= 0.3
+    assert set(results["a"]) >= {"read", "transform", "sink", "seconds", "items"}
+
+
+def test_sql_sinks_are_serialized():
+    pipeline = IngestPipeline(max_workers=3)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def sink(_data):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return 1
+
+    pipeline.run([IngestSource(f"sql{i}", read=lambda: "raw", sink=sink, writes_sql=True) for i in range(3)])
+
+    assert peak[0] == 1
+
+
+def test_failures_and_missing_inputs_do_not_stop_other_sources():
+    def broken(_data):
+        raise ValueError("boom")
+
+    results = IngestPipeline().run([
+        IngestSource("broken", read=lambda: "raw", sink=broken),
+        IngestSource("missing", read=lambda: None, sink=slow_sink(0)),
+        IngestSource("ok", read=lambda: "raw", sink=slow_sink(0, items=5)),
+    ])
+
+    assert results["broken"] == {"status": "failed", "items": 0, "error": "boom"}
+    assert results["missing"]["status"] == "skipped"
+    assert results["ok"]["items"] == 5
+
+
+def test_lazy_transform_time_is_charged_to_transform():
+    def produce(_raw):
+        for batch in range(3):
+            time.sleep(0.05)
+            yield [batch]
+
+    result = IngestPipeline().run_source(
+        IngestSource("lazy", read=lambda: "raw", transform=produce, sink=lambda batches: sum(len(b) for b in batches))
+    )
+
+    assert result["items"] == 3
+    assert result["transform"] >= 0.15
+    assert result["sink"] < 0.05
@@ -0,0 +1,57 @@
+import os
+
+import src.services.data_loader as data_loader_module
+from src.core.vector_manager import ARCHIVE_NAMESPACE
+from src.services.ingest_state import IngestState
+
+LIBRARY_CSV = (
+    "vendor_id,invoice_id,category,subject,item_name,summary,body,reply_text\n"
+    "V1,INV-1,General,Subject,Item,Summary,Body,Reply\n"
+)
+
+
+def test_unchanged_sources_are_skipped_on_restart(ledger_db, manager, monkeypatch):
+    csv_path, db = ledger_db
+    (csv_path.parent / "library_data.csv").write_text(LIBRARY_CSV, encoding="utf-8")
+    monkeypatch.setattr(data_loader_module, "vector_manager", manager)
+    loader = data_loader_module.DataLoader()
+
+    first = loader.ingest_all()
+    assert first["ledger"]["status"] == "skipped"   # already loaded by the fixture
+    assert first["library"]["status"] == "ok" and first["library"]["items"] == 1
+    assert first["policy"] == {**first["policy"], "status": "skipped", "reason": "missing"}
+
+    second = loader.ingest_all()
+    assert {name: r["status"] for name, r in second.items()} == {
+        "ledger": "skipped", "library": "skipped", "policy": "skipped"
+    }
+
+    # A wiped namespace is rebuilt even though the file is unchanged
+    manager.reset(ARCHIVE_NAMESPACE)
+    assert loader.ingest_all()["library"]["status"] == "ok"
+
+
+def test_touched_file_is_compared_by_content(ledger_db, tmp_path):
+    csv_path, db = ledger_db
+    state = IngestState(db=db)
+    state.record("ledger", state.fingerprint(csv_path), items=2)
+
+    os.utime(csv_path, ns=(1, 1))
+    assert state.check("ledger", csv_path) == (True, None)
+    assert state.get("ledger").mtime_ns == 1
+
+    csv_path.write_text(csv_path.read_text() + "V3,Cy,cy@c.com,3,A,Co,B,INV-3,1,Paid,2025-09-03,2025-08-03\n")
+    unchanged, fingerprint = state.check("ledger", csv_path)
+    assert not unchanged and fingerprint.size == csv_path.stat().st_size
+
+
+def test_schema_change_invalidates_fingerprints(ledger_db, tmp_path):
+    csv_path, db = ledger_db
+    schema = tmp_path / "schema.sql"
+    schema.write_text("-- v1")
+    state = IngestState(db=db, schema_path=schema)
+    state.record("ledger", state.fingerprint(csv_path), items=2)
+    assert state.check("ledger", csv_path)[0]
+
+    schema.write_text("-- v2")
+    assert not state.check("ledger", csv_path)[0]
@@ -0,0 +1,104 @@
+import pytest
+
+from config.settings import settings
+from src.core.db_manager import DBManager
+from src.services.ledger_importer import LedgerImporter
+
+HEADER = "vendor_id,name,email,phone,address,company,role,invoice_id,amount,status,due_date,invoice_date\n"
+ROWS = [
+    "V1,Ann,ann@a.com,1,Addr,Acme,Buyer,INV-1,100,Pending,2025-09-01,2025-08-01",
+    "V2,Bob,bob@b.com,2,Addr,Bolt,Buyer,INV-2,200,Paid,2025-09-02,2025-08-02",
+    "V1,Ann,ann@a.com,1,Addr,Acme,Buyer,INV-3,300,Overdue,2025-09-03,2025-08-03",
+    # Same email as V1 (ignoring case) under a new vendor id: vendor rejected, invoice skipped
+    "V3,Eve,Ann@A.com,3,Addr,Evil,Buyer,INV-4,400,Pending,2025-09-04,2025-08-04",
+    "V2,Bob,bob@b.com,2,Addr,Bolt,Buyer,INV-5,500,Pending,2025-09-05,2025-08-05",
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DBManager(str(tmp_path / "ledger.db"))
+    with open(settings.BASE_DIR / "data/sql/schema.sql", "r") as f, db.get_connection() as conn:
+        conn.executescript(f.read())
+    return db
+
+
+def test_bulk_import_dedupes_vendors_across_chunks(db, tmp_path):
+    csv_path = tmp_path / "ledger.csv"
+    csv_path.write_text(HEADER + "\n".join(ROWS) + "\n", encoding="utf-8")
+    importer = LedgerImporter(db=db, chunk_size=2)
+
+    assert importer.import_csv(csv_path) == 5
+
+    with db.get_connection() as conn:
+        vendors = conn.execute("SELECT vendor_id_str FROM vendors ORDER BY id").fetchall()
+        invoices = conn.execute(
+            "SELECT i.invoice_number, v.vendor_id_str FROM invoices i JOIN vendors v ON v.id = i.vendor_id "
+            "ORDER BY i.invoice_number"
+        ).fetchall()
+    assert [v[0] for v in vendors] == ["V1", "V2"]
+    assert [tuple(i) for i in invoices] == [("INV-1", "V1"), ("INV-2", "V2"), ("INV-3", "V1"), ("INV-5", "V2")]
+    assert importer.last_stats["invoices_added"] == 4
+
+
+def test_reimport_is_idempotent(db, tmp_path):
+    csv_path = tmp_path / "ledger.csv"
+    csv_path.write_text(HEADER + "\n".join(ROWS) + "\n", encoding="utf-8")
+    importer = LedgerImporter(db=db)
+
+    importer.import_csv(csv_path)
+    importer.import_csv(csv_path)
+
+    assert importer.last_stats["vendors_added"] == 0
+    assert importer.last_stats["invoices_added"] == 0
+    assert importer.last_stats["vendors_updated"] == 0 and importer.last_stats["invoices_updated"] == 0
+
+
+def test_blank_lines_and_short_rows_are_skipped(db, tmp_path):
+    csv_path = tmp_path / "ledger.csv"
+    csv_path.write_text(HEADER + ROWS[0] + "\n\n" + "V9,Short,row\n" + ROWS[1] + "\n\n", encoding="utf-8")
+    importer = LedgerImporter(db=db)
+
+    assert importer.import_csv(csv_path) == 2
+    assert importer.last_stats["invoices_added"] == 2
+    assert importer.last_stats["rows_skipped"] == 1
+
+
+def test_reimport_applies_edited_rows(db, tmp_path):
+    csv_path = tmp_path / "ledger.csv"
+    csv_path.write_text(HEADER + "\n".join(ROWS) + "\n", encoding="utf-8")
+    importer = LedgerImporter(db=db)
+    importer.import_csv(csv_path)
+
+    edited = [row.replace("INV-2,200,Paid", "INV-2,250,Disputed").replace("bob@b.com,2,", "bob@b.com,22,")
+              for row in ROWS]
+    csv_path.write_text(HEADER + "\n".join(edited) + "\n", encoding="utf-8")
+    importer.import_csv(csv_path, overwrite_vendors=True)
+
+    with db.get_connection() as conn:
+        invoice = conn.execute("SELECT amount, status FROM invoices WHERE invoice_number = 'INV-2'").fetchone()
+        phone = conn.execute("SELECT phone FROM vendors WHERE vendor_id_str = 'V2'").fetchone()[0]
+        ann = conn.execute("SELECT name FROM vendors WHERE email = 'ann@a.com'").fetchone()[0]
+        changes = conn.execute("SELECT vendor_id_str, field, old_value, new_value FROM vendor_change_log").fetchall()
+    assert tuple(invoice) == (250, "Disputed") and phone == "22"
+    assert ann == "Acme"  # the rejected duplicate-email vendor did not overwrite V1
+    assert [tuple(c) for c in changes] == [("V2", "phone", "2", "22")]
+    assert importer.last_stats["vendors_updated"] == 1 and importer.last_stats["invoices_updated"] == 1
+    assert importer.last_stats["vendors_added"] == 0 and importer.last_stats["invoices_added"] == 0
+
+
+def test_reimport_keeps_vendor_updates_made_in_sql(db, tmp_path):
+    csv_path = tmp_path / "ledger.csv"
+    csv_path.write_text(HEADER + "\n".join(ROWS) + "\n", encoding="utf-8")
+    importer = LedgerImporter(db=db)
+    importer.import_csv(csv_path)
+    with db.get_connection() as conn:
+        conn.execute("UPDATE vendors SET phone = '99' WHERE vendor_id_str = 'V2'")
+
+    # The CSV still holds the old phone: vendors are insert-only unless overwrite_vendors
+    importer.import_csv(csv_path)
+
+    with db.get_connection() as conn:
+        phone = conn.execute("SELECT phone FROM vendors WHERE vendor_id_str = 'V2'").fetchone()[0]
+    assert phone == "99"
+    assert importer.last_stats["vendors_updated"] == 0
@@ -0,0 +1,77 @@
+from langchain_core.documents import Document
+
+from src.core.lexical_index import BM25Index, SQLiteBM25Index, reciprocal_rank_fusion, tokenize
+
+
+def _index():
+    index = BM25Index()
+    index.add_documents([
+        Document(id="a", page_content="Payment terms are Net 30 from invoice date."),
+        Document(id="b", page_content="A late fee of 2% applies to overdue invoices."),
+        Document(id="c", page_content="Vendors must keep contact details up to date."),
+    ])
+    return index
+
+
+def test_tokenize_keeps_invoice_ids():
+    assert tokenize("Status of INV-1638, please") == ["status", "inv-1638"]
+
+
+def test_search_ranks_exact_terms_first():
+    hits = _index().search("late fee", k=2)
+
+    assert hits[0][0].id == "b"
+
+
+def test_confidence_is_high_only_when_all_terms_match():
+    index = _index()
+    full = index.search("late fee", k=1)[0][1]
+    partial = index.search("late fee refund schedule", k=1)[0][1]
+
+    assert index.confidence("late fee", full) >= 0.85
+    assert index.confidence("late fee refund schedule", partial) < 0.6
+
+
+def test_save_and_load_round_trip(tmp_path):
+    _index().save(str(tmp_path))
+
+    loaded = BM25Index.load(str(tmp_path))
+
+    assert loaded.search("net 30", k=1)[0][0].id == "a"
+
+
+def test_sqlite_index_ranks_and_scores_like_the_in_memory_one(tmp_path):
+    index = _index()
+    index.save(str(tmp_path))
+
+    on_disk = SQLiteBM25Index.open(str(tmp_path))
+
+    assert len(on_disk) == 3
+    for query in ("late fee", "net 30 invoice", "contact details refund"):
+        expected = index.search(query, k=3)
+        hits = on_disk.search(query, k=3)
+        assert [(doc.id, doc.page_content) for doc, _ in hits] == [(doc.id, doc.page_content) for doc, _ in expected]
+        assert [round(score, 9) for _, score in hits] == [round(score, 9) for _, score in expected]
+        assert on_disk.confidence(query, hits[0][1]) == index.confidence(query, expected[0][1])
+
+
+def test_read_only_workers_query_lexical_sqlite(manager, monkeypatch):
+    from config.settings import settings
+    from src.core.vector_manager import POLICY_NAMESPACE, VectorManager
+    manager.add_documents([Document(page_content="A late fee of 2% applies.")], namespace=POLICY_NAMESPACE)
+
+    monkeypatch.setattr(settings, "VECTOR_STORE_READ_ONLY", True)
+    monkeypatch.setattr(VectorManager, "_instance", None)
+    reader = VectorManager()
+    docs, confidence = reader.lexical_search("late fee", namespace=POLICY_NAMESPACE)
+
+    assert isinstance(reader._get_lexical(POLICY_NAMESPACE), SQLiteBM25Index)
+    assert docs[0].page_content == "A late fee of 2% applies." and confidence > 0.85
+
+
+def test_reciprocal_rank_fusion_prefers_documents_in_both_lists():
+    a, b, c = (Document(id=i, page_content=i) for i in "abc")
+
+    merged = reciprocal_rank_fusion([[a, b], [c, b]])
+
+    assert merged[0].id == "b"
@@ -0,0 +1,81 @@
+import multiprocessing
+import time
+
+from src.common.file_lock import FileLock, ingest_lock
+
+WORKERS = 3
+
+
+def _boot_worker(data_dir: str, raw_dir: str, started, results) -> None:
+    """One uvicorn-like worker process: bootstraps and reports its role, states and index size."""
+    from pathlib import Path
+
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from config.settings import settings
+    from src.core.vector_manager import VectorManager, ARCHIVE_NAMESPACE
+    from src.services.bootstrap import BootstrapService
+    from src.services.readiness import ReadinessRegistry
+
+    settings.DATA_DIR = data_dir
+    settings.VECTOR_REFRESH_INTERVAL_SECONDS = 0
+    type(settings).RAW_DATA_DIR = property(lambda self: Path(raw_dir))
+    VectorManager._get_embedding_model = lambda self: DeterministicFakeEmbedding(size=16)
+
+    registry = ReadinessRegistry()
+    service = BootstrapService(registry)
+    started.put(True)
+    service.run()
+
+    manager = VectorManager()
+    manager.load_all()
+    results.put((service.role, {name: s["state"] for name, s in registry.snapshot().items()},
+                 manager._vectorstores[ARCHIVE_NAMESPACE].index.ntotal))
+
+
+def test_file_lock_is_exclusive_across_handles(tmp_path):
+    first, second = FileLock(tmp_path / "x.lock"), FileLock(tmp_path / "x.lock")
+    assert first.acquire(blocking=False)
+    assert not second.acquire(blocking=False)
+    assert not second.acquire(exclusive=False, blocking=False)
+    first.release()
+    assert second.acquire(blocking=False)
+    second.release()
+
+
+def test_workers_elect_one_leader_and_ingest_once(tmp_path, monkeypatch):
+    from config.settings import settings
+    from tests.conftest import LEDGER_CSV
+    from tests.test_artifact_store import LIBRARY_CSV
+
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "ledger_data.csv").write_text(LEDGER_CSV, encoding="utf-8")
+    (raw / "library_data.csv").write_text(LIBRARY_CSV, encoding="utf-8")
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(settings, "DATA_DIR", str(data_dir))
+
+    context = multiprocessing.get_context("spawn")
+    started, results = context.Queue(), context.Queue()
+    # Hold the lock until every worker is about to bootstrap, so they all contend for it
+    gate = ingest_lock()
+    gate.acquire()
+    workers = [context.Process(target=_boot_worker, args=(str(data_dir), str(raw), started, results))
+               for _ in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    try:
+        for _ in workers:
+            started.get(timeout=120)
+        time.sleep(0.5)
+    finally:
+        gate.release()
+
+    reports = [results.get(timeout=120) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=30)
+
+    roles = [role for role, _, _ in reports]
+    assert "leader" in roles
+    assert all(states == {"sql": "ready", "vector": "ready"} for _, states, _ in reports)
+    # One email in the library: a second ingesting worker would have appended it again
+    assert all(ntotal == 1 for _, _, ntotal in reports)
@@ -0,0 +1,140 @@
+import math
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+import src.services.rag_service as rag_module
+from config.settings import settings
+from src.core.vector_manager import POLICY_NAMESPACE
+from src.services.rag_service import RAGService
+
+
+@pytest.fixture
+def rag(manager, monkeypatch):
+    # Fake embeddings are random, so cosine cutoffs are only exercised in the dedicated tests
+    monkeypatch.setattr(settings, "RETRIEVAL_SCORE_THRESHOLD_ENABLED", False)
+    monkeypatch.setattr(rag_module, "vector_manager", manager)
+    manager.add_documents([Document(page_content="Invoices are paid on Net 30 terms.", metadata={"page": 1})],
+                          namespace=POLICY_NAMESPACE)
+    return RAGService()
+
+
+@pytest.fixture
+def count_embeddings(manager, monkeypatch):
+    calls = []
+    original = manager.embed_query
+    monkeypatch.setattr(manager, "embed_query", lambda text: calls.append(text) or original(text))
+    return calls
+
+
+def test_repeated_queries_hit_the_cache(rag, manager, monkeypatch):
+    monkeypatch.setattr(settings, "HYBRID_RETRIEVAL_ENABLED", False)
+    calls = []
+    original = manager.embed_query
+    monkeypatch.setattr(manager, "embed_query", lambda text: calls.append(text) or original(text))
+
+    first = rag.retrieve_policy_context("What are the payment terms?")
+    second = rag.retrieve_policy_context("  what are the PAYMENT terms ")
+
+    assert first == second
+    assert calls == ["what are the payment terms"]
+    assert rag._context_cache.stats()["hits"] == 1
+
+
+def test_index_change_invalidates_context_but_keeps_embeddings(rag, manager, monkeypatch):
+    monkeypatch.setattr(settings, "HYBRID_RETRIEVAL_ENABLED", False)
+    rag.retrieve_policy_context("late fees")
+    manager.add_documents([Document(page_content="Late fees are 2% per month.", metadata={"page": 2})],
+                          namespace=POLICY_NAMESPACE)
+
+    refreshed = rag.retrieve_policy_context("late fees")
+
+    assert "Late fees are 2% per month." in refreshed
+    assert rag._embedding_cache.stats()["hits"] == 1
+
+
+def test_exact_terms_take_the_lexical_fast_path(rag, count_embeddings):
+    context = rag.retrieve_policy_context("Net 30 terms?")
+
+    assert "Net 30" in context
+    assert count_embeddings == []
+
+
+def test_weak_lexical_match_falls_back_to_hybrid(rag, count_embeddings):
+    context = rag.retrieve_policy_context("When do you pay suppliers for invoices?")
+
+    assert "Net 30" in context
+    assert count_embeddings == ["when do you pay suppliers for invoices"]
+
+
+def test_off_topic_query_gets_short_no_policy_context(rag, monkeypatch):
+    monkeypatch.setattr(settings, "RETRIEVAL_SCORE_THRESHOLD_ENABLED", True)
+    monkeypatch.setattr(settings, "SIMILARITY_THRESHOLD", 0.8)
+
+    for hybrid in (False, True):
+        monkeypatch.setattr(settings, "HYBRID_RETRIEVAL_ENABLED", hybrid)
+        assert rag.retrieve_policy_context(f"Do you like football {hybrid}?") == rag_module.NO_POLICY_CONTEXT
+
+
+def test_chunks_above_threshold_are_returned(rag, manager, monkeypatch):
+    monkeypatch.setattr(settings, "RETRIEVAL_SCORE_THRESHOLD_ENABLED", True)
+    monkeypatch.setattr(settings, "HYBRID_RETRIEVAL_ENABLED", False)
+    monkeypatch.setattr(settings, "SIMILARITY_THRESHOLD", 0.8)
+
+    manager.add_documents([Document(page_content="late fees are 2% per month", metadata={"page": 2})],
+                          namespace=POLICY_NAMESPACE)
+
+    # The normalized query embeds to the same vector as the chunk (cosine 1.0)
+    context = rag.retrieve_policy_context("Late fees are 2% per month?")
+
+    assert "late fees are 2% per month" in context
+    assert "Net 30" not in context
+
+
+# Cosine of each chunk to QUERY, spread like text-embedding-3 scores
+QUERY = "what are the payment terms for invoices"
+CHUNK_SCORES = {
+    "Invoices are paid on Net 30 terms.": 0.52,
+    "Early settlement earns a 2% discount within 10 days.": 0.41,
+    "Payment terms for invoices of the staff canteen are set by facilities.": 0.18,
+}
+
+
+class ScoredEmbeddings(Embeddings):
+    """Unit vectors at a fixed cosine to QUERY (each chunk on its own orthogonal axis)."""
+
+    def embed_query(self, text):
+        if text == QUERY:
+            return [1.0, 0.0, 0.0, 0.0]
+        position = list(CHUNK_SCORES).index(text) + 1
+        vector = [CHUNK_SCORES[text], 0.0, 0.0, 0.0]
+        vector[position] = math.sqrt(1 - CHUNK_SCORES[text] ** 2)
+        return vector
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+
+def test_default_threshold_keeps_relevant_chunks_and_filters_lexical_hits(tmp_path, monkeypatch):
+    from src.core.vector_manager import VectorManager
+
+    monkeypatch.setattr(type(settings), "VECTOR_STORE_PATH", property(lambda self: str(tmp_path / "vectors")))
+    monkeypatch.setattr(type(settings), "EMBEDDING_CHECKPOINT_DIR", property(lambda self: str(tmp_path / "ckpt")))
+    monkeypatch.setattr(VectorManager, "_get_embedding_model", lambda self: ScoredEmbeddings())
+    monkeypatch.setattr(VectorManager, "_instance", None)
+    manager = VectorManager()
+    manager.add_documents([Document(page_content=text) for text in CHUNK_SCORES], namespace=POLICY_NAMESPACE)
+    monkeypatch.setattr(rag_module, "vector_manager", manager)
+    monkeypatch.setattr(settings, "RAG_COMPRESSION_ENABLED", False)
+    monkeypatch.setattr(settings, "LEXICAL_FAST_PATH_THRESHOLD", 1.1)  # always merge with the vector search
+
+    # Shipped default (config.yml), not a test override
+    assert settings.RETRIEVAL_SCORE_THRESHOLD_ENABLED and settings.SIMILARITY_THRESHOLD < 0.41
+
+    for hybrid in (False, True):
+        monkeypatch.setattr(settings, "HYBRID_RETRIEVAL_ENABLED", hybrid)
+        context = RAGService().retrieve_policy_context(QUERY)
+        assert "Net 30" in context and "Early settlement" in context
+        # The best BM25 match is unrelated to the query's meaning
+        assert "canteen" not in context
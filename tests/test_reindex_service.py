@@ -0,0 +1,73 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.services.data_loader as data_loader_module
+import src.services.reindex_service as reindex_module
+from config.settings import settings
+from src.core.vector_manager import ARCHIVE_NAMESPACE
+
+HEADER = "vendor_id,invoice_id,category,subject,item_name,summary,body,reply_text\n"
+
+
+def write_library(raw_dir, rows):
+    lines = [f"V1,INV-{i},General,Subject {i},Item,Summary {i},Body {i},Reply {i}\n" for i in range(rows)]
+    (raw_dir / "library_data.csv").write_text(HEADER + "".join(lines), encoding="utf-8")
+
+
+def wait(service, job_id, timeout=10):
+    deadline = time.time() + timeout
+    while service.get(job_id).status in ("queued", "running"):
+        assert time.time() < deadline
+        time.sleep(0.01)
+    return service.get(job_id)
+
+
+@pytest.fixture
+def raw_dir(manager, ledger_db, monkeypatch):
+    # Scratch SQL database too: ingest fingerprints live in ingest_state
+    raw = ledger_db[0].parent
+    monkeypatch.setattr(data_loader_module, "vector_manager", manager)
+    monkeypatch.setattr(reindex_module, "vector_manager", manager)
+    return raw
+
+
+def test_reindex_rebuilds_changed_sources_and_skips_unchanged(raw_dir, manager):
+    service = reindex_module.ReindexService()
+    write_library(raw_dir, 3)
+
+    first = wait(service, service.start(["library"]).job_id)
+    assert first.status == "succeeded" and first.completed == {"library": 3}
+
+    second = wait(service, service.start(["library"]).job_id)
+    assert second.skipped == ["library"]
+
+    # Replaced, not appended: the new generation holds only the current file
+    write_library(raw_dir, 5)
+    third = wait(service, service.start(["library"], force=True).job_id)
+    assert third.completed == {"library": 5}
+    assert manager._get_store(ARCHIVE_NAMESPACE).index.ntotal == 5
+
+
+def test_admin_endpoints_require_token(raw_dir, monkeypatch):
+    import src.web.server as server
+    client = TestClient(server.app)
+
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", None)
+    assert client.post("/admin/reindex", json={}).status_code == 503
+
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "secret")
+    assert client.post("/admin/reindex", json={}, headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.post("/admin/reindex", json={"sources": ["nope"]},
+                       headers={"X-Admin-Token": "secret"}).status_code == 400
+
+    service = reindex_module.ReindexService()
+    monkeypatch.setattr(server, "reindex_service", service)
+    write_library(raw_dir, 2)
+    response = client.post("/admin/reindex", json={"sources": ["library"]}, headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 202
+    assert wait(service, response.json()["job_id"]).status == "succeeded"
+
+    status = client.get(f"/admin/reindex/{response.json()['job_id']}", headers={"X-Admin-Token": "secret"})
+    assert status.json()["completed"] == {"library": 2}
@@ -0,0 +1,187 @@
+import pytest
+from langchain_core.documents import Document
+
+from config.settings import settings
+from src.core.vector_manager import POLICY_NAMESPACE, ARCHIVE_NAMESPACE
+
+
+def test_namespaces_are_isolated(manager):
+    manager.add_documents([Document(page_content="Net 30 payment terms", metadata={"source": "policy_document"})],
+                          namespace=POLICY_NAMESPACE)
+    manager.add_documents([Document(page_content="Invoice INV-1 status", metadata={"vendor_id": "V1"})],
+                          namespace=ARCHIVE_NAMESPACE)
+
+    docs = manager.get_retriever(k=4, namespace=POLICY_NAMESPACE).invoke("Invoice INV-1 status")
+
+    assert [d.page_content for d in docs] == ["Net 30 payment terms"]
+
+
+def test_vendor_archive_search_filters_by_vendor(manager):
+    manager.add_documents([
+        Document(page_content=f"email {i}", metadata={"vendor_id": "V1" if i % 2 else "V2"}) for i in range(6)
+    ], namespace=ARCHIVE_NAMESPACE)
+
+    docs = manager.search_vendor_archive("email", vendor_id="V1", k=10)
+
+    assert len(docs) == 3
+    assert {d.metadata["vendor_id"] for d in docs} == {"V1"}
+
+
+def test_empty_namespace_raises(manager):
+    with pytest.raises(RuntimeError):
+        manager.get_retriever(namespace=POLICY_NAMESPACE)
+
+
+def test_configured_index_factory_is_used(manager, monkeypatch):
+    import faiss
+    monkeypatch.setattr(settings, "VECTOR_INDEX_FACTORY", "HNSW16")
+
+    manager.add_documents([Document(page_content=f"policy {i}") for i in range(20)], namespace=POLICY_NAMESPACE)
+    docs = manager.get_retriever(k=2, namespace=POLICY_NAMESPACE).invoke("policy 3")
+
+    assert isinstance(faiss.downcast_index(manager._vectorstores[POLICY_NAMESPACE].index), faiss.IndexHNSWFlat)
+    assert len(docs) == 2
+
+
+def test_untrainable_factory_falls_back_to_flat(manager, monkeypatch):
+    import faiss
+    monkeypatch.setattr(settings, "VECTOR_INDEX_FACTORY", "IVF64,Flat")
+
+    manager.add_documents([Document(page_content="only a few docs")], namespace=POLICY_NAMESPACE)
+
+    assert isinstance(faiss.downcast_index(manager._vectorstores[POLICY_NAMESPACE].index), faiss.IndexFlat)
+
+
+def test_lazy_proxy_defers_loading(manager, monkeypatch):
+    from src.core.vector_manager import LazyVectorManager, VectorManager
+
+    created = []
+    monkeypatch.setattr(VectorManager, "_instance", None)
+    original_initialize = VectorManager._initialize
+    monkeypatch.setattr(VectorManager, "_initialize", lambda self: created.append(self) or original_initialize(self))
+
+    proxy = LazyVectorManager()
+    assert not proxy.is_loaded and created == []
+
+    assert proxy.has_documents(POLICY_NAMESPACE) is False
+    assert proxy.is_loaded and len(created) == 1
+
+
+def test_writes_swap_snapshots_without_mutating_readers(manager):
+    manager.add_documents([Document(page_content="Net 30 payment terms")], namespace=POLICY_NAMESPACE)
+    snapshot = manager._get_store(POLICY_NAMESPACE)
+
+    manager.add_documents([Document(page_content="Late fees are 2%")], namespace=POLICY_NAMESPACE)
+
+    assert snapshot.index.ntotal == 1
+    assert manager._get_store(POLICY_NAMESPACE).index.ntotal == 2
+
+
+def test_generations_are_published_and_pruned(manager, monkeypatch):
+    from src.core.vector_manager import VectorManager
+    monkeypatch.setattr(settings, "VECTOR_STORE_KEEP_GENERATIONS", 2)
+    for i in range(3):
+        manager.add_documents([Document(page_content=f"policy {i}")], namespace=POLICY_NAMESPACE)
+
+    namespace_path = manager._namespace_path(POLICY_NAMESPACE)
+    generations = sorted(p.name for p in namespace_path.glob("gen-*"))
+    assert len(generations) == 2
+    assert manager._current_generation(POLICY_NAMESPACE) == generations[-1]
+
+    # A second process (fresh manager) loads the published generation
+    monkeypatch.setattr(VectorManager, "_instance", None)
+    assert VectorManager()._get_store(POLICY_NAMESPACE).index.ntotal == 3
+
+
+def test_reset_keeps_in_flight_searches_working(manager):
+    manager.add_documents([Document(page_content="Net 30 payment terms")], namespace=POLICY_NAMESPACE)
+    snapshot = manager._get_store(POLICY_NAMESPACE)
+
+    manager.reset(POLICY_NAMESPACE)
+
+    assert snapshot.similarity_search("Net 30", k=1)[0].page_content == "Net 30 payment terms"
+    with pytest.raises(RuntimeError):
+        manager._get_store(POLICY_NAMESPACE)
+
+
+def test_reset_publishes_an_empty_generation_and_names_never_repeat(manager, monkeypatch):
+    from src.core.vector_manager import VectorManager
+    manager.add_documents([Document(page_content="Net 30 payment terms")], namespace=POLICY_NAMESPACE)
+    before = manager._current_generation(POLICY_NAMESPACE)
+    reader = manager._get_store(POLICY_NAMESPACE)
+
+    manager.reset(POLICY_NAMESPACE)
+    emptied = manager._current_generation(POLICY_NAMESPACE)
+    # The generation a reader loaded before the reset is still on disk for it
+    assert (manager._namespace_path(POLICY_NAMESPACE) / before / "index.faiss").exists()
+    manager.add_documents([Document(page_content="Net 45 payment terms")], namespace=POLICY_NAMESPACE)
+    after = manager._current_generation(POLICY_NAMESPACE)
+
+    assert len({before, emptied, after}) == 3 and sorted([before, emptied, after]) == [before, emptied, after]
+    assert reader.index.ntotal == 1
+
+    # Another process serving the live generation switches to the empty one on refresh
+    monkeypatch.setattr(VectorManager, "_instance", None)
+    other = VectorManager()
+    assert other.has_documents(POLICY_NAMESPACE)
+    manager.reset(POLICY_NAMESPACE)
+    assert other.refresh() == [POLICY_NAMESPACE] and not other.has_documents(POLICY_NAMESPACE)
+
+
+def test_concurrent_searches_during_ingest_never_fail(manager):
+    from concurrent.futures import ThreadPoolExecutor
+    manager.add_documents([Document(page_content="seed policy")], namespace=POLICY_NAMESPACE)
+    embedding = manager.embed_query("policy")
+    errors = []
+
+    def search(_):
+        try:
+            assert manager.search_by_vector(embedding, k=1, namespace=POLICY_NAMESPACE)
+        except Exception as e:
+            errors.append(e)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        searches = pool.map(search, range(200))
+        for i in range(5):
+            manager.add_documents([Document(page_content=f"policy {i}")], namespace=POLICY_NAMESPACE)
+        list(searches)
+
+    assert errors == []
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("VmRSS not found")
+
+
+@pytest.mark.skipif(not __import__("os").path.exists("/proc/self/status"), reason="needs /proc (Linux)")
+def test_read_only_load_maps_flat_codes_instead_of_copying(manager, tmp_path):
+    import faiss
+    import numpy as np
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+    from src.core.docstore import write_sqlite_docstore
+
+    # ~41 MB of float32 codes
+    vectors = np.random.default_rng(0).random((40000, 256), dtype=np.float32)
+    index = faiss.IndexFlatL2(256)
+    index.add(vectors)
+    ids = {i: str(i) for i in range(len(vectors))}
+    store = FAISS(embedding_function=manager._embeddings, index=index,
+                  docstore=InMemoryDocstore({i: Document(page_content=i) for i in ids.values()}),
+                  index_to_docstore_id=ids)
+    path = tmp_path / "ro_index"
+    store.save_local(str(path))
+    write_sqlite_docstore(store, str(path))
+    index_mb = (path / "index.faiss").stat().st_size / 2 ** 20
+    del store, index, vectors
+
+    before = _rss_mb()
+    loaded = manager._load_read_only(path)
+    grown = _rss_mb() - before
+
+    assert loaded.index.ntotal == 40000
+    assert grown < index_mb * 0.25, f"RSS grew {grown:.1f} MB for a {index_mb:.1f} MB index"